@@ -0,0 +1,181 @@
+"""
+Circuit breaker for calls to external services.
+
+When a dependency such as Bedrock or GitHub is down, retrying every call
+with backoff only delays the inevitable failure. A circuit breaker counts
+consecutive failures and, once a threshold is reached, rejects calls
+immediately for a cooldown period. After the cooldown a single trial call
+is let through; its success closes the circuit again, its failure re-opens
+it for another cooldown.
+
+States:
+    closed: Calls pass through; consecutive failures are counted
+    open: Calls are rejected without reaching the service
+    half_open: One trial call is allowed to probe for recovery
+
+Usage:
+    from terrafix.circuit_breaker import CircuitBreaker
+
+    breaker = CircuitBreaker("bedrock", failure_threshold=5, cooldown=60.0)
+
+    fix = breaker.call(generator.generate_fix, failure=failure, ...)
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Literal
+
+from terrafix.errors import TerraFixError
+from terrafix.logging_config import get_logger, log_with_context
+
+logger = get_logger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Thread-safe; one instance is meant to be shared by every caller of the
+    same service.
+
+    Attributes:
+        name: Service name used in logs and errors
+        failure_threshold: Consecutive failures that open the circuit
+        cooldown: Seconds the circuit stays open before a trial call
+        is_failure: Predicate deciding which exceptions count as failures
+        state: Current circuit state
+        failure_count: Consecutive failures seen while closed
+        opened_at: Monotonic time the circuit last opened
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        cooldown: float = 60.0,
+        is_failure: Callable[[Exception], bool] | None = None,
+    ) -> None:
+        """
+        Initialize circuit breaker in the closed state.
+
+        Args:
+            name: Service name used in logs and errors
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown: Seconds the circuit stays open before a trial call
+            is_failure: Predicate deciding which exceptions count towards
+                the threshold (default: every exception). Exceptions it
+                rejects are re-raised without affecting the circuit.
+        """
+        self.name: str = name
+        self.failure_threshold: int = failure_threshold
+        self.cooldown: float = cooldown
+        self.is_failure: Callable[[Exception], bool] = is_failure or (lambda _e: True)
+        self.state: CircuitState = "closed"
+        self.failure_count: int = 0
+        self.opened_at: float = 0.0
+        self._trial_in_progress: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    def call[T](self, fn: Callable[..., T], *args: object, **kwargs: object) -> T:
+        """
+        Invoke fn through the breaker.
+
+        Args:
+            fn: Function calling the protected service
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Whatever fn returns
+
+        Raises:
+            TerraFixError: Non-retryable, if the circuit is open
+            Exception: Anything raised by fn
+        """
+        self.before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if self.is_failure(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+        return result
+
+    def before_call(self) -> None:
+        """
+        Admit or reject a call according to the circuit state.
+
+        Raises:
+            TerraFixError: Non-retryable, if the circuit is open or a
+                half-open trial call is already in progress
+        """
+        with self._lock:
+            if self.state == "open":
+                remaining = self.cooldown - (time.monotonic() - self.opened_at)
+                if remaining > 0:
+                    raise self._open_error(remaining)
+                self.state = "half_open"
+                log_with_context(
+                    logger,
+                    "info",
+                    "Circuit half-open, sending trial call",
+                    service=self.name,
+                )
+
+            if self.state == "half_open":
+                if self._trial_in_progress:
+                    raise self._open_error(0.0)
+                self._trial_in_progress = True
+
+    def record_success(self) -> None:
+        """Close the circuit and clear the failure count."""
+        with self._lock:
+            if self.state != "closed":
+                log_with_context(
+                    logger,
+                    "info",
+                    "Circuit closed",
+                    service=self.name,
+                )
+            self.state = "closed"
+            self.failure_count = 0
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        with self._lock:
+            self._trial_in_progress = False
+            self.failure_count += 1
+            if self.state == "half_open" or self.failure_count >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                log_with_context(
+                    logger,
+                    "warning",
+                    "Circuit opened",
+                    service=self.name,
+                    consecutive_failures=self.failure_count,
+                    cooldown_seconds=self.cooldown,
+                )
+
+    def reset(self) -> None:
+        """Return the breaker to the closed state."""
+        with self._lock:
+            self.state = "closed"
+            self.failure_count = 0
+            self.opened_at = 0.0
+            self._trial_in_progress = False
+
+    def _open_error(self, retry_in: float) -> TerraFixError:
+        """Build the error raised for a rejected call."""
+        return TerraFixError(
+            f"{self.name} circuit open",
+            retryable=False,
+            context={"service": self.name, "retry_in_seconds": round(retry_in, 1)},
+        )
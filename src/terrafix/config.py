@@ -17,6 +17,7 @@ Environment Variables:
     SQLITE_PATH: SQLite database path (default: ./terrafix.db)
     GITHUB_REPO_MAPPING: JSON mapping of patterns to repos (optional)
     TERRAFORM_PATH: Path within repos to .tf files (default: .)
+    REPO_CACHE_DIR: Directory for cached repository mirrors (default: ./repo-cache)
     MAX_CONCURRENT_WORKERS: Max parallel processing (default: 3)
     LOG_LEVEL: Logging level (default: INFO)
     VANTA_BASE_URL: Vanta API base URL (default: https://api.vanta.com)
@@ -34,7 +35,7 @@ import os
 from functools import lru_cache
 from typing import ClassVar
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from terrafix.errors import ConfigurationError
@@ -54,6 +55,7 @@ class Settings(BaseSettings):
         github_token: GitHub personal access token (required)
         github_repo_mapping: Mapping of resource patterns to GitHub repos
         terraform_path: Path within repos to Terraform files
+        repo_cache_dir: Directory holding cached bare mirrors of repos
         aws_region: AWS region for Bedrock (required)
         bedrock_model_id: Claude model ID
         poll_interval_seconds: Polling interval in seconds
@@ -93,6 +95,10 @@ class Settings(BaseSettings):
         default=".",
         description="Path within repositories to Terraform files",
     )
+    repo_cache_dir: str = Field(
+        default="./repo-cache",
+        description="Directory for bare repository mirrors shared across clones",
+    )
 
     # AWS Configuration
     aws_region: str = Field(
@@ -135,6 +141,11 @@ class Settings(BaseSettings):
         description="Days to retain processed failure records",
     )
 
+    # Prefix lookup table derived from github_repo_mapping: the mapping it
+    # was built from, prefixes without "default", and distinct prefix
+    # lengths, longest first
+    _repo_index: tuple[dict[str, str], dict[str, str], list[int]] | None = PrivateAttr(default=None)
+
     @field_validator("vanta_api_token")
     @classmethod
     def validate_vanta_token(cls, v: str) -> str:
@@ -282,6 +293,11 @@ class Settings(BaseSettings):
         """
         Get GitHub repository for a given resource ARN.
 
+        The longest mapping key that is a prefix of the ARN wins, so an
+        exact ARN beats any shorter prefix; "default" is used when nothing
+        matches. Lookups probe one dictionary entry per distinct prefix
+        length rather than scanning every mapping.
+
         Args:
             resource_arn: AWS resource ARN
 
@@ -292,19 +308,34 @@ class Settings(BaseSettings):
             >>> settings.get_repo_for_resource("arn:aws:s3:::my-bucket")
             "myorg/terraform-aws"
         """
-        # Check for exact matches first
-        if resource_arn in self.github_repo_mapping:
-            return self.github_repo_mapping[resource_arn]
-
-        # Check for pattern matches (simple prefix matching)
-        for pattern, repo in self.github_repo_mapping.items():
-            if pattern != "default" and resource_arn.startswith(pattern):
-                return repo
+        prefixes, lengths = self._repo_prefix_index()
+        for length in lengths:
+            if length <= len(resource_arn):
+                repo = prefixes.get(resource_arn[:length])
+                if repo is not None:
+                    return repo
 
         # Return default if configured
         default_repo = self.github_repo_mapping.get("default")
         return default_repo if default_repo else None
 
+    def _repo_prefix_index(self) -> tuple[dict[str, str], list[int]]:
+        """
+        Return the prefix lookup table for get_repo_for_resource.
+
+        The table is built on first use and rebuilt whenever
+        github_repo_mapping is replaced.
+
+        Returns:
+            Tuple of (prefix to repository mapping, prefix lengths longest first)
+        """
+        mapping = self.github_repo_mapping
+        if self._repo_index is None or self._repo_index[0] is not mapping:
+            prefixes = {p: repo for p, repo in mapping.items() if p != "default"}
+            lengths = sorted({len(p) for p in prefixes}, reverse=True)
+            self._repo_index = (mapping, prefixes, lengths)
+        return self._repo_index[1], self._repo_index[2]
+
     def validate_boto3_credentials(self) -> None:
         """
         Validate that boto3 can load AWS credentials.
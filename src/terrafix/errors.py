@@ -77,10 +77,12 @@ class VantaApiError(TerraFixError):
     Attributes:
         status_code: HTTP status code from Vanta API
         response_body: Response body for debugging
+        retry_after: Seconds the server asked to wait before retrying
     """
 
     status_code: int | None
     response_body: str | None
+    retry_after: float | None
 
     def __init__(
         self,
@@ -88,6 +90,7 @@ class VantaApiError(TerraFixError):
         status_code: int | None = None,
         response_body: str | None = None,
         retryable: bool = True,
+        retry_after: float | None = None,
     ) -> None:
         """
         Initialize Vanta API error.
@@ -97,14 +100,17 @@ class VantaApiError(TerraFixError):
             status_code: HTTP status code from Vanta
             response_body: Raw response body for debugging
             retryable: Whether to retry (default True for API errors)
+            retry_after: Seconds from the Retry-After header, if any
         """
         context: Mapping[str, object] = {
             "status_code": status_code,
             "response_body": response_body[:500] if response_body else None,
+            "retry_after": retry_after,
         }
         super().__init__(message, retryable=retryable, context=context)
         self.status_code = status_code
         self.response_body = response_body
+        self.retry_after = retry_after
 
 
 class TerraformParseError(TerraFixError):
@@ -160,10 +166,14 @@ class BedrockError(TerraFixError):
     Attributes:
         error_code: AWS error code
         request_id: AWS request ID for debugging
+        status_code: HTTP status code of the failed call
+        retry_after: Seconds the service asked to wait before retrying
     """
 
     error_code: str | None
     request_id: str | None
+    status_code: int | None
+    retry_after: float | None
 
     def __init__(
         self,
@@ -171,6 +181,8 @@ class BedrockError(TerraFixError):
         error_code: str | None = None,
         request_id: str | None = None,
         retryable: bool = True,
+        status_code: int | None = None,
+        retry_after: float | None = None,
     ) -> None:
         """
         Initialize Bedrock error.
@@ -180,14 +192,20 @@ class BedrockError(TerraFixError):
             error_code: AWS error code (e.g., ThrottlingException)
             request_id: AWS request ID for support
             retryable: Whether to retry this error
+            status_code: HTTP status code of the failed call
+            retry_after: Seconds from the Retry-After header, if any
         """
         context: Mapping[str, object] = {
             "error_code": error_code,
             "request_id": request_id,
+            "status_code": status_code,
+            "retry_after": retry_after,
         }
         super().__init__(message, retryable=retryable, context=context)
         self.error_code = error_code
         self.request_id = request_id
+        self.status_code = status_code
+        self.retry_after = retry_after
 
 
 class GitHubError(TerraFixError):
@@ -205,11 +223,13 @@ class GitHubError(TerraFixError):
         status_code: HTTP status code
         rate_limit_remaining: Remaining API calls before rate limit
         rate_limit_reset: Unix timestamp when rate limit resets
+        retry_after: Seconds GitHub asked to wait before retrying
     """
 
     status_code: int | None
     rate_limit_remaining: int | None
     rate_limit_reset: int | None
+    retry_after: float | None
 
     def __init__(
         self,
@@ -218,6 +238,7 @@ class GitHubError(TerraFixError):
         rate_limit_remaining: int | None = None,
         rate_limit_reset: int | None = None,
         retryable: bool = True,
+        retry_after: float | None = None,
     ) -> None:
         """
         Initialize GitHub error.
@@ -228,16 +249,19 @@ class GitHubError(TerraFixError):
             rate_limit_remaining: Remaining API calls
             rate_limit_reset: Unix timestamp of rate limit reset
             retryable: Whether to retry (default True)
+            retry_after: Seconds to wait, from Retry-After or the rate limit reset
         """
         context: Mapping[str, object] = {
             "status_code": status_code,
             "rate_limit_remaining": rate_limit_remaining,
             "rate_limit_reset": rate_limit_reset,
+            "retry_after": retry_after,
         }
         super().__init__(message, retryable=retryable, context=context)
         self.status_code = status_code
         self.rate_limit_remaining = rate_limit_remaining
         self.rate_limit_reset = rate_limit_reset
+        self.retry_after = retry_after
 
 
 class StateStoreError(TerraFixError):
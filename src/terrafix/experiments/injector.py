@@ -218,7 +218,7 @@ class FailureInjector:
                 raise RedisConnectionError("Connection refused [injected failure]")
             return MagicMock()
 
-        with patch("redis.from_url") as mock_redis:
+        with patch("redis.Redis") as mock_redis:
             mock_client = MagicMock()
             mock_client.get.side_effect = redis_failure
             mock_client.set.side_effect = redis_failure
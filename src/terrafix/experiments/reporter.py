@@ -67,7 +67,7 @@ class ExperimentResult:
     latencies_ms: list[float] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     stage_timings: dict[str, list[float]] = field(default_factory=dict)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, object] = field(default_factory=dict)
 
     def record_generated(self) -> None:
         """Record that a failure was generated."""
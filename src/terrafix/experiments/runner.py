@@ -24,9 +24,10 @@ Usage:
 import asyncio
 import logging
 import time
-from typing import Any
+from collections.abc import Awaitable, Callable
 
 from terrafix.metrics import metrics_collector
+from terrafix.vanta_client import Failure
 
 from .generator import SyntheticFailureGenerator
 from .injector import FailureInjector
@@ -44,6 +45,7 @@ class ExperimentRunner:
     and result collection to execute various experiment types.
 
     Attributes:
+        seed: Random seed used for the generator and injector
         generator: Synthetic failure generator
         injector: Optional failure injector for resilience tests
 
@@ -65,6 +67,7 @@ class ExperimentRunner:
             seed: Random seed for reproducible experiments
             failure_rate: Failure injection rate (0.0 to 1.0)
         """
+        self.seed = seed
         self.generator = SyntheticFailureGenerator(seed=seed)
         self.injector = FailureInjector(failure_rate=failure_rate, seed=seed)
         self._mock_process_delay_ms = 100  # Simulated processing time
@@ -72,7 +75,8 @@ class ExperimentRunner:
     async def run_throughput_experiment(
         self,
         config: ProfileConfig,
-        process_callback: Any | None = None,
+        process_callback: Callable[[Failure], Awaitable[None]] | None = None,
+        reset_metrics: bool = True,
     ) -> ExperimentResult:
         """
         Run a throughput experiment.
@@ -84,6 +88,8 @@ class ExperimentRunner:
             config: Profile configuration for the experiment
             process_callback: Optional async callback to process failures
                 If None, uses mock processing
+            reset_metrics: Reset the global metrics collector before running.
+                Disable when several experiments run concurrently.
 
         Returns:
             ExperimentResult with throughput metrics
@@ -104,7 +110,8 @@ class ExperimentRunner:
         )
 
         # Reset metrics collector for clean measurement
-        metrics_collector.reset()
+        if reset_metrics:
+            metrics_collector.reset()
 
         try:
             async for failure in self.generator.generate_stream(config):
@@ -145,7 +152,7 @@ class ExperimentRunner:
         self,
         config: ProfileConfig,
         failure_rate: float = 0.2,
-        process_callback: Any | None = None,
+        process_callback: Callable[[Failure], Awaitable[None]] | None = None,
     ) -> ExperimentResult:
         """
         Run a resilience experiment.
@@ -226,7 +233,8 @@ class ExperimentRunner:
         Run scalability experiments across different repo sizes.
 
         Tests performance with varying repository sizes to
-        identify scaling characteristics.
+        identify scaling characteristics. Sizes run concurrently, so the
+        sweep takes as long as the slowest size rather than the sum.
 
         Args:
             repo_sizes: List of repo sizes to test (default: small, medium, large)
@@ -245,30 +253,41 @@ class ExperimentRunner:
                 failures_per_interval=5,
             )
 
-        results = []
-
-        for size in repo_sizes:
-            logger.info(f"Running scalability test with {size} repository")
-
-            config = ProfileConfig(
+        configs = [
+            ProfileConfig(
                 profile=base_config.profile,
                 duration_seconds=base_config.duration_seconds,
                 failures_per_interval=base_config.failures_per_interval,
                 interval_seconds=base_config.interval_seconds,
                 repo_size=size,
             )
+            for size in repo_sizes
+        ]
+
+        logger.info(f"Running scalability tests concurrently for sizes: {', '.join(repo_sizes)}")
 
-            result = await self.run_throughput_experiment(config)
+        # Sizes share no mutable state, so each gets its own runner and they
+        # run concurrently. The global metrics collector is reset once here
+        # rather than per run so concurrent runs don't clobber each other.
+        metrics_collector.reset()
+        runners = [ExperimentRunner(seed=self.seed) for _ in configs]
+        for runner in runners:
+            runner._mock_process_delay_ms = self._mock_process_delay_ms
+
+        results = await asyncio.gather(
+            *[
+                runner.run_throughput_experiment(config, reset_metrics=False)
+                for runner, config in zip(runners, configs, strict=True)
+            ]
+        )
+
+        for size, result in zip(repo_sizes, results, strict=True):
             result.experiment_type = "scalability"
             result.metadata["repo_size"] = size
-            results.append(result)
-
-            # Brief pause between size tests
-            await asyncio.sleep(1)
 
         return results
 
-    async def _mock_process(self, failure: Any) -> None:
+    async def _mock_process(self, failure: Failure) -> None:
         """
         Mock processing for experiments without real backend.
 
@@ -286,7 +305,7 @@ class ExperimentRunner:
 
     async def _mock_process_with_retries(
         self,
-        failure: Any,
+        failure: Failure,
         max_retries: int = 3,
     ) -> None:
         """
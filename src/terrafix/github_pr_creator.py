@@ -10,6 +10,10 @@ Usage:
 
     creator = GitHubPRCreator(github_token="ghp_...")
 
+    # The creator is meant to be long-lived: construct it once at startup
+    # and reuse it for every PR so the underlying HTTP connection pool
+    # (and its TLS sessions) is shared across requests.
+
     pr_url = creator.create_remediation_pr(
         repo_full_name="org/terraform-repo",
         file_path="terraform/s3.tf",
@@ -23,19 +27,32 @@ Usage:
 
 import hashlib
 import json
+import re
+import time
 
 from github import Github, GithubException
 from github.GithubException import UnknownObjectException
 from github.PullRequest import PullRequest
 from github.Repository import Repository
+from urllib3.util import Retry
 
 from terrafix.errors import GitHubError
 from terrafix.logging_config import get_logger, log_with_context
+from terrafix.rate_limiter import parse_retry_after
 from terrafix.remediation_generator import RemediationFix
 from terrafix.vanta_client import Failure
 
 logger = get_logger(__name__)
 
+# Connection pool size for the shared GitHub HTTP session
+GITHUB_POOL_SIZE = 20
+
+# Page size for paginated GitHub API listings (API maximum is 100)
+GITHUB_PER_PAGE = 100
+
+# Runs of whitespace, underscores, and slashes collapse to one dash in branch slugs
+_SLUG_RE = re.compile(r"[\s_/]+")
+
 
 class GitHubPRCreator:
     """
@@ -52,17 +69,30 @@ class GitHubPRCreator:
     gh_client: Github
     token: str
 
-    def __init__(self, github_token: str) -> None:
+    def __init__(self, github_token: str, *, gh_client: Github | None = None) -> None:
         """
         Initialize GitHub client.
 
+        PyGithub keeps a pooled HTTP session inside each Github instance, so
+        a single GitHubPRCreator should be created at startup and reused for
+        all PRs rather than constructed per remediation. A pre-built client
+        can be injected to share one session between several components.
+
         Args:
             github_token: GitHub PAT with repo scope
+            gh_client: Optional pre-configured PyGithub client to reuse
 
         Example:
             >>> creator = GitHubPRCreator(github_token="ghp_...")
+            >>> shared = Github("ghp_...", pool_size=20)
+            >>> creator = GitHubPRCreator(github_token="ghp_...", gh_client=shared)
         """
-        self.gh_client = Github(github_token)
+        self.gh_client = gh_client or Github(
+            github_token,
+            pool_size=GITHUB_POOL_SIZE,
+            per_page=GITHUB_PER_PAGE,
+            retry=Retry(total=3, backoff_factor=0.5),
+        )
         self.token = github_token
 
         log_with_context(
@@ -183,7 +213,7 @@ class GitHubPRCreator:
             file_content = repo.get_contents(file_path, ref=base_branch)
 
             # Commit updated file
-            commit_message = self._generate_commit_message(failure)
+            commit_message = failure.commit_message
 
             # Handle case where get_contents returns a list (directory) vs single file
             if isinstance(file_content, list):
@@ -218,7 +248,7 @@ class GitHubPRCreator:
 
         # Create Pull Request
         try:
-            pr_title = self._generate_pr_title(failure)
+            pr_title = failure.pr_title
             pr_body = self._generate_pr_body(failure, fix_metadata, file_path)
 
             pr = repo.create_pull(
@@ -246,6 +276,48 @@ class GitHubPRCreator:
             # Don't cleanup branch if PR creation fails - the branch has valid commits
             raise self._handle_github_exception(e, "create_pr") from e
 
+    def check_path_exists(
+        self,
+        repo_full_name: str,
+        path: str,
+        ref: str = "main",
+    ) -> bool:
+        """
+        Check whether a path exists in a repository without cloning it.
+
+        One contents API call, cheap enough to run before every checkout
+        so a misconfigured path fails before any git transfer.
+
+        Args:
+            repo_full_name: GitHub repo (owner/repo)
+            path: File or directory path within the repository
+            ref: Branch, tag or commit to look in (default: main)
+
+        Returns:
+            True if the path exists at ref, False if the repository or
+            path was not found
+
+        Raises:
+            GitHubError: If the GitHub API call fails otherwise
+
+        Example:
+            >>> creator.check_path_exists("org/repo", "infra/terraform")
+            True
+        """
+        path = path.strip("/").removeprefix("./")
+        if path in ("", "."):
+            return True
+
+        try:
+            repo = self.gh_client.get_repo(repo_full_name, lazy=True)
+            _ = repo.get_contents(path, ref=ref)
+        except UnknownObjectException:
+            return False
+        except GithubException as e:
+            raise self._handle_github_exception(e, "get_contents") from e
+
+        return True
+
     def _handle_github_exception(
         self,
         exception: GithubException,
@@ -266,10 +338,18 @@ class GitHubPRCreator:
         # Extract rate limit info if available
         rate_limit_remaining = None
         rate_limit_reset = None
+        retry_after = None
 
         if hasattr(exception, "headers") and exception.headers is not None:
             rate_limit_remaining = exception.headers.get("X-RateLimit-Remaining")
             rate_limit_reset = exception.headers.get("X-RateLimit-Reset")
+            retry_after = parse_retry_after(exception.headers.get("Retry-After"))
+
+        # GitHub reports an exhausted primary rate limit as 403 with no
+        # Retry-After; the reset timestamp says how long to wait instead
+        rate_limited = status_code == 429 or (status_code == 403 and rate_limit_remaining == "0")
+        if rate_limited and retry_after is None and rate_limit_reset:
+            retry_after = max(0.0, int(rate_limit_reset) - time.time())
 
         log_with_context(
             logger,
@@ -282,7 +362,7 @@ class GitHubPRCreator:
         )
 
         # Determine if error is retryable
-        retryable = status_code is None or status_code >= 500 or status_code == 429
+        retryable = status_code is None or status_code >= 500 or rate_limited
 
         return GitHubError(
             f"GitHub API error during {operation}: {exception}",
@@ -290,6 +370,7 @@ class GitHubPRCreator:
             rate_limit_remaining=int(rate_limit_remaining) if rate_limit_remaining else None,
             rate_limit_reset=int(rate_limit_reset) if rate_limit_reset else None,
             retryable=retryable,
+            retry_after=retry_after,
         )
 
     def _cleanup_branch(self, repo: Repository, branch_name: str) -> None:
@@ -378,60 +459,13 @@ class GitHubPRCreator:
         Example:
             >>> branch = creator._generate_branch_name(failure)
         """
-        test_slug = (
-            failure.test_name.lower().replace(" ", "-").replace("_", "-").replace("/", "-")[:50]
-        )
+        test_slug = _SLUG_RE.sub("-", failure.test_name.lower())[:50]
 
         # Add short hash for uniqueness
         hash_suffix = hashlib.md5(failure.test_id.encode()).hexdigest()[:8]
 
         return f"terrafix/{test_slug}-{hash_suffix}"
 
-    def _generate_commit_message(self, failure: Failure) -> str:
-        """
-        Generate conventional commit message.
-
-        Args:
-            failure: Vanta failure details
-
-        Returns:
-            Commit message following conventional commits format
-
-        Example:
-            >>> msg = creator._generate_commit_message(failure)
-        """
-        return f"""fix(compliance): {failure.test_name}
-
-Automated fix generated by TerraFix to address compliance failure.
-
-Test: {failure.test_name}
-Framework: {failure.framework}
-Severity: {failure.severity}
-Resource: {failure.resource_arn}
-
-This commit was automatically generated. Please review carefully
-before merging.
-"""
-
-    def _generate_pr_title(self, failure: Failure) -> str:
-        """
-        Generate concise PR title.
-
-        Args:
-            failure: Vanta failure details
-
-        Returns:
-            PR title with severity indicator
-        """
-        severity_emoji = {
-            "high": "🔴",
-            "medium": "🟡",
-            "low": "🟢",
-        }
-        emoji = severity_emoji.get(failure.severity, "⚪")
-
-        return f"{emoji} [TerraFix] {failure.test_name}"
-
     def _generate_pr_body(
         self,
         failure: Failure,
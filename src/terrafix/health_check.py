@@ -2,8 +2,9 @@
 Health check server for container orchestration.
 
 Provides HTTP endpoints for liveness and readiness probes used by ECS,
-Kubernetes, or other container orchestrators. The server runs in a
-background daemon thread to avoid blocking the main service loop.
+Kubernetes, or other container orchestrators. The server runs an asyncio
+event loop in a background daemon thread to avoid blocking the main
+service loop.
 
 Endpoints:
     GET /health - Basic liveness check (returns 200 if server is running)
@@ -33,122 +34,332 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
+import os
+import socket
 import threading
-from collections.abc import Callable
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import time
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
 from types import TracebackType
-from typing import ClassVar, cast, overload, override
+from typing import ClassVar, cast, overload
 
 from terrafix.logging_config import get_logger, log_with_context
+from terrafix.rate_limiter import RateLimitConfig, TokenBucketRateLimiter
+
+try:
+    from orjson import dumps as _dumps
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+
+    def _dumps(obj: object) -> bytes:  # type: ignore[misc]
+        """Serialize to UTF-8 JSON bytes with the stdlib encoder."""
+        return json.dumps(obj).encode("utf-8")
+
 
 logger = get_logger(__name__)
 
+# Default cap on health check requests per second before shedding with 429
+DEFAULT_MAX_REQUESTS_PER_SECOND = 50
+
+
+# Encoded "HTTP/1.1 <code> <reason>" status lines for every known status code
+_STATUS_LINES: dict[int, bytes] = {
+    status.value: f"HTTP/1.1 {status.value} {status.phrase}\r\n".encode("ascii")
+    for status in HTTPStatus
+}
+
+# Headers shared by every health check response, up to Content-Length
+_JSON_HEADERS = (
+    b"Content-Type: application/json\r\n"
+    b"Cache-Control: no-cache, no-store, must-revalidate\r\n"
+    b"Content-Length: "
+)
+
+
+def _build_response(status_code: int, body: dict[str, object]) -> bytes:
+    """
+    Build a complete HTTP response (status line, headers, and body) as bytes.
+
+    Used both to pre-serialize responses whose bodies never change and to
+    assemble dynamic responses, so every response goes out in one write.
+
+    Args:
+        status_code: HTTP status code
+        body: Dictionary to serialize as JSON response body
+
+    Returns:
+        Raw HTTP/1.1 response bytes ready to write to the socket
+    """
+    return _build_raw_response(status_code, _dumps(body))
+
 
-class HealthCheckHandler(BaseHTTPRequestHandler):
+def _build_raw_response(status_code: int, payload: bytes) -> bytes:
     """
-    HTTP request handler for health check endpoints.
+    Build a complete HTTP response around an already-encoded JSON body.
+
+    Args:
+        status_code: HTTP status code
+        payload: Encoded JSON response body
+
+    Returns:
+        Raw HTTP/1.1 response bytes ready to write to the socket
+    """
+    return b"%s%s%d\r\nConnection: close\r\n\r\n%s" % (
+        _STATUS_LINES[status_code],
+        _JSON_HEADERS,
+        len(payload),
+        payload,
+    )
+
+
+class HealthCheckHandler:
+    """
+    Asyncio stream handler for health check endpoints.
 
     Implements standard health check endpoints for container orchestration.
-    Uses class-level callbacks for readiness and status information.
+    Uses class-level callbacks for readiness and status information; each
+    HealthCheckServer configures its own subclass of this handler. One
+    instance is created per connection; probes are plain GETs with no body,
+    so the request line is parsed directly instead of through http.server.
 
     Class Attributes:
         readiness_check: Optional function returning True if service is ready
         status_provider: Optional function returning status dictionary
     """
 
-    # Class-level references to check functions (set by HealthCheckServer)
-    readiness_check: ClassVar[Callable[[HealthCheckHandler], bool] | None] = None
-    status_provider: ClassVar[Callable[[HealthCheckHandler], dict[str, object]] | None] = None
+    # Class-level references to check functions (set on per-server subclasses)
+    # Stored as staticmethods so instance access does not bind the handler
+    readiness_check: ClassVar[staticmethod[[], bool] | None] = None
+    status_provider: ClassVar[staticmethod[[], dict[str, object]] | None] = None
+
+    # Per-server request budget; requests beyond it get a 429
+    request_limiter: ClassVar[TokenBucketRateLimiter | None] = None
+
+    # Recent status_provider result shared across requests: (monotonic time, status)
+    _status_cache: ClassVar[tuple[float, dict[str, object]] | None] = None
+    _status_lock: ClassVar[threading.Lock] = threading.Lock()
+    _STATUS_TTL: ClassVar[float] = 0.5
 
-    def do_GET(self) -> None:
+    # Encoded /status body up to (not including) the closing brace
+    _STATUS_PREFIX: ClassVar[bytes] = b'{"status":"running"'
+
+    # Seconds to wait for a client to send its request headers
+    _READ_TIMEOUT: ClassVar[float] = 5.0
+
+    # Raised while reading headers from a client that disconnected, sent
+    # oversized headers, or stalled past _READ_TIMEOUT
+    _READ_ERRORS: ClassVar[tuple[type[Exception], ...]] = (
+        asyncio.IncompleteReadError,
+        asyncio.LimitOverrunError,
+        TimeoutError,
+    )
+
+    # Fully encoded responses for endpoints whose bodies never change
+    _RESP_HEALTHY: ClassVar[bytes] = _build_response(200, {"status": "healthy"})
+    _RESP_READY: ClassVar[bytes] = _build_response(200, {"status": "ready"})
+    _RESP_NOT_READY: ClassVar[bytes] = _build_response(503, {"status": "not ready"})
+    _RESP_RUNNING: ClassVar[bytes] = _build_response(200, {"status": "running"})
+    _RESP_NOT_FOUND: ClassVar[bytes] = _build_response(404, {"error": "not found"})
+    _RESP_TOO_MANY: ClassVar[bytes] = _build_response(429, {"error": "too many requests"})
+    _RESP_BAD_REQUEST: ClassVar[bytes] = _build_response(400, {"error": "bad request"})
+    _RESP_NOT_IMPLEMENTED: ClassVar[bytes] = _build_response(501, {"error": "unsupported method"})
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
         """
-        Handle GET requests to health check endpoints.
+        Bind the handler to one client connection.
+
+        Args:
+            reader: Stream the request is read from
+            writer: Stream the response is written to
+        """
+        self.reader: asyncio.StreamReader = reader
+        self.writer: asyncio.StreamWriter = writer
+
+    @classmethod
+    async def serve_connection(
+        cls,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """
+        Serve a single request on a new connection (asyncio.start_server callback).
+
+        Args:
+            reader: Stream the request is read from
+            writer: Stream the response is written to
+        """
+        await cls(reader, writer).handle()
+
+    async def handle(self) -> None:
+        """
+        Read one request, write its response, and close the connection.
+
+        Clients that disconnect or stall before finishing their headers
+        are dropped without a response.
+        """
+        try:
+            try:
+                head = await asyncio.wait_for(
+                    self.reader.readuntil(b"\r\n\r\n"),
+                    timeout=self._READ_TIMEOUT,
+                )
+            except self._READ_ERRORS:
+                return
+
+            response = await self._respond(head)
+            self.writer.write(response)
+            await self.writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.writer.close()
+
+    async def _respond(self, head: bytes) -> bytes:
+        """
+        Build the response for a raw request head.
+
+        Only GET is supported. Dispatches on the request path with a single
+        dict lookup. When the request budget is exhausted, a static 429 is
+        returned instead and no callbacks run. Liveness and readiness probes
+        are never shed, so a flood of other requests cannot get the task
+        restarted.
 
         Routes:
             /health - Always returns 200 if server is running (liveness)
             /ready  - Returns 200 if readiness_check passes, 503 otherwise
             /status - Returns detailed status JSON from status_provider
             *       - Returns 404 for unknown paths
+
+        Args:
+            head: Request line and headers, up to and including the blank line
+
+        Returns:
+            Complete HTTP response bytes
+        """
+        # Split off only the method and path; headers are never parsed
+        parts = head.split(b" ", 2)
+        if len(parts) != 3 or not parts[2].startswith(b"HTTP/"):
+            return self._RESP_BAD_REQUEST
+        method, path, _ = parts
+        if method != b"GET":
+            return self._RESP_NOT_IMPLEMENTED
+
+        limiter = self.request_limiter
+        if limiter is not None and path not in self._PROBE_PATHS and not limiter.try_acquire():
+            return self._RESP_TOO_MANY
+
+        route = self._ROUTES.get(path)
+        if route is None:
+            return self._RESP_NOT_FOUND
+        return await route(self)
+
+    async def _handle_health(self) -> bytes:
+        """Liveness probe: always healthy while the server is running."""
+        return self._RESP_HEALTHY
+
+    async def _handle_ready(self) -> bytes:
         """
-        if self.path == "/health":
-            self._send_json_response(200, {"status": "healthy"})
-
-        elif self.path == "/ready":
-            if self.readiness_check is not None:
-                try:
-                    is_ready = self.readiness_check()
-                    if is_ready:
-                        self._send_json_response(200, {"status": "ready"})
-                    else:
-                        self._send_json_response(503, {"status": "not ready"})
-                except Exception as e:
-                    self._send_json_response(
-                        503,
-                        {
-                            "status": "not ready",
-                            "error": str(e),
-                        },
-                    )
-            else:
-                # No readiness check configured, assume ready
-                self._send_json_response(200, {"status": "ready"})
-
-        elif self.path == "/status":
-            status: dict[str, object] = {"status": "running"}
-            if self.status_provider is not None:
-                try:
-                    additional_status = self.status_provider()
-                    status.update(additional_status)
-                except Exception as e:
-                    status["status_error"] = str(e)
-            self._send_json_response(200, status)
+        Readiness probe: 200 if readiness_check passes, 503 otherwise.
 
-        else:
-            self._send_json_response(404, {"error": "not found"})
+        The check runs in a worker thread so a slow check cannot stall
+        the event loop serving other probes.
+        """
+        if self.readiness_check is None:
+            # No readiness check configured, assume ready
+            return self._RESP_READY
 
-    def _send_json_response(
-        self,
-        status_code: int,
-        body: dict[str, object],
-    ) -> None:
+        try:
+            is_ready = await asyncio.to_thread(self.readiness_check)
+        except Exception as e:
+            return _build_response(
+                503,
+                {
+                    "status": "not ready",
+                    "error": str(e),
+                },
+            )
+
+        return self._RESP_READY if is_ready else self._RESP_NOT_READY
+
+    async def _handle_status(self) -> bytes:
         """
-        Send JSON response with appropriate headers.
+        Detailed status merged from status_provider.
 
-        Args:
-            status_code: HTTP status code
-            body: Dictionary to serialize as JSON response body
+        The provider runs in a worker thread so a slow provider cannot
+        stall the event loop serving other probes. Its result is encoded
+        on its own and spliced after the constant "status" member, so that
+        member is never re-encoded and no merged dict is built. Providers
+        that override "status" fall back to a regular merge.
         """
-        self.send_response(status_code)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-        self.end_headers()
-        _ = self.wfile.write(json.dumps(body).encode("utf-8"))
-
-    @override
-    def log_message(self, format: str, *args: object) -> None:
+        if self.status_provider is None:
+            return self._RESP_RUNNING
+
+        try:
+            additional_status = await asyncio.to_thread(self._get_cached_status)
+        except Exception as e:
+            return _build_response(200, {"status": "running", "status_error": str(e)})
+
+        if not additional_status:
+            return self._RESP_RUNNING
+        if "status" in additional_status:
+            return _build_response(200, {"status": "running", **additional_status})
+
+        # Replace the provider object's opening brace with the prefix and a comma
+        payload = b"%s,%s" % (self._STATUS_PREFIX, _dumps(additional_status)[1:])
+        return _build_raw_response(200, payload)
+
+    def _get_cached_status(self) -> dict[str, object]:
         """
-        Suppress default HTTP request logging.
+        Return status_provider output, reusing results younger than _STATUS_TTL.
 
-        Health check endpoints are called frequently by orchestrators,
-        which would create excessive log noise. Logging is suppressed
-        to keep logs focused on application events.
+        Orchestrators may poll /status many times per second; caching the
+        provider result briefly amortizes its cost across those requests.
+        The lock also ensures only one thread refreshes an expired entry.
+        Provider errors are not cached.
+
+        Returns:
+            Status dictionary from status_provider
         """
-        # Suppress default logging to avoid noise from frequent health checks
-        pass
+        provider = self.status_provider
+        if provider is None:
+            return {}
+
+        cls = type(self)
+        with cls._status_lock:
+            now = time.monotonic()
+            cached = cls._status_cache
+            if cached is not None and now - cached[0] < self._STATUS_TTL:
+                return cached[1]
+            additional_status = provider()
+            cls._status_cache = (now, additional_status)
+            return additional_status
+
+    # Orchestrator probe paths, exempt from the request budget
+    _PROBE_PATHS: ClassVar[frozenset[bytes]] = frozenset({b"/health", b"/ready"})
+
+    # Path -> handler dispatch table used by _respond
+    _ROUTES: ClassVar[dict[bytes, Callable[[HealthCheckHandler], Awaitable[bytes]]]] = {
+        b"/health": _handle_health,
+        b"/ready": _handle_ready,
+        b"/status": _handle_status,
+    }
 
 
 class HealthCheckServer:
     """
     Background HTTP server for health check endpoints.
 
-    Runs in a daemon thread so it doesn't prevent graceful shutdown.
-    The server is non-blocking and designed for minimal resource usage.
+    Runs an asyncio event loop in a daemon thread so it doesn't prevent
+    graceful shutdown. All connections share that one loop; readiness and
+    status callbacks run in worker threads, so a slow status_provider
+    cannot hold up liveness or readiness probes.
 
     Attributes:
         port: TCP port to listen on
-        server: HTTPServer instance
-        thread: Background thread running the server
+        socket: Listening socket, bound by start()
+        thread: Background thread running the event loop
     """
 
     @overload
@@ -157,6 +368,8 @@ class HealthCheckServer:
         port: int = 8080,
         readiness_check: None = None,
         status_provider: None = None,
+        max_requests_per_second: int | None = DEFAULT_MAX_REQUESTS_PER_SECOND,
+        affinity_cpu: int | None = None,
     ) -> None: ...
 
     @overload
@@ -165,6 +378,8 @@ class HealthCheckServer:
         port: int = 8080,
         readiness_check: Callable[[], bool] | None = None,
         status_provider: Callable[[], dict[str, object]] | None = None,
+        max_requests_per_second: int | None = DEFAULT_MAX_REQUESTS_PER_SECOND,
+        affinity_cpu: int | None = None,
     ) -> None: ...
 
     def __init__(
@@ -172,6 +387,8 @@ class HealthCheckServer:
         port: int = 8080,
         readiness_check: object | None = None,
         status_provider: object | None = None,
+        max_requests_per_second: int | None = DEFAULT_MAX_REQUESTS_PER_SECOND,
+        affinity_cpu: int | None = None,
     ) -> None:
         """
         Initialize health check server.
@@ -182,6 +399,14 @@ class HealthCheckServer:
             port: TCP port to listen on (default: 8080)
             readiness_check: Optional function returning True if service is ready
             status_provider: Optional function returning status dictionary
+            max_requests_per_second: Request budget shared by every path
+                except /health and /ready, with bursts up to twice this
+                rate. Excess requests get a 429 without invoking callbacks.
+                None disables the limit.
+            affinity_cpu: Optional CPU index to pin the server thread (and
+                the callback worker threads it spawns) to, keeping probe handling
+                off the cores running the main service. Linux only; leave
+                as None on single-core hosts.
 
         Example:
             >>> server = HealthCheckServer(
@@ -192,6 +417,7 @@ class HealthCheckServer:
             >>> server.start()
         """
         self.port: int = port
+        self.affinity_cpu: int | None = affinity_cpu
 
         if readiness_check is None:
             readiness_cb: Callable[[], bool] | None = None
@@ -212,38 +438,47 @@ class HealthCheckServer:
         self._readiness_check: Callable[[], bool] | None = readiness_cb
         self._status_provider: Callable[[], dict[str, object]] | None = status_cb
 
-        # Configure handler class with callbacks
-        # Note: These are stored as class attributes for access by handler instances
-        # The callables don't have 'self' since they're externally provided functions
-        # Assign callbacks for handler instances, wrapping to absorb the bound self
-        if readiness_cb is not None:
-
-            def _readiness_wrapper(_: HealthCheckHandler) -> bool:
-                return readiness_cb()
-
-            HealthCheckHandler.readiness_check = _readiness_wrapper
-        else:
-            HealthCheckHandler.readiness_check = None
-
-        if status_cb is not None:
-
-            def _status_wrapper(_: HealthCheckHandler) -> dict[str, object]:
-                return status_cb()
+        request_limiter = (
+            TokenBucketRateLimiter(
+                RateLimitConfig(
+                    requests_per_minute=max_requests_per_second * 60,
+                    burst_size=max_requests_per_second * 2,
+                )
+            )
+            if max_requests_per_second is not None
+            else None
+        )
 
-            HealthCheckHandler.status_provider = _status_wrapper
-        else:
-            HealthCheckHandler.status_provider = None
+        # Give this server its own handler subclass carrying its callbacks,
+        # limiter, and status cache, so several servers in one process never
+        # share state. staticmethod keeps the handler instance from being
+        # bound as an argument, so no wrapper is needed.
+        self._handler_cls: type[HealthCheckHandler] = type(
+            "ConfiguredHealthCheckHandler",
+            (HealthCheckHandler,),
+            {
+                "readiness_check": staticmethod(readiness_cb) if readiness_cb is not None else None,
+                "status_provider": staticmethod(status_cb) if status_cb is not None else None,
+                "request_limiter": request_limiter,
+                "_status_cache": None,
+                "_status_lock": threading.Lock(),
+            },
+        )
 
-        self.server: HTTPServer | None = None
+        self.socket: socket.socket | None = None
         self.thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._serve_task: asyncio.Task[None] | None = None
 
     def start(self) -> None:
         """
         Start health check server in background thread.
 
-        Creates an HTTPServer bound to all interfaces (0.0.0.0) on the
-        configured port. The server runs in a daemon thread that will
-        be terminated when the main process exits.
+        Binds a listening socket on all interfaces (0.0.0.0) at the
+        configured port, then serves it from an asyncio event loop in a
+        daemon thread that will be terminated when the main process exits.
+        Binding happens here rather than on the loop thread so that bind
+        failures surface to the caller.
 
         Raises:
             OSError: If the port is already in use
@@ -253,7 +488,13 @@ class HealthCheckServer:
             >>> # Server is now accepting connections
         """
         try:
-            self.server = HTTPServer(("0.0.0.0", self.port), HealthCheckHandler)
+            # SO_REUSEADDR (set by create_server) and SO_REUSEPORT let a
+            # restarted pod rebind the port while old connections sit in
+            # TIME_WAIT
+            self.socket = socket.create_server(
+                ("0.0.0.0", self.port),
+                reuse_port=hasattr(socket, "SO_REUSEPORT"),
+            )
         except OSError as e:
             log_with_context(
                 logger,
@@ -264,8 +505,10 @@ class HealthCheckServer:
             )
             raise
 
+        self._loop = asyncio.new_event_loop()
+        self._serve_task = self._loop.create_task(self._serve_async(self._handler_cls, self.socket))
         self.thread = threading.Thread(
-            target=self.server.serve_forever,
+            target=self._serve,
             name="health-check-server",
             daemon=True,  # Don't prevent shutdown
         )
@@ -279,19 +522,94 @@ class HealthCheckServer:
             endpoints=["/health", "/ready", "/status"],
         )
 
+    def _serve(self) -> None:
+        """
+        Run the event loop on the background thread until stop() is called.
+
+        Applies the configured CPU affinity first, from within the thread
+        itself, so every worker thread spawned afterwards inherits it.
+        """
+        if self.affinity_cpu is not None:
+            self._pin_to_cpu(self.affinity_cpu)
+
+        loop = self._loop
+        task = self._serve_task
+        assert loop is not None and task is not None
+
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    @staticmethod
+    async def _serve_async(handler_cls: type[HealthCheckHandler], sock: socket.socket) -> None:
+        """
+        Accept connections on the bound socket until cancelled.
+
+        asyncio enables TCP_NODELAY on accepted connections, so small
+        responses are sent immediately.
+
+        Args:
+            handler_cls: Handler class configured for this server
+            sock: Listening socket bound by start()
+        """
+        server = await asyncio.start_server(handler_cls.serve_connection, sock=sock)
+        async with server:
+            await server.serve_forever()
+
+    def _pin_to_cpu(self, cpu: int) -> None:
+        """
+        Restrict the calling thread to a single CPU.
+
+        Failures are logged and ignored; pinning is an optimization and
+        must never keep health probes from being served.
+
+        Args:
+            cpu: CPU index to pin the calling thread to
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            log_with_context(
+                logger,
+                "warning",
+                "CPU affinity not supported on this platform",
+                cpu=cpu,
+            )
+            return
+
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError as e:
+            log_with_context(
+                logger,
+                "warning",
+                "Failed to pin health check server thread",
+                cpu=cpu,
+                error=str(e),
+            )
+
     def stop(self) -> None:
         """
         Stop health check server gracefully.
 
-        Shuts down the HTTP server and waits for the background thread
-        to terminate. Safe to call multiple times or if server was
+        Cancels the serving task on the event loop and waits for the
+        background thread to terminate. Safe to call multiple times or if server was
         never started.
 
         Example:
             >>> server.stop()
         """
-        if self.server is not None:
-            self.server.shutdown()
+        loop = self._loop
+        task = self._serve_task
+        if loop is not None and task is not None:
+            # The loop may already be closed if serving failed
+            with contextlib.suppress(RuntimeError):
+                _ = loop.call_soon_threadsafe(task.cancel)
+        self._loop = None
+        self._serve_task = None
 
         if self.thread is not None:
             self.thread.join(timeout=5.0)
@@ -3,7 +3,7 @@ Structured logging configuration for TerraFix.
 
 This module provides structured JSON logging with correlation IDs for
 request tracing. All logs include standard fields (timestamp, level,
-logger, correlation_id) plus context-specific fields.
+logger, and correlation_id when one is set) plus context-specific fields.
 
 Log Format:
     {
@@ -41,14 +41,73 @@ import json
 import logging
 import sys
 import uuid
-from collections.abc import Callable
 from contextvars import ContextVar
 from datetime import UTC, datetime
 from types import TracebackType
-from typing import override
+from typing import BinaryIO, override
+
+try:
+    from orjson import OPT_NAIVE_UTC, OPT_UTC_Z
+    from orjson import dumps as _orjson_dumps
+
+    def _dumps(obj: object) -> bytes:
+        """Serialize a log entry with orjson (datetimes rendered as ISO 8601 with Z)."""
+        return _orjson_dumps(obj, default=str, option=OPT_UTC_Z | OPT_NAIVE_UTC)
+
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+
+    def _json_default(value: object) -> str:
+        """Render datetimes as ISO 8601 and anything else via str()."""
+        if isinstance(value, datetime):
+            return value.isoformat().replace("+00:00", "Z")
+        return str(value)
+
+    def _dumps(obj: object) -> bytes:
+        """Serialize a log entry with the stdlib encoder."""
+        return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+# Level names accepted by log_with_context, mapped to numeric levels
+_LEVELS: dict[str, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+# Standard LogRecord attributes excluded from the structured output
+_STANDARD_ATTRS: frozenset[str] = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "taskName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+    }
+)
 
 # Context variable for correlation ID that propagates through async/sync calls
 _correlation_id: ContextVar[str | None] = ContextVar("correlation_id", default=None)
+_get_correlation_id = _correlation_id.get
 
 
 class StructuredFormatter(logging.Formatter):
@@ -59,11 +118,14 @@ class StructuredFormatter(logging.Formatter):
     plus any extra fields from the LogRecord. This enables easy parsing
     and querying in log aggregation systems like CloudWatch Logs Insights.
 
+    Serialization uses orjson, which encodes the timestamp datetime
+    natively; values it cannot encode are rendered with str().
+
     Standard Fields:
-        - timestamp: ISO 8601 timestamp in UTC
+        - timestamp: ISO 8601 timestamp in UTC (Z suffix)
         - level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         - logger: Logger name (usually module path)
-        - correlation_id: Request correlation ID for tracing
+        - correlation_id: Request correlation ID for tracing (omitted when unset)
         - message: Human-readable log message
         - exc_info: Exception information if present
 
@@ -81,51 +143,102 @@ class StructuredFormatter(logging.Formatter):
         Returns:
             JSON string representation of log record
         """
-        # Build base log entry
+        return self.format_bytes(record).decode("utf-8")
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """
+        Format log record as UTF-8 encoded JSON.
+
+        Used by BytesStreamHandler to write the encoder's output directly
+        to a binary stream without a decode/re-encode round trip.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            UTF-8 JSON bytes for the log record (no trailing newline)
+        """
+        # Build base log entry. The timestamp comes from the record's own
+        # creation time rather than a fresh clock read at format time.
         log_entry: dict[str, object] = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, UTC),
             "level": record.levelname,
             "logger": record.name,
-            "correlation_id": _correlation_id.get(),
             "message": record.getMessage(),
         }
 
+        # Only emit correlation_id when one is set for this context
+        correlation_id = _get_correlation_id()
+        if correlation_id is not None:
+            log_entry["correlation_id"] = correlation_id
+
         # Add exception information if present
         if record.exc_info:
             log_entry["exc_info"] = self.formatException(record.exc_info)
 
-        # Add any extra fields from the record
-        # Skip standard LogRecord attributes to avoid duplication
-        standard_attrs = {
-            "name",
-            "msg",
-            "args",
-            "created",
-            "filename",
-            "funcName",
-            "levelname",
-            "levelno",
-            "lineno",
-            "module",
-            "msecs",
-            "message",
-            "pathname",
-            "process",
-            "processName",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-        }
+        # Add any extra fields from the record. The set difference runs in C
+        # and only yields keys that are not standard LogRecord attributes.
+        extras = record.__dict__
+        for key in extras.keys() - _STANDARD_ATTRS:
+            log_entry[key] = extras[key]
+
+        return _dumps(log_entry)
+
+
+class BytesStreamHandler(logging.Handler):
+    """
+    Handler that writes structured log lines straight to a binary stream.
+
+    logging.StreamHandler writes str to a text stream, so every JSON line
+    produced as bytes would be decoded and re-encoded by TextIOWrapper.
+    This handler writes the formatter's bytes plus a newline to the
+    underlying binary stream (sys.stdout.buffer by default) instead.
+
+    Attributes:
+        stream: Binary stream log lines are written to
+    """
+
+    terminator: bytes = b"\n"
+
+    def __init__(self, stream: BinaryIO | None = None) -> None:
+        """
+        Initialize the handler.
+
+        Args:
+            stream: Binary stream to write to (default: sys.stdout.buffer)
+        """
+        super().__init__()
+        self.stream: BinaryIO = stream if stream is not None else sys.stdout.buffer
+
+    @override
+    def flush(self) -> None:
+        """Flush the underlying stream."""
+        self.acquire()
+        try:
+            self.stream.flush()
+        finally:
+            self.release()
 
-        for key, value in record.__dict__.items():
-            record_value: object = value
-            if key not in standard_attrs and not key.startswith("_"):
-                log_entry[key] = record_value
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write a formatted record to the stream.
 
-        return json.dumps(log_entry)
+        Args:
+            record: Log record to emit
+        """
+        try:
+            formatter = self.formatter
+            if isinstance(formatter, StructuredFormatter):
+                data = formatter.format_bytes(record)
+            else:
+                data = self.format(record).encode("utf-8")
+            _ = self.stream.write(data + self.terminator)
+            self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging(log_level: str = "INFO") -> None:
@@ -149,8 +262,14 @@ def setup_logging(log_level: str = "INFO") -> None:
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    # Create console handler with structured formatter
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Create console handler with structured formatter, writing bytes
+    # directly to stdout's binary buffer when one is available
+    console_handler: logging.Handler
+    stdout_buffer: BinaryIO | None = getattr(sys.stdout, "buffer", None)
+    if stdout_buffer is not None:
+        console_handler = BytesStreamHandler(stdout_buffer)
+    else:
+        console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(StructuredFormatter())
 
@@ -256,10 +375,11 @@ def log_with_context(
 
     This is the recommended way to emit logs with context fields.
     Context fields are added to the log entry as top-level JSON fields.
+    Nothing is built when the logger is not enabled for the level.
 
     Args:
         logger: Logger instance
-        level: Log level (debug, info, warning, error, critical)
+        level: Log level (debug, info, warning, error, critical; any case)
         message: Human-readable log message
         **context: Additional context fields as keyword arguments
 
@@ -274,8 +394,14 @@ def log_with_context(
         ...     severity="high",
         ... )
     """
-    log_func: Callable[..., None] = getattr(logger, level.lower())
-    log_func(message, extra=dict(context))
+    lvl = _LEVELS.get(level)
+    if lvl is None:
+        lvl = _LEVELS[level.lower()]
+    # Skip building the record entirely when the level is filtered out.
+    # context is already a fresh dict owned by this call, so it is passed
+    # as extra without copying.
+    if logger.isEnabledFor(lvl):
+        logger._log(lvl, message, (), extra=context)
 
 
 class LogContext:
@@ -15,6 +15,10 @@ Usage:
     metrics_collector.increment("failures_processed_total")
     metrics_collector.increment("api_errors_total", labels={"service": "bedrock"})
 
+    # Precompute fixed labels once for hot call sites
+    BEDROCK = metrics_collector.label_set({"service": "bedrock"})
+    metrics_collector.increment("api_errors_total", labels=BEDROCK)
+
     # Set gauges
     metrics_collector.set_gauge("queue_depth", 5)
     metrics_collector.set_gauge("active_workers", 3)
@@ -24,6 +28,11 @@ Usage:
         # ... do work ...
         pass
 
+    # Or, for small hot regions, without allocating a Timer
+    token = metrics_collector.time_start()
+    # ... do work ...
+    metrics_collector.time_stop(StageTimer.BEDROCK_INFERENCE, token)
+
     # Get all metrics as JSON
     metrics = metrics_collector.get_metrics()
 """
@@ -33,11 +42,22 @@ from __future__ import annotations
 import statistics
 import threading
 import time
-from collections import defaultdict
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
 from types import TracebackType
-from typing import Any
+from typing import Any, ClassVar, Final
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; summaries fall back to sorting
+    np = None  # type: ignore[assignment]
+
+# Canonical (sorted) label pairs; see MetricsCollector.label_set
+LabelSet = tuple[tuple[str, str], ...]
 
 
 class StageTimer(str, Enum):
@@ -73,9 +93,13 @@ class Timer:
     Tracks start and end times, automatically recording duration
     to the metrics collector when the context exits.
 
+    Times are taken with time.perf_counter_ns(), so the hot path does
+    integer arithmetic only; seconds are derived on demand.
+
     Attributes:
         name: Name of the timer (usually a StageTimer value)
-        start_time: Unix timestamp when timer started
+        start_time: perf_counter_ns() reading when the timer started
+        duration_ns: Measured duration in nanoseconds
         collector: Reference to MetricsCollector for recording
 
     Example:
@@ -85,11 +109,13 @@ class Timer:
         >>> print(f"Took {timer.duration}s")
     """
 
+    __slots__ = ("collector", "duration_ns", "labels", "name", "start_time")
+
     def __init__(
         self,
         name: str,
         collector: MetricsCollector,
-        labels: dict[str, str] | None = None,
+        labels: dict[str, str] | LabelSet | None = None,
     ) -> None:
         """
         Initialize timer.
@@ -101,13 +127,18 @@ class Timer:
         """
         self.name: str = name
         self.collector: MetricsCollector = collector
-        self.labels: dict[str, str] = labels or {}
-        self.start_time: float = 0.0
-        self.duration: float = 0.0
+        self.labels: dict[str, str] | LabelSet = labels or {}
+        self.start_time: int = 0
+        self.duration_ns: int = 0
+
+    @property
+    def duration(self) -> float:
+        """Measured duration in seconds."""
+        return self.duration_ns / _NS_PER_SECOND
 
     def __enter__(self) -> Timer:
         """Start the timer."""
-        self.start_time = time.perf_counter()
+        self.start_time = time.perf_counter_ns()
         return self
 
     def __exit__(
@@ -126,11 +157,323 @@ class Timer:
         Returns:
             Duration in seconds
         """
-        self.duration = time.perf_counter() - self.start_time
-        self.collector._record_timing(self.name, self.duration, self.labels)
+        self.duration_ns = time.perf_counter_ns() - self.start_time
+        self.collector._record_timing(self.name, self.duration_ns, self.labels)
         return self.duration
 
 
+class _ReadWriteLock:
+    """
+    Lock allowing many concurrent readers or a single writer.
+
+    Waiting writers block new readers, so a steady stream of metric
+    reads cannot starve updates.
+    """
+
+    __slots__ = ("_cond", "_readers", "_writer", "_writers_waiting")
+
+    def __init__(self) -> None:
+        """Initialize an unlocked lock."""
+        self._cond: threading.Condition = threading.Condition(threading.Lock())
+        self._readers: int = 0
+        self._writer: bool = False
+        self._writers_waiting: int = 0
+
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        """Hold the lock shared with other readers for the duration of the block."""
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                _ = self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """Hold the lock exclusively for the duration of the block."""
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                _ = self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+# Timing samples retained per timer; a power of two so wraparound is a mask
+_TIMING_WINDOW = 1024
+
+# Timings are recorded in integer nanoseconds and reported in seconds
+_NS_PER_SECOND = 1e9
+
+
+@dataclass(frozen=True, slots=True)
+class _TimingSummary:
+    """
+    Summary statistics over a timer's retained samples, in seconds.
+
+    Attributes:
+        count: Number of samples
+        min: Smallest sample
+        max: Largest sample
+        mean: Arithmetic mean
+        p50: 50th percentile
+        p95: 95th percentile
+        p99: 99th percentile
+    """
+
+    count: int
+    min: float
+    max: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+
+    def to_dict(self, suffix: str = "") -> dict[str, float]:
+        """
+        Format the summary for output.
+
+        Args:
+            suffix: Appended to every key except count (e.g. "_seconds")
+
+        Returns:
+            Dictionary with count, min, max, mean, p50, p95, p99
+        """
+        return {
+            "count": self.count,
+            f"min{suffix}": self.min,
+            f"max{suffix}": self.max,
+            f"mean{suffix}": self.mean,
+            f"p50{suffix}": self.p50,
+            f"p95{suffix}": self.p95,
+            f"p99{suffix}": self.p99,
+        }
+
+
+def _percentile_index(count: int, percentile: int) -> int:
+    """
+    Return the index of a percentile within count sorted values.
+
+    Args:
+        count: Number of values (must be positive)
+        percentile: Percentile to locate (0-100)
+
+    Returns:
+        Index of the percentile value
+    """
+    return min(int(count * percentile / 100), count - 1)
+
+
+# p50/p95/p99 indices for a full timing window, which is the steady state
+_FULL_WINDOW_INDICES: tuple[int, int, int] = (
+    _percentile_index(_TIMING_WINDOW, 50),
+    _percentile_index(_TIMING_WINDOW, 95),
+    _percentile_index(_TIMING_WINDOW, 99),
+)
+
+
+def _summarize(samples: array[int], count: int) -> _TimingSummary | None:
+    """
+    Summarize the first count nanosecond samples, converted to seconds.
+
+    Uses NumPy when available: a single partition (O(n)) locates all
+    percentiles and min/max/mean run as vectorized reductions.
+    Otherwise the samples are sorted once.
+
+    Args:
+        samples: Nanosecond samples
+        count: Number of leading samples to summarize
+
+    Returns:
+        Summary statistics, or None if count is zero
+    """
+    if not count:
+        return None
+    if count == _TIMING_WINDOW:
+        i50, i95, i99 = _FULL_WINDOW_INDICES
+    else:
+        i50 = _percentile_index(count, 50)
+        i95 = _percentile_index(count, 95)
+        i99 = _percentile_index(count, 99)
+
+    if np is not None:
+        values = np.frombuffer(samples, dtype=np.int64, count=count)
+        ranked = np.partition(values, (i50, i95, i99))
+        return _TimingSummary(
+            count=count,
+            min=int(values.min()) / _NS_PER_SECOND,
+            max=int(values.max()) / _NS_PER_SECOND,
+            mean=float(values.mean()) / _NS_PER_SECOND,
+            p50=int(ranked[i50]) / _NS_PER_SECOND,
+            p95=int(ranked[i95]) / _NS_PER_SECOND,
+            p99=int(ranked[i99]) / _NS_PER_SECOND,
+        )
+
+    ordered = sorted(samples[:count])
+    return _TimingSummary(
+        count=count,
+        min=ordered[0] / _NS_PER_SECOND,
+        max=ordered[-1] / _NS_PER_SECOND,
+        mean=statistics.fmean(ordered) / _NS_PER_SECOND,
+        p50=ordered[i50] / _NS_PER_SECOND,
+        p95=ordered[i95] / _NS_PER_SECOND,
+        p99=ordered[i99] / _NS_PER_SECOND,
+    )
+
+
+class _TimingRing:
+    """
+    Fixed-size ring buffer of the most recent timing samples, in nanoseconds.
+
+    Recording overwrites the oldest sample in place, so it never allocates
+    or copies once the buffer exists. The summary is cached until the next
+    recording, so repeated scrapes of an idle timer do no work.
+
+    All methods must be called with the owning shard's lock held (the
+    write lock for record, either lock otherwise).
+    """
+
+    __slots__ = ("_summary", "filled", "generation", "index", "samples")
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self.samples: array[int] = array("q", bytes(8 * _TIMING_WINDOW))
+        self.index: int = 0
+        self.filled: bool = False
+        self.generation: int = 0
+        self._summary: _TimingSummary | None = None
+
+    def record(self, duration_ns: int) -> None:
+        """
+        Store a sample, overwriting the oldest once the buffer is full.
+
+        Args:
+            duration_ns: Duration in nanoseconds
+        """
+        self.samples[self.index] = duration_ns
+        self.index = (self.index + 1) & (_TIMING_WINDOW - 1)
+        self.filled |= self.index == 0
+        self.generation += 1
+        self._summary = None
+
+    def summary(self) -> _TimingSummary | None:
+        """
+        Return the summary of the retained samples, computing it if needed.
+
+        Returns:
+            Summary statistics, or None if nothing has been recorded
+        """
+        cached = self._summary
+        if cached is None:
+            count = _TIMING_WINDOW if self.filled else self.index
+            cached = self._summary = _summarize(self.samples, count)
+        return cached
+
+    def cached_summary(self) -> _TimingSummary | None:
+        """
+        Return the cached summary without computing one.
+
+        Returns:
+            Summary from before the latest recording, or None if stale
+        """
+        return self._summary
+
+    def copy_samples(self) -> array[int]:
+        """
+        Copy the retained samples so they can be summarized without the lock.
+
+        Returns:
+            Copy of the recorded samples
+        """
+        return self.samples[: _TIMING_WINDOW if self.filled else self.index]
+
+    def store_summary(self, summary: _TimingSummary | None, generation: int) -> None:
+        """
+        Cache a summary computed from copy_samples().
+
+        Ignored if samples were recorded after the copy was taken.
+
+        Args:
+            summary: Summary computed from the copied samples
+            generation: The ring's generation when the samples were copied
+        """
+        if generation == self.generation:
+            self._summary = summary
+
+
+# (name, sorted labels) identifying one metric series
+_MetricKey = tuple[str, LabelSet]
+
+# Number of independently locked shards; must be a power of two
+_SHARD_COUNT = 16
+
+# Label sets interned per metric name, and label strings cached for output;
+# past these, keys and strings are built per call instead of cached
+_KEY_CACHE_SIZE = 1024
+_LABEL_STR_CACHE_SIZE = 4096
+
+
+@dataclass(slots=True)
+class _MetricEntry:
+    """
+    Gauge and timing state for one metric key.
+
+    Attributes:
+        gauge: Current gauge value, or None if never set
+        timing: Recent timing samples, or None if never timed
+    """
+
+    gauge: float | None = None
+    timing: _TimingRing | None = None
+
+
+class _Shard:
+    """
+    One stripe of the collector's gauges and timings, with its own lock.
+
+    Each metric key always maps to the same shard, so updates to keys in
+    different shards never contend. A key's gauge and timing state share
+    one entry, so each update is a single lookup and a scrape walks one
+    dict per shard.
+    """
+
+    __slots__ = ("entries", "rwlock")
+
+    def __init__(self) -> None:
+        """Initialize an empty shard."""
+        self.entries: dict[_MetricKey, _MetricEntry] = {}
+        self.rwlock: _ReadWriteLock = _ReadWriteLock()
+
+    def entry(self, key: _MetricKey) -> _MetricEntry:
+        """
+        Return the entry for a key, creating it if needed.
+
+        Must be called with the write lock held.
+
+        Args:
+            key: (name, labels_tuple) metric key
+
+        Returns:
+            Entry for the key
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = _MetricEntry()
+        return entry
+
+
 class MetricsCollector:
     """
     Thread-safe metrics collector for TerraFix observability.
@@ -143,19 +486,42 @@ class MetricsCollector:
     The collector uses a singleton pattern to ensure all components
     share the same metrics state.
 
+    Gauges and timings are striped across shards by key hash. Each shard
+    holds the metrics for its keys under its own reader/writer lock, so
+    writers only contend with others touching the same shard and a scrape
+    locks one shard at a time.
+
+    Counters are accumulated per thread, in a dict only that thread
+    writes, so increments take no lock at all. Reads sum every thread's
+    counts; counts from threads that have exited are folded into
+    _retired_counts on scrape so their dicts can be dropped.
+
     Attributes:
-        _counters: Counter values keyed by (name, labels_tuple)
-        _gauges: Gauge values keyed by (name, labels_tuple)
-        _timings: List of timing values keyed by (name, labels_tuple)
-        _lock: Threading lock for thread-safe access
-        _start_time: When the collector was initialized
+        _shards: Gauge and timing shards, indexed by hash of (name, labels_tuple)
+        _local: Thread-local holder of each thread's counter dict
+        _thread_counts: (thread, counts) for every thread that has incremented
+        _retired_counts: Counts from threads that have exited
+        _counts_lock: Lock guarding _thread_counts and _retired_counts
+        _label_str_cache: Formatted "k=v,..." strings keyed by label set
+        _key_cache: Interned metric keys by name, then label set
+        _snapshot: Cached counters/gauges/timings sections of get_metrics
+        _dirty: Whether any metric changed since _snapshot was built
+        _start_time: time.monotonic() reading when the collector was (re)started
     """
 
-    _instance: MetricsCollector | None = None
-    _lock_class: threading.Lock = threading.Lock()
+    _instance: ClassVar[MetricsCollector | None] = None
+    _lock_class: ClassVar[threading.Lock] = threading.Lock()
 
     def __new__(cls) -> MetricsCollector:
-        """Singleton pattern implementation."""
+        """
+        Singleton pattern implementation.
+
+        Uses double-checked locking: once the instance exists it is
+        returned without taking the class lock.
+        """
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock_class:
             if cls._instance is None:
                 cls._instance = super().__new__(cls)
@@ -168,34 +534,98 @@ class MetricsCollector:
         if getattr(self, "_initialized", False):
             return
 
-        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], int] = defaultdict(int)
-        self._gauges: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
-        self._timings: dict[tuple[str, tuple[tuple[str, str], ...]], list[float]] = defaultdict(
-            list
-        )
-        self._lock: threading.Lock = threading.Lock()
-        self._start_time: datetime = datetime.now(UTC)
+        self._shards: tuple[_Shard, ...] = tuple(_Shard() for _ in range(_SHARD_COUNT))
+        self._local: threading.local = threading.local()
+        self._thread_counts: list[tuple[threading.Thread, dict[_MetricKey, int]]] = []
+        self._retired_counts: dict[_MetricKey, int] = {}
+        self._counts_lock: threading.Lock = threading.Lock()
+        self._label_str_cache: dict[LabelSet, str] = {}
+        self._key_cache: dict[str, dict[LabelSet, _MetricKey]] = {}
+        self._snapshot: dict[str, Any] | None = None
+        self._dirty: bool = True
+        self._start_time: float = time.monotonic()
         self._initialized: bool = True
 
-    def _labels_to_tuple(self, labels: dict[str, str] | None) -> tuple[tuple[str, str], ...]:
+    @staticmethod
+    def label_set(labels: dict[str, str]) -> LabelSet:
+        """
+        Canonicalize labels once for reuse across metric calls.
+
+        Every metric method accepts the result in place of a labels dict,
+        skipping the per-call sort. Hot call sites with fixed labels can
+        compute it once at module load.
+
+        Args:
+            labels: Labels dictionary
+
+        Returns:
+            Sorted tuple of (key, value) pairs
+
+        Example:
+            >>> BEDROCK = MetricsCollector.label_set({"service": "bedrock"})
+            >>> metrics_collector.increment("api_errors_total", labels=BEDROCK)
+        """
+        return tuple(sorted(labels.items()))
+
+    def _labels_to_tuple(self, labels: dict[str, str] | LabelSet | None) -> LabelSet:
         """
-        Convert labels dict to hashable tuple.
+        Convert labels to a hashable tuple.
 
         Args:
-            labels: Labels dictionary or None
+            labels: Labels dictionary, LabelSet from label_set(), or None
 
         Returns:
             Sorted tuple of (key, value) pairs
         """
         if not labels:
             return ()
+        if isinstance(labels, tuple):
+            return labels
         return tuple(sorted(labels.items()))
 
+    def _key(self, name: str, labels: dict[str, str] | LabelSet | None) -> _MetricKey:
+        """
+        Return the interned (name, labels_tuple) key for a metric.
+
+        Keys are cached per name and label set, so repeated calls return
+        the same tuple instead of allocating a new one. Once a name has
+        _KEY_CACHE_SIZE label sets cached, new ones are not cached.
+
+        Args:
+            name: Metric name
+            labels: Labels dictionary, LabelSet, or None
+
+        Returns:
+            Metric key
+        """
+        labels_tuple = self._labels_to_tuple(labels)
+        by_labels = self._key_cache.get(name)
+        if by_labels is None:
+            by_labels = self._key_cache.setdefault(name, {})
+        key = by_labels.get(labels_tuple)
+        if key is None:
+            if len(by_labels) >= _KEY_CACHE_SIZE:
+                return (name, labels_tuple)
+            key = by_labels.setdefault(labels_tuple, (name, labels_tuple))
+        return key
+
+    def _shard_for(self, key: _MetricKey) -> _Shard:
+        """
+        Return the shard holding a metric key.
+
+        Args:
+            key: (name, labels_tuple) metric key
+
+        Returns:
+            Shard the key belongs to
+        """
+        return self._shards[hash(key) & (_SHARD_COUNT - 1)]
+
     def increment(
         self,
         name: str,
         value: int = 1,
-        labels: dict[str, str] | None = None,
+        labels: dict[str, str] | LabelSet | None = None,
     ) -> None:
         """
         Increment a counter metric.
@@ -203,23 +633,70 @@ class MetricsCollector:
         Counters are monotonically increasing values used for totals
         like processed failures, errors, or PRs created.
 
+        Increments update the calling thread's own counts without locking;
+        only a thread's first increment takes a lock, to register its dict.
+
         Args:
             name: Counter name (e.g., "failures_processed_total")
             value: Amount to increment (default: 1)
-            labels: Optional labels (e.g., {"service": "vanta"})
+            labels: Optional labels (e.g., {"service": "vanta"}) or LabelSet
 
         Example:
             >>> metrics_collector.increment("api_errors_total", labels={"service": "bedrock"})
         """
-        key = (name, self._labels_to_tuple(labels))
-        with self._lock:
-            self._counters[key] += value
+        key = self._key(name, labels)
+        try:
+            counts: dict[_MetricKey, int] = self._local.counts
+        except AttributeError:
+            counts = self._register_thread_counts()
+        counts[key] = counts.get(key, 0) + value
+        self._dirty = True
+
+    def _register_thread_counts(self) -> dict[_MetricKey, int]:
+        """
+        Create and register the calling thread's counter dict.
+
+        Returns:
+            Counter dict for the calling thread
+        """
+        counts: dict[_MetricKey, int] = {}
+        with self._counts_lock:
+            self._thread_counts.append((threading.current_thread(), counts))
+        self._local.counts = counts
+        return counts
+
+    def _counter_totals(self) -> dict[_MetricKey, int]:
+        """
+        Sum counter values across all threads.
+
+        Also retires the dicts of threads that have exited, folding their
+        counts into _retired_counts.
+
+        Returns:
+            Total value per counter key
+        """
+        with self._counts_lock:
+            live: list[tuple[threading.Thread, dict[_MetricKey, int]]] = []
+            for thread, counts in self._thread_counts:
+                if thread.is_alive():
+                    live.append((thread, counts))
+                    continue
+                for key, value in counts.items():
+                    self._retired_counts[key] = self._retired_counts.get(key, 0) + value
+            self._thread_counts = live
+
+            totals = dict(self._retired_counts)
+            for _, counts in live:
+                # copy() is atomic, so the owning thread may keep incrementing
+                for key, value in counts.copy().items():
+                    totals[key] = totals.get(key, 0) + value
+        return totals
 
     def set_gauge(
         self,
         name: str,
         value: float,
-        labels: dict[str, str] | None = None,
+        labels: dict[str, str] | LabelSet | None = None,
     ) -> None:
         """
         Set a gauge metric to a specific value.
@@ -235,14 +712,16 @@ class MetricsCollector:
         Example:
             >>> metrics_collector.set_gauge("active_workers", 3)
         """
-        key = (name, self._labels_to_tuple(labels))
-        with self._lock:
-            self._gauges[key] = value
+        key = self._key(name, labels)
+        shard = self._shard_for(key)
+        with shard.rwlock.write_lock():
+            shard.entry(key).gauge = value
+        self._dirty = True
 
     def start_timer(
         self,
         name: str | StageTimer,
-        labels: dict[str, str] | None = None,
+        labels: dict[str, str] | LabelSet | None = None,
     ) -> Timer:
         """
         Start a timer for measuring operation duration.
@@ -264,11 +743,50 @@ class MetricsCollector:
         timer_name = name.value if isinstance(name, StageTimer) else name
         return Timer(timer_name, self, labels)
 
+    def time_start(self) -> int:
+        """
+        Start timing an operation without allocating a Timer.
+
+        Lighter-weight alternative to start_timer() for small, frequently
+        timed regions; pass the returned token to time_stop().
+
+        Returns:
+            Start token (a perf_counter_ns() reading)
+
+        Example:
+            >>> token = metrics_collector.time_start()
+            >>> response = bedrock.invoke_model(...)
+            >>> metrics_collector.time_stop(StageTimer.BEDROCK_INFERENCE, token)
+        """
+        return time.perf_counter_ns()
+
+    def time_stop(
+        self,
+        name: str | StageTimer,
+        token: int,
+        labels: dict[str, str] | LabelSet | None = None,
+    ) -> float:
+        """
+        Record the duration since time_start() returned token.
+
+        Args:
+            name: Timer name (usually a StageTimer value)
+            token: Value returned by time_start()
+            labels: Optional labels
+
+        Returns:
+            Duration in seconds
+        """
+        duration_ns = time.perf_counter_ns() - token
+        timer_name = name.value if isinstance(name, StageTimer) else name
+        self._record_timing(timer_name, duration_ns, labels)
+        return duration_ns / _NS_PER_SECOND
+
     def _record_timing(
         self,
         name: str,
-        duration: float,
-        labels: dict[str, str] | None = None,
+        duration_ns: int,
+        labels: dict[str, str] | LabelSet | None = None,
     ) -> None:
         """
         Record a timing value.
@@ -277,20 +795,24 @@ class MetricsCollector:
 
         Args:
             name: Timer name
-            duration: Duration in seconds
+            duration_ns: Duration in nanoseconds
             labels: Optional labels
         """
-        key = (name, self._labels_to_tuple(labels))
-        with self._lock:
-            self._timings[key].append(duration)
-            # Keep only last 1000 timings to prevent memory growth
-            if len(self._timings[key]) > 1000:
-                self._timings[key] = self._timings[key][-1000:]
+        key = self._key(name, labels)
+        shard = self._shard_for(key)
+        with shard.rwlock.write_lock():
+            entry = shard.entry(key)
+            ring = entry.timing
+            if ring is None:
+                ring = entry.timing = _TimingRing()
+            # Keeps only the most recent _TIMING_WINDOW timings
+            ring.record(duration_ns)
+        self._dirty = True
 
     def get_counter(
         self,
         name: str,
-        labels: dict[str, str] | None = None,
+        labels: dict[str, str] | LabelSet | None = None,
     ) -> int:
         """
         Get current value of a counter.
@@ -302,14 +824,17 @@ class MetricsCollector:
         Returns:
             Current counter value (0 if not set)
         """
-        key = (name, self._labels_to_tuple(labels))
-        with self._lock:
-            return self._counters.get(key, 0)
+        key = self._key(name, labels)
+        with self._counts_lock:
+            total = self._retired_counts.get(key, 0)
+            for _, counts in self._thread_counts:
+                total += counts.get(key, 0)
+        return total
 
     def get_gauge(
         self,
         name: str,
-        labels: dict[str, str] | None = None,
+        labels: dict[str, str] | LabelSet | None = None,
     ) -> float | None:
         """
         Get current value of a gauge.
@@ -321,14 +846,16 @@ class MetricsCollector:
         Returns:
             Current gauge value or None if not set
         """
-        key = (name, self._labels_to_tuple(labels))
-        with self._lock:
-            return self._gauges.get(key)
+        key = self._key(name, labels)
+        shard = self._shard_for(key)
+        with shard.rwlock.read_lock():
+            entry = shard.entries.get(key)
+            return entry.gauge if entry is not None else None
 
     def get_timing_stats(
         self,
         name: str,
-        labels: dict[str, str] | None = None,
+        labels: dict[str, str] | LabelSet | None = None,
     ) -> dict[str, float] | None:
         """
         Get timing statistics for a named timer.
@@ -341,44 +868,49 @@ class MetricsCollector:
             Dictionary with count, min, max, mean, p50, p95, p99
             or None if no timings recorded
         """
-        key = (name, self._labels_to_tuple(labels))
-        with self._lock:
-            timings = self._timings.get(key, [])
-            if not timings:
+        key = self._key(name, labels)
+        shard = self._shard_for(key)
+        with shard.rwlock.read_lock():
+            entry = shard.entries.get(key)
+            ring = entry.timing if entry is not None else None
+            summary = ring.summary() if ring is not None else None
+            if summary is None:
                 return None
 
-            sorted_timings = sorted(timings)
-            return {
-                "count": len(timings),
-                "min": min(timings),
-                "max": max(timings),
-                "mean": statistics.mean(timings),
-                "p50": self._percentile(sorted_timings, 50),
-                "p95": self._percentile(sorted_timings, 95),
-                "p99": self._percentile(sorted_timings, 99),
-            }
+            return summary.to_dict()
 
-    def _percentile(self, sorted_values: list[float], percentile: int) -> float:
+    def _format_key(self, name: str, labels_tuple: LabelSet) -> str:
         """
-        Calculate percentile from sorted values.
+        Format a metric key as name{k=v,...} for get_metrics output.
+
+        The label portion is cached per label set, up to
+        _LABEL_STR_CACHE_SIZE label sets.
 
         Args:
-            sorted_values: Pre-sorted list of values
-            percentile: Percentile to calculate (0-100)
+            name: Metric name
+            labels_tuple: Canonical labels of the metric
 
         Returns:
-            Value at the given percentile
+            Metric name, with labels appended in braces if any
         """
-        if not sorted_values:
-            return 0.0
-        index = int(len(sorted_values) * percentile / 100)
-        index = min(index, len(sorted_values) - 1)
-        return sorted_values[index]
+        if not labels_tuple:
+            return name
+        label_str = self._label_str_cache.get(labels_tuple)
+        if label_str is None:
+            label_str = ",".join(f"{k}={v}" for k, v in labels_tuple)
+            if len(self._label_str_cache) < _LABEL_STR_CACHE_SIZE:
+                self._label_str_cache[labels_tuple] = label_str
+        return f"{name}{{{label_str}}}"
 
     def get_metrics(self) -> dict[str, Any]:
         """
         Get all metrics as a JSON-serializable dictionary.
 
+        The counters, gauges, and timings sections are rebuilt only when a
+        metric has been updated since the last call; otherwise the cached
+        sections are returned with a fresh timestamp and uptime. The
+        sections are shared between calls and must not be mutated.
+
         Returns:
             Dictionary containing:
             - timestamp: Current UTC timestamp
@@ -391,57 +923,74 @@ class MetricsCollector:
             >>> metrics = metrics_collector.get_metrics()
             >>> print(json.dumps(metrics, indent=2))
         """
-        now = datetime.now(UTC)
-        uptime = (now - self._start_time).total_seconds()
+        snapshot = self._snapshot
+        if snapshot is None or self._dirty:
+            # Clear first so an update racing with the rebuild marks it dirty again
+            self._dirty = False
+            snapshot = self._snapshot = self._build_snapshot()
+
+        # Timestamp and uptime are taken after all shard locks are released
+        return {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "uptime_seconds": time.monotonic() - self._start_time,
+            **snapshot,
+        }
 
-        with self._lock:
-            # Format counters
-            counters: dict[str, Any] = {}
-            for (name, labels_tuple), value in self._counters.items():
-                if labels_tuple:
-                    labels_dict = dict(labels_tuple)
-                    label_str = ",".join(f"{k}={v}" for k, v in labels_dict.items())
-                    counters[f"{name}{{{label_str}}}"] = value
-                else:
-                    counters[name] = value
+    def _build_snapshot(self) -> dict[str, Any]:
+        """
+        Format the counters, gauges, and timings sections of get_metrics.
+
+        Returns:
+            Dictionary with counters, gauges, and timings sections
+        """
+        # Format counters
+        counters: dict[str, Any] = {}
+        for (name, labels_tuple), value in self._counter_totals().items():
+            counters[self._format_key(name, labels_tuple)] = value
+
+        gauges: dict[str, float] = {}
+        timings: dict[str, Any] = {}
+
+        # Hold each shard's lock only to copy its contents, one shard at a
+        # time; summaries are computed after the lock is released
+        for shard in self._shards:
+            gauge_items: list[tuple[_MetricKey, float]] = []
+            ready: list[tuple[_MetricKey, _TimingSummary | None]] = []
+            pending: list[tuple[_MetricKey, _TimingRing, int, array[int]]] = []
+            with shard.rwlock.read_lock():
+                for key, entry in shard.entries.items():
+                    if entry.gauge is not None:
+                        gauge_items.append((key, entry.gauge))
+                    ring = entry.timing
+                    if ring is None:
+                        continue
+                    summary = ring.cached_summary()
+                    if summary is not None:
+                        ready.append((key, summary))
+                    else:
+                        pending.append((key, ring, ring.generation, ring.copy_samples()))
 
             # Format gauges
-            gauges: dict[str, float] = {}
-            for (name, labels_tuple), gauge_value in self._gauges.items():
-                if labels_tuple:
-                    labels_dict = dict(labels_tuple)
-                    label_str = ",".join(f"{k}={v}" for k, v in labels_dict.items())
-                    gauges[f"{name}{{{label_str}}}"] = gauge_value
-                else:
-                    gauges[name] = gauge_value
+            for (name, labels_tuple), gauge_value in gauge_items:
+                gauges[self._format_key(name, labels_tuple)] = gauge_value
+
+            # Summarize timings whose cached summary was stale
+            computed = [
+                (key, ring, generation, _summarize(samples, len(samples)))
+                for key, ring, generation, samples in pending
+            ]
+            if computed:
+                with shard.rwlock.read_lock():
+                    for _, ring, generation, summary in computed:
+                        ring.store_summary(summary, generation)
+                ready.extend((key, summary) for key, _, _, summary in computed)
 
             # Format timings
-            timings: dict[str, Any] = {}
-            for (name, labels_tuple), values in self._timings.items():
-                if not values:
-                    continue
-
-                sorted_values = sorted(values)
-                stats = {
-                    "count": len(values),
-                    "min_seconds": min(values),
-                    "max_seconds": max(values),
-                    "mean_seconds": statistics.mean(values),
-                    "p50_seconds": self._percentile(sorted_values, 50),
-                    "p95_seconds": self._percentile(sorted_values, 95),
-                    "p99_seconds": self._percentile(sorted_values, 99),
-                }
-
-                if labels_tuple:
-                    labels_dict = dict(labels_tuple)
-                    label_str = ",".join(f"{k}={v}" for k, v in labels_dict.items())
-                    timings[f"{name}{{{label_str}}}"] = stats
-                else:
-                    timings[name] = stats
+            for (name, labels_tuple), summary in ready:
+                if summary is not None:
+                    timings[self._format_key(name, labels_tuple)] = summary.to_dict("_seconds")
 
         return {
-            "timestamp": now.isoformat(),
-            "uptime_seconds": uptime,
             "counters": counters,
             "gauges": gauges,
             "timings": timings,
@@ -453,11 +1002,17 @@ class MetricsCollector:
 
         Useful for testing or when restarting metric collection.
         """
-        with self._lock:
-            self._counters.clear()
-            self._gauges.clear()
-            self._timings.clear()
-            self._start_time = datetime.now(UTC)
+        with self._counts_lock:
+            self._retired_counts.clear()
+            for _, counts in self._thread_counts:
+                counts.clear()
+        for shard in self._shards:
+            with shard.rwlock.write_lock():
+                shard.entries.clear()
+        self._key_cache.clear()
+        self._label_str_cache.clear()
+        self._start_time = time.monotonic()
+        self._dirty = True
 
 
 # Global singleton instance for convenience
@@ -470,20 +1025,21 @@ class MetricNames:
     Standard metric names used throughout TerraFix.
 
     Using constants ensures consistency and enables IDE autocomplete.
+    They are Final so the compiled module keeps them as class constants.
     """
 
     # Counters
-    FAILURES_PROCESSED_TOTAL = "failures_processed_total"
-    FAILURES_SUCCESSFUL_TOTAL = "failures_successful_total"
-    FAILURES_SKIPPED_TOTAL = "failures_skipped_total"
-    FAILURES_FAILED_TOTAL = "failures_failed_total"
-    PRS_CREATED_TOTAL = "prs_created_total"
-    API_ERRORS_TOTAL = "api_errors_total"
-    RETRIES_TOTAL = "retries_total"
+    FAILURES_PROCESSED_TOTAL: Final = "failures_processed_total"
+    FAILURES_SUCCESSFUL_TOTAL: Final = "failures_successful_total"
+    FAILURES_SKIPPED_TOTAL: Final = "failures_skipped_total"
+    FAILURES_FAILED_TOTAL: Final = "failures_failed_total"
+    PRS_CREATED_TOTAL: Final = "prs_created_total"
+    API_ERRORS_TOTAL: Final = "api_errors_total"
+    RETRIES_TOTAL: Final = "retries_total"
 
     # Gauges
-    QUEUE_DEPTH = "queue_depth"
-    ACTIVE_WORKERS = "active_workers"
-    LAST_POLL_TIMESTAMP = "last_poll_timestamp"
+    QUEUE_DEPTH: Final = "queue_depth"
+    ACTIVE_WORKERS: Final = "active_workers"
+    LAST_POLL_TIMESTAMP: Final = "last_poll_timestamp"
 
     # Timings are handled by StageTimer enum
@@ -6,7 +6,9 @@ detection through PR creation. It handles deduplication, repository cloning,
 Terraform analysis, fix generation, and GitHub PR creation.
 
 The orchestrator implements retry logic with exponential backoff for transient
-failures and graceful error handling for permanent failures.
+failures and graceful error handling for permanent failures. Calls to
+Bedrock and GitHub go through per-service circuit breakers so an outage
+fails the remaining work fast instead of retrying every failure.
 
 The orchestrator is instrumented with metrics collection for observability,
 tracking per-stage timing and success/failure counts.
@@ -26,18 +28,32 @@ Usage:
         generator=generator,
         gh=gh_creator
     )
+
+    # Or process a batch concurrently
+    results = asyncio.run(process_failures_async(failures, settings, store, ...))
 """
 
+import asyncio
 import os
+import random
 import tempfile
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, nullcontext
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Literal
 
+from terrafix.circuit_breaker import CircuitBreaker
 from terrafix.config import Settings
 from terrafix.errors import (
     BedrockError,
     GitHubError,
     ResourceNotFoundError,
+    StateStoreError,
     TerraFixError,
     TerraformParseError,
     VantaApiError,
@@ -46,10 +62,10 @@ from terrafix.github_pr_creator import GitHubPRCreator
 from terrafix.logging_config import LogContext, get_logger, log_with_context
 from terrafix.metrics import MetricNames, StageTimer, metrics_collector
 from terrafix.redis_state_store import RedisStateStore
-from terrafix.remediation_generator import TerraformRemediationGenerator
+from terrafix.remediation_generator import PromptContext, TerraformRemediationGenerator
 from terrafix.secure_git import SecureGitClient
 from terrafix.terraform_analyzer import TerraformAnalyzer
-from terrafix.terraform_validator import TerraformValidator, ValidationResult
+from terrafix.terraform_validator import TerraformValidator, ValidationResult, scratch_root
 from terrafix.vanta_client import Failure, VantaClient
 
 logger = get_logger(__name__)
@@ -58,12 +74,64 @@ logger = get_logger(__name__)
 MAX_RETRIES = 3
 INITIAL_BACKOFF_SECONDS = 2
 MAX_BACKOFF_SECONDS = 60
+# Backoff cap before each retry: exponential growth, clamped
+_BACKOFF_TABLE = tuple(
+    float(min(INITIAL_BACKOFF_SECONDS * (2**attempt), MAX_BACKOFF_SECONDS))
+    for attempt in range(MAX_RETRIES)
+)
+# Fraction of each backoff that is randomized (1.0 = full jitter)
+BACKOFF_JITTER_RATIO = 1.0
+
+# Parsed analyzers kept for reuse, keyed by (repo, terraform_path, commit)
+ANALYZER_CACHE_SIZE = 16
+_analyzer_cache: OrderedDict[tuple[str, str, str], TerraformAnalyzer] = OrderedDict()
+_analyzer_cache_lock = threading.Lock()
+
+# Resources recently not found in their repository, keyed by
+# (repo, terraform_path, resource_arn), so repeat polls skip the checkout
+MISSING_RESOURCE_CACHE_SIZE = 1024
+MISSING_RESOURCE_TTL_SECONDS = 900.0
+_missing_resources: OrderedDict[tuple[str, str, str], float] = OrderedDict()
+_missing_resources_lock = threading.Lock()
+
+# Hashes of failures currently being processed in this process
+_inflight: set[str] = set()
+_inflight_lock = threading.Lock()
+
+# Runs repository-independent preparation while the repository is checked out
+_prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="terrafix-prefetch")
+
+# Prepares terraform validators while Bedrock generates the fix
+_validator_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="terrafix-validator")
+
+# Fail fast while a downstream service is down instead of retrying every failure
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN_SECONDS = 60.0
+_bedrock_breaker = CircuitBreaker(
+    "bedrock",
+    failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+    cooldown=CIRCUIT_COOLDOWN_SECONDS,
+    is_failure=lambda e: _is_outage(e),
+)
+_github_breaker = CircuitBreaker(
+    "github",
+    failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+    cooldown=CIRCUIT_COOLDOWN_SECONDS,
+    is_failure=lambda e: _is_outage(e),
+)
 
+# Repository mirrors refreshed at once from the event loop
+PREFETCH_CONCURRENCY = 16
 
+
+@dataclass(frozen=True, slots=True)
 class ProcessingResult:
     """
     Result of processing a single failure.
 
+    Immutable and slotted, so large batches of results stay small and can
+    be hashed or collected into sets.
+
     Attributes:
         success: Whether processing succeeded
         failure_hash: Hash of the processed failure
@@ -74,24 +142,129 @@ class ProcessingResult:
 
     success: bool
     failure_hash: str
-    pr_url: str | None
-    error: str | None
-    skipped: bool
-
-    def __init__(
-        self,
-        success: bool,
-        failure_hash: str,
-        pr_url: str | None = None,
-        error: str | None = None,
-        skipped: bool = False,
-    ) -> None:
-        """Initialize processing result."""
-        self.success = success
-        self.failure_hash = failure_hash
-        self.pr_url = pr_url
-        self.error = error
-        self.skipped = skipped
+    pr_url: str | None = None
+    error: str | None = None
+    skipped: bool = False
+
+
+class RepoCheckout:
+    """
+    Checkout of one repository shared by several failures.
+
+    The repository is checked out the first time a failure needs it and
+    stays in place until close(), so a batch with many failures in the
+    same repository fetches and writes the working tree once. Thread-safe.
+
+    The repository mirror can be refreshed ahead of time from the event
+    loop with prefetch(), in which case path() only adds the worktree.
+
+    Attributes:
+        repo_full_name: Repository in "owner/repo" format
+        git_client: Git client used for the checkout
+    """
+
+    def __init__(self, config: Settings, repo_full_name: str) -> None:
+        """
+        Prepare a lazy checkout.
+
+        Args:
+            config: Application settings
+            repo_full_name: Repository in "owner/repo" format
+        """
+        self.repo_full_name: str = repo_full_name
+        self.git_client: SecureGitClient = SecureGitClient(github_token=config.github_token)
+        self._cache_root: Path = Path(config.repo_cache_dir)
+        self._terraform_path: str = config.terraform_path
+        self._stack: ExitStack = ExitStack()
+        self._path: Path | None = None
+        self._commit: str | None = None
+        self._mirror_fresh: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    async def prefetch(self) -> None:
+        """
+        Refresh the repository mirror without occupying a worker thread.
+
+        Git runs as an asyncio subprocess, so the mirrors of every
+        repository in a batch can be refreshed concurrently. A failure is
+        only logged; path() then refreshes the mirror itself.
+        """
+        try:
+            _github_breaker.before_call()
+        except TerraFixError:
+            return
+
+        try:
+            _ = await self.git_client.ensure_mirror_async(
+                repo_full_name=self.repo_full_name,
+                cache_root=self._cache_root,
+                branch="main",
+                depth=1,
+            )
+        except (GitHubError, OSError) as e:
+            if _is_outage(e):
+                _github_breaker.record_failure()
+            else:
+                _github_breaker.record_success()
+            log_with_context(
+                logger,
+                "warning",
+                "Repository prefetch failed",
+                repo=self.repo_full_name,
+                error=str(e),
+            )
+            return
+
+        _github_breaker.record_success()
+        self._mirror_fresh = True
+
+    def path(self) -> Path:
+        """
+        Return the checkout path, checking the repository out if needed.
+
+        A failed checkout is not remembered, so a later call tries again.
+
+        Returns:
+            Path to the checked-out repository
+
+        Raises:
+            GitHubError: If the repository cannot be checked out
+        """
+        with self._lock:
+            if self._path is None:
+                self._path = self._stack.enter_context(
+                    _clone_repository(
+                        self.git_client,
+                        self.repo_full_name,
+                        self._cache_root,
+                        self._terraform_path,
+                        refresh_mirror=not self._mirror_fresh,
+                    )
+                )
+            return self._path
+
+    def head_commit(self) -> str:
+        """
+        Return the checked-out commit, looking it up once per checkout.
+
+        Returns:
+            Commit SHA of the checkout
+
+        Raises:
+            GitHubError: If the repository cannot be checked out
+        """
+        path = self.path()
+        with self._lock:
+            if self._commit is None:
+                self._commit = self.git_client.head_commit(path)
+            return self._commit
+
+    def close(self) -> None:
+        """Remove the checkout, if one was made."""
+        with self._lock:
+            self._stack.close()
+            self._path = None
+            self._commit = None
 
 
 def process_failure(
@@ -101,6 +274,7 @@ def process_failure(
     vanta: VantaClient,
     generator: TerraformRemediationGenerator,
     gh: GitHubPRCreator,
+    checkout: RepoCheckout | None = None,
 ) -> ProcessingResult:
     """
     Process a single compliance failure end-to-end.
@@ -121,6 +295,8 @@ def process_failure(
         vanta: Vanta API client (unused but kept for signature)
         generator: Bedrock remediation generator
         gh: GitHub PR creator
+        checkout: Checkout shared with other failures of the same
+            repository (default: check out the repository for this failure)
 
     Returns:
         ProcessingResult with success status and details
@@ -139,117 +315,511 @@ def process_failure(
     """
     # Generate correlation ID for this processing run
     with LogContext() as correlation_id:
+        failure_hash = _log_start(failure, vanta, correlation_id)
+
+        skipped = _claim(failure, failure_hash, state_store)
+        if skipped is not None:
+            return skipped
+
+        try:
+            # Process the failure with retry logic
+            try:
+                # Track total processing time
+                with metrics_collector.start_timer(StageTimer.TOTAL_PROCESSING):
+                    pr_url = _process_failure_with_retry(
+                        failure=failure,
+                        config=config,
+                        generator=generator,
+                        gh=gh,
+                        checkout=checkout,
+                    )
+
+                return _record_success(failure_hash, pr_url, state_store)
+
+            except Exception as e:
+                return _record_failure(failure_hash, e, state_store)
+        finally:
+            with _inflight_lock:
+                _inflight.discard(failure_hash)
+
+
+async def process_failure_async(
+    failure: Failure,
+    config: Settings,
+    state_store: RedisStateStore,
+    vanta: VantaClient,
+    generator: TerraformRemediationGenerator,
+    gh: GitHubPRCreator,
+    checkout: RepoCheckout | None = None,
+    limiter: asyncio.Semaphore | None = None,
+) -> ProcessingResult:
+    """
+    Process a single compliance failure end-to-end from an event loop.
+
+    Same pipeline as process_failure(). Each attempt runs in a worker
+    thread, since the Bedrock and GitHub clients are blocking, but the
+    retry backoff is awaited on the event loop, so a failure waiting to
+    retry holds neither a thread nor a concurrency slot.
+
+    Args:
+        failure: Vanta compliance failure to process
+        config: Application settings
+        state_store: Redis state store for deduplication
+        vanta: Vanta API client
+        generator: Bedrock remediation generator
+        gh: GitHub PR creator
+        checkout: Checkout shared with other failures of the same
+            repository (default: check out the repository for this failure)
+        limiter: Semaphore held for the duration of each attempt, bounding
+            the attempts that run at once (default: unbounded)
+
+    Returns:
+        ProcessingResult with success status and details
+
+    Example:
+        >>> result = await process_failure_async(
+        ...     failure, settings, store, vanta_client, generator, gh_creator
+        ... )
+    """
+    with LogContext() as correlation_id:
+        failure_hash = _log_start(failure, vanta, correlation_id)
+
+        skipped = await asyncio.to_thread(_claim, failure, failure_hash, state_store)
+        if skipped is not None:
+            return skipped
+
+        try:
+            try:
+                with metrics_collector.start_timer(StageTimer.TOTAL_PROCESSING):
+                    pr_url = await _process_failure_with_retry_async(
+                        failure=failure,
+                        config=config,
+                        generator=generator,
+                        gh=gh,
+                        checkout=checkout,
+                        limiter=limiter,
+                    )
+
+                return await asyncio.to_thread(_record_success, failure_hash, pr_url, state_store)
+
+            except Exception as e:
+                return await asyncio.to_thread(_record_failure, failure_hash, e, state_store)
+        finally:
+            with _inflight_lock:
+                _inflight.discard(failure_hash)
+
+
+def _log_start(failure: Failure, vanta: VantaClient, correlation_id: str) -> str:
+    """
+    Log the start of a processing run.
+
+    Args:
+        failure: Failure being processed
+        vanta: Vanta API client
+        correlation_id: Correlation ID of the run
+
+    Returns:
+        Failure hash used for deduplication
+    """
+    log_with_context(
+        logger,
+        "info",
+        "Starting failure processing",
+        test_id=failure.test_id,
+        resource_arn=failure.resource_arn,
+        severity=failure.severity,
+        correlation_id=correlation_id,
+    )
+
+    # Generate failure hash for deduplication
+    return vanta.generate_failure_hash(failure)
+
+
+def _claim(
+    failure: Failure,
+    failure_hash: str,
+    state_store: RedisStateStore,
+) -> ProcessingResult | None:
+    """
+    Claim a failure for processing unless it is a duplicate.
+
+    The state store check and the in-progress record are one atomic
+    claim, so workers in other processes cannot claim the same failure.
+    On success the failure hash is left in _inflight; the caller must
+    discard it once processing ends.
+
+    Args:
+        failure: Failure to claim
+        failure_hash: Deduplication hash of the failure
+        state_store: Redis state store for deduplication
+
+    Returns:
+        A skipped ProcessingResult if the failure is a duplicate, None if
+        it was claimed
+    """
+    # Skip failures already being processed by another worker in this
+    # process; the state store only sees them once marked in progress
+    with _inflight_lock:
+        duplicate = failure_hash in _inflight
+        _inflight.add(failure_hash)
+    if duplicate:
         log_with_context(
             logger,
             "info",
-            "Starting failure processing",
+            "Failure already in progress, skipping",
+            failure_hash=failure_hash,
             test_id=failure.test_id,
-            resource_arn=failure.resource_arn,
-            severity=failure.severity,
-            correlation_id=correlation_id,
+        )
+        metrics_collector.increment(MetricNames.FAILURES_SKIPPED_TOTAL)
+        return ProcessingResult(
+            success=True,
+            failure_hash=failure_hash,
+            skipped=True,
         )
 
-        # Generate failure hash for deduplication
-        failure_hash = vanta.generate_failure_hash(failure)
+    try:
+        # Claim unless already processed, marking it in progress
+        claimed = state_store.claim_with_metadata(
+            failure_hash,
+            failure.test_id,
+            failure.resource_arn,
+        )
+    except BaseException:
+        with _inflight_lock:
+            _inflight.discard(failure_hash)
+        raise
 
-        # Check if already processed
-        if state_store.is_already_processed(failure_hash):
-            log_with_context(
-                logger,
-                "info",
-                "Failure already processed, skipping",
-                failure_hash=failure_hash,
-                test_id=failure.test_id,
-            )
-            metrics_collector.increment(MetricNames.FAILURES_SKIPPED_TOTAL)
-            return ProcessingResult(
-                success=True,
-                failure_hash=failure_hash,
-                skipped=True,
-            )
+    if not claimed:
+        with _inflight_lock:
+            _inflight.discard(failure_hash)
+        return _skip_processed(failure, failure_hash)
 
-        # Mark as in progress
-        try:
-            state_store.mark_in_progress(
-                failure_hash,
-                failure.test_id,
-                failure.resource_arn,
+    return None
+
+
+def _skip_processed(failure: Failure, failure_hash: str) -> ProcessingResult:
+    """
+    Report a failure the state store shows as already handled.
+
+    Args:
+        failure: Failure being skipped
+        failure_hash: Deduplication hash of the failure
+
+    Returns:
+        Skipped ProcessingResult
+    """
+    log_with_context(
+        logger,
+        "info",
+        "Failure already processed, skipping",
+        failure_hash=failure_hash,
+        test_id=failure.test_id,
+    )
+    metrics_collector.increment(MetricNames.FAILURES_SKIPPED_TOTAL)
+    return ProcessingResult(
+        success=True,
+        failure_hash=failure_hash,
+        skipped=True,
+    )
+
+
+def _record_success(
+    failure_hash: str,
+    pr_url: str,
+    state_store: RedisStateStore,
+) -> ProcessingResult:
+    """
+    Record a successfully processed failure.
+
+    Args:
+        failure_hash: Deduplication hash of the failure
+        pr_url: URL of the created PR
+        state_store: Redis state store
+
+    Returns:
+        Successful ProcessingResult
+    """
+    # Mark as successfully processed
+    state_store.mark_processed(failure_hash, pr_url)
+
+    # Update metrics
+    metrics_collector.increment(MetricNames.FAILURES_PROCESSED_TOTAL)
+    metrics_collector.increment(MetricNames.FAILURES_SUCCESSFUL_TOTAL)
+    metrics_collector.increment(MetricNames.PRS_CREATED_TOTAL)
+
+    log_with_context(
+        logger,
+        "info",
+        "Successfully processed failure",
+        failure_hash=failure_hash,
+        pr_url=pr_url,
+    )
+
+    return ProcessingResult(
+        success=True,
+        failure_hash=failure_hash,
+        pr_url=pr_url,
+    )
+
+
+def _record_failure(
+    failure_hash: str,
+    error: Exception,
+    state_store: RedisStateStore,
+) -> ProcessingResult:
+    """
+    Record a failure that could not be remediated.
+
+    Args:
+        failure_hash: Deduplication hash of the failure
+        error: Exception that ended processing
+        state_store: Redis state store
+
+    Returns:
+        Failed ProcessingResult
+    """
+    error_msg = str(error)
+
+    # Update failure metrics
+    metrics_collector.increment(MetricNames.FAILURES_PROCESSED_TOTAL)
+    metrics_collector.increment(MetricNames.FAILURES_FAILED_TOTAL)
+
+    log_with_context(
+        logger,
+        "error",
+        "Failed to process failure",
+        failure_hash=failure_hash,
+        error=error_msg,
+        error_type=type(error).__name__,
+    )
+
+    # Mark as failed in state store
+    try:
+        state_store.mark_failed(failure_hash, error_msg)
+    except Exception as state_error:
+        log_with_context(
+            logger,
+            "warning",
+            "Failed to mark as failed in state store",
+            error=str(state_error),
+        )
+
+    return ProcessingResult(
+        success=False,
+        failure_hash=failure_hash,
+        error=error_msg,
+    )
+
+
+async def process_failures_async(
+    failures: list[Failure],
+    config: Settings,
+    state_store: RedisStateStore,
+    vanta: VantaClient,
+    generator: TerraformRemediationGenerator,
+    gh: GitHubPRCreator,
+    concurrency: int = 3,
+    batch_size: int | None = None,
+    batch_delay: float = 0.0,
+) -> list[ProcessingResult]:
+    """
+    Process multiple failures concurrently.
+
+    Each failure runs through process_failure_async(), with at most
+    concurrency attempts in flight at once; failures waiting out a retry
+    backoff do not count towards the limit. Optionally, failures are
+    started in batches of batch_size with batch_delay seconds between
+    batches, to stay under remote rate limits. Failures that map to the
+    same repository share one checkout of it, which is removed once every
+    failure has been processed. Failures the state store shows as handled
+    are skipped after a single batched lookup.
+
+    Args:
+        failures: Failures to process
+        config: Application settings
+        state_store: Redis state store for deduplication
+        vanta: Vanta API client
+        generator: Bedrock remediation generator
+        gh: GitHub PR creator
+        concurrency: Maximum failures processed at once (default: 3)
+        batch_size: Failures per batch (default: all in one batch)
+        batch_delay: Seconds to wait between batches (default: 0)
+
+    Returns:
+        ProcessingResult for each failure, in the same order as failures.
+        Unexpected exceptions are returned as failed results.
+
+    Example:
+        >>> results = asyncio.run(process_failures_async(
+        ...     failures, settings, store, vanta_client, generator, gh_creator,
+        ...     concurrency=10, batch_size=20, batch_delay=3,
+        ... ))
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Deduplicate the whole batch against the state store in one round
+    # trip; if that fails, each failure is checked on its own as usual
+    hashes = [vanta.generate_failure_hash(f) for f in failures]
+    unprocessed: set[str] | None
+    try:
+        unprocessed = await asyncio.to_thread(state_store.batch_filter_unprocessed, hashes)
+    except StateStoreError as e:
+        log_with_context(
+            logger,
+            "warning",
+            "Batch deduplication failed, checking failures individually",
+            error=str(e),
+        )
+        unprocessed = None
+
+    def _pending(failure_hash: str) -> bool:
+        return unprocessed is None or failure_hash in unprocessed
+
+    # Group failures by repository so each repository is checked out once
+    repos = [
+        config.get_repo_for_resource(f.resource_arn) if _pending(h) else None
+        for f, h in zip(failures, hashes, strict=True)
+    ]
+    checkouts = {repo: RepoCheckout(config, repo) for repo in dict.fromkeys(repos) if repo}
+
+    # Refresh every repository's mirror up front, concurrently, on the
+    # event loop; workers then only need to add a worktree
+    prefetch_semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+    async def _prefetch(checkout: RepoCheckout) -> None:
+        async with prefetch_semaphore:
+            await checkout.prefetch()
+
+    prefetches = {
+        repo: asyncio.ensure_future(_prefetch(checkout)) for repo, checkout in checkouts.items()
+    }
+
+    async def _run(failure: Failure, repo: str | None, failure_hash: str) -> ProcessingResult:
+        if not _pending(failure_hash):
+            return _skip_processed(failure, failure_hash)
+        if repo:
+            await prefetches[repo]
+        return await process_failure_async(
+            failure=failure,
+            config=config,
+            state_store=state_store,
+            vanta=vanta,
+            generator=generator,
+            gh=gh,
+            checkout=checkouts.get(repo) if repo else None,
+            limiter=semaphore,
+        )
+
+    results: list[ProcessingResult] = []
+    step = batch_size or len(failures) or 1
+
+    try:
+        for start in range(0, len(failures), step):
+            if start and batch_delay > 0:
+                await asyncio.sleep(batch_delay)
+
+            batch = failures[start : start + step]
+            outcomes = await asyncio.gather(
+                *(
+                    _run(f, r, h)
+                    for f, r, h in zip(
+                        batch,
+                        repos[start : start + step],
+                        hashes[start : start + step],
+                        strict=True,
+                    )
+                ),
+                return_exceptions=True,
             )
-        except Exception as e:
-            log_with_context(
-                logger,
-                "error",
-                "Failed to mark as in progress",
-                failure_hash=failure_hash,
-                error=str(e),
+            results.extend(
+                _to_result(failure, outcome, vanta)
+                for failure, outcome in zip(batch, outcomes, strict=True)
             )
-            # Continue anyway - state update failure shouldn't block processing
+    finally:
+        for prefetch in prefetches.values():
+            _ = prefetch.cancel()
+        _ = await asyncio.gather(*prefetches.values(), return_exceptions=True)
+        for checkout in checkouts.values():
+            await asyncio.to_thread(checkout.close)
 
-        # Process the failure with retry logic
-        try:
-            # Track total processing time
-            with metrics_collector.start_timer(StageTimer.TOTAL_PROCESSING):
-                pr_url = _process_failure_with_retry(
-                    failure=failure,
-                    config=config,
-                    generator=generator,
-                    gh=gh,
-                )
+    return results
 
-            # Mark as successfully processed
-            state_store.mark_processed(failure_hash, pr_url)
 
-            # Update metrics
-            metrics_collector.increment(MetricNames.FAILURES_PROCESSED_TOTAL)
-            metrics_collector.increment(MetricNames.FAILURES_SUCCESSFUL_TOTAL)
-            metrics_collector.increment(MetricNames.PRS_CREATED_TOTAL)
+def _to_result(
+    failure: Failure,
+    outcome: ProcessingResult | BaseException,
+    vanta: VantaClient,
+) -> ProcessingResult:
+    """
+    Turn the outcome of a concurrent process_failure() call into a result.
 
-            log_with_context(
-                logger,
-                "info",
-                "Successfully processed failure",
-                failure_hash=failure_hash,
-                pr_url=pr_url,
-            )
+    Args:
+        failure: Failure that was processed
+        outcome: Result returned, or exception raised, by process_failure()
+        vanta: Vanta API client, used to hash the failure
 
-            return ProcessingResult(
-                success=True,
-                failure_hash=failure_hash,
-                pr_url=pr_url,
-            )
+    Returns:
+        The result itself, or a failed result describing the exception
+    """
+    if isinstance(outcome, ProcessingResult):
+        return outcome
 
-        except Exception as e:
-            error_msg = str(e)
+    log_with_context(
+        logger,
+        "error",
+        "Unexpected error processing failure",
+        test_id=failure.test_id,
+        error=str(outcome),
+    )
+    return ProcessingResult(
+        success=False,
+        failure_hash=vanta.generate_failure_hash(failure),
+        error=str(outcome),
+    )
 
-            # Update failure metrics
-            metrics_collector.increment(MetricNames.FAILURES_PROCESSED_TOTAL)
-            metrics_collector.increment(MetricNames.FAILURES_FAILED_TOTAL)
 
-            log_with_context(
-                logger,
-                "error",
-                "Failed to process failure",
-                failure_hash=failure_hash,
-                error=error_msg,
-                error_type=type(e).__name__,
-            )
+def _classify(error: VantaApiError | BedrockError | GitHubError) -> Literal["retry", "fail"]:
+    """
+    Decide whether an API error is worth retrying.
 
-            # Mark as failed in state store
-            try:
-                state_store.mark_failed(failure_hash, error_msg)
-            except Exception as state_error:
-                log_with_context(
-                    logger,
-                    "warning",
-                    "Failed to mark as failed in state store",
-                    error=str(state_error),
-                )
+    The HTTP status code takes precedence over the error's retryable flag:
+    authentication failures, conflicts and other client errors will not
+    succeed on a second attempt, while throttling and server errors usually
+    do. A 403 is only retried when the server told us how long to wait,
+    which is how GitHub reports an exhausted rate limit.
 
-            return ProcessingResult(
-                success=False,
-                failure_hash=failure_hash,
-                error=error_msg,
-            )
+    Args:
+        error: Error raised by one of the API clients
+
+    Returns:
+        "retry" for transient errors, "fail" for permanent ones
+    """
+    status = error.status_code
+    if status is None:
+        return "retry" if error.retryable else "fail"
+    if status == 429 or status >= 500:
+        return "retry"
+    if status == 403 and error.retry_after is not None:
+        return "retry"
+    return "fail"
+
+
+def _is_outage(error: Exception) -> bool:
+    """
+    Decide whether an error counts towards opening a circuit breaker.
+
+    Only transient service errors do; a missing resource or a rejected
+    request says nothing about the health of the service.
+
+    Args:
+        error: Exception raised by a protected call
+
+    Returns:
+        True if the error suggests the service is unavailable
+    """
+    if isinstance(error, (VantaApiError, BedrockError, GitHubError)):
+        return _classify(error) == "retry"
+    return False
 
 
 def _process_failure_with_retry(
@@ -257,6 +827,7 @@ def _process_failure_with_retry(
     config: Settings,
     generator: TerraformRemediationGenerator,
     gh: GitHubPRCreator,
+    checkout: RepoCheckout | None = None,
 ) -> str:
     """
     Process failure with retry logic for transient errors.
@@ -266,6 +837,7 @@ def _process_failure_with_retry(
         config: Application settings
         generator: Bedrock remediation generator
         gh: GitHub PR creator
+        checkout: Shared checkout of the failure's repository, if any
 
     Returns:
         GitHub PR URL
@@ -282,70 +854,138 @@ def _process_failure_with_retry(
                 config=config,
                 generator=generator,
                 gh=gh,
+                checkout=checkout,
             )
+        except Exception as e:
+            time.sleep(_retry_backoff(e, attempt))
+            last_exception = e
 
-        except (VantaApiError, BedrockError, GitHubError) as e:
-            # Check if error is retryable
-            if not e.retryable or attempt >= MAX_RETRIES - 1:
-                raise
+    # Should never reach here, but just in case
+    if last_exception:
+        raise last_exception
+    raise RuntimeError("Retry logic failed unexpectedly")
 
-            # Calculate backoff with exponential increase and jitter
-            backoff: float = float(
-                min(
-                    INITIAL_BACKOFF_SECONDS * (2**attempt),
-                    MAX_BACKOFF_SECONDS,
-                )
-            )
 
-            # Track retry metrics
-            metrics_collector.increment(MetricNames.RETRIES_TOTAL)
+async def _process_failure_with_retry_async(
+    failure: Failure,
+    config: Settings,
+    generator: TerraformRemediationGenerator,
+    gh: GitHubPRCreator,
+    checkout: RepoCheckout | None = None,
+    limiter: asyncio.Semaphore | None = None,
+) -> str:
+    """
+    Process failure with retry logic, waiting out backoffs on the event loop.
 
-            log_with_context(
-                logger,
-                "warning",
-                "Transient error, retrying",
-                attempt=attempt + 1,
-                max_retries=MAX_RETRIES,
-                backoff_seconds=backoff,
-                error=str(e),
-            )
+    Args:
+        failure: Vanta compliance failure
+        config: Application settings
+        generator: Bedrock remediation generator
+        gh: GitHub PR creator
+        checkout: Shared checkout of the failure's repository, if any
+        limiter: Semaphore held for the duration of each attempt
 
-            time.sleep(backoff)
-            last_exception = e
+    Returns:
+        GitHub PR URL
 
-        except (TerraformParseError, ResourceNotFoundError) as e:
-            # These are permanent errors, don't retry
-            log_with_context(
-                logger,
-                "error",
-                "Permanent error, not retrying",
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-            raise
+    Raises:
+        TerraFixError: If processing fails after retries
+    """
+    last_exception: Exception | None = None
 
+    for attempt in range(MAX_RETRIES):
+        try:
+            async with limiter or nullcontext():
+                return await asyncio.to_thread(
+                    _process_failure_once,
+                    failure=failure,
+                    config=config,
+                    generator=generator,
+                    gh=gh,
+                    checkout=checkout,
+                )
         except Exception as e:
-            # Unknown error, log and raise
-            log_with_context(
-                logger,
-                "error",
-                "Unexpected error during processing",
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-            raise
+            await asyncio.sleep(_retry_backoff(e, attempt))
+            last_exception = e
 
-    # Should never reach here, but just in case
     if last_exception:
         raise last_exception
     raise RuntimeError("Retry logic failed unexpectedly")
 
 
+def _retry_backoff(error: Exception, attempt: int) -> float:
+    """
+    Decide whether a failed attempt is retried and how long to wait first.
+
+    Args:
+        error: Exception raised by the attempt
+        attempt: Zero-based number of the failed attempt
+
+    Returns:
+        Seconds to wait before the next attempt
+
+    Raises:
+        Exception: error itself, if it must not be retried
+    """
+    if isinstance(error, (VantaApiError, BedrockError, GitHubError)):
+        if _classify(error) == "fail" or attempt >= MAX_RETRIES - 1:
+            raise error
+
+        if error.retry_after is not None:
+            # The server said when to come back; waiting less hits the
+            # limit again and waiting more wastes time. If it asked for
+            # longer than we are willing to wait, give up now
+            if error.retry_after > MAX_BACKOFF_SECONDS:
+                raise error
+            backoff = error.retry_after
+        else:
+            # Calculate backoff with exponential increase and jitter, so
+            # workers that failed together do not retry in lockstep
+            cap = _BACKOFF_TABLE[attempt]
+            backoff = cap - random.uniform(0, cap * BACKOFF_JITTER_RATIO)
+
+        # Track retry metrics
+        metrics_collector.increment(MetricNames.RETRIES_TOTAL)
+
+        log_with_context(
+            logger,
+            "warning",
+            "Transient error, retrying",
+            attempt=attempt + 1,
+            max_retries=MAX_RETRIES,
+            backoff_seconds=backoff,
+            error=str(error),
+        )
+        return backoff
+
+    if isinstance(error, (TerraformParseError, ResourceNotFoundError)):
+        # These are permanent errors, don't retry
+        log_with_context(
+            logger,
+            "error",
+            "Permanent error, not retrying",
+            error=str(error),
+            error_type=type(error).__name__,
+        )
+        raise error
+
+    # Unknown error, log and raise
+    log_with_context(
+        logger,
+        "error",
+        "Unexpected error during processing",
+        error=str(error),
+        error_type=type(error).__name__,
+    )
+    raise error
+
+
 def _process_failure_once(
     failure: Failure,
     config: Settings,
     generator: TerraformRemediationGenerator,
     gh: GitHubPRCreator,
+    checkout: RepoCheckout | None = None,
 ) -> str:
     """
     Process failure once (single attempt).
@@ -355,6 +995,7 @@ def _process_failure_once(
         config: Application settings
         generator: Bedrock remediation generator
         gh: GitHub PR creator
+        checkout: Shared checkout to use if it is of the failure's repository
 
     Returns:
         GitHub PR URL
@@ -372,100 +1013,185 @@ def _process_failure_once(
 
     log_with_context(
         logger,
-        "info",
+        "debug",
         "Mapped resource to repository",
         resource_arn=failure.resource_arn,
         repo=repo_full_name,
     )
 
-    # Clone repository into temporary directory using secure Git client
-    git_client = SecureGitClient(github_token=config.github_token)
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        repo_path = Path(temp_dir) / "repo"
-
-        log_with_context(
-            logger,
-            "info",
-            "Cloning repository securely",
-            repo=repo_full_name,
-            path=str(repo_path),
+    # A resource missing from this repository moments ago is still missing
+    if _recently_missing(repo_full_name, config.terraform_path, failure.resource_arn):
+        raise ResourceNotFoundError(
+            f"Resource {failure.resource_arn} not found in Terraform (recently checked)",
+            resource_arn=failure.resource_arn,
+            resource_type=failure.resource_type,
         )
 
-        _ = git_client.clone_repository(
+    # Reuse the batch's checkout of this repository if there is one
+    if checkout is not None and checkout.repo_full_name == repo_full_name:
+        return _remediate_in_cloned_repo(
+            failure=failure,
+            config=config,
+            generator=generator,
+            gh=gh,
             repo_full_name=repo_full_name,
-            target_path=repo_path,
-            branch="main",
-            depth=1,
+            repo_path=checkout.path(),
+            commit_sha=checkout.head_commit(),
+            context=_prefetch_pool.submit(generator.prepare_context, failure),
         )
 
-        # Navigate to Terraform directory if specified
-        terraform_path = repo_path / config.terraform_path
-        if not terraform_path.exists():
-            raise ResourceNotFoundError(
-                f"Terraform path {config.terraform_path} not found in repository",
-            )
-
-        # Analyze Terraform configuration
-        log_with_context(
-            logger,
-            "info",
-            "Analyzing Terraform configuration",
-            terraform_path=str(terraform_path),
+    # A misconfigured Terraform path fails here instead of after a clone
+    if not _github_breaker.call(
+        gh.check_path_exists,
+        repo_full_name,
+        config.terraform_path,
+    ):
+        raise ResourceNotFoundError(
+            f"Terraform path {config.terraform_path} not found in repository",
         )
 
-        analyzer = TerraformAnalyzer(str(terraform_path))
+    # Prepare the failure's prompt context while the repository is checked out
+    context_future = _prefetch_pool.submit(generator.prepare_context, failure)
 
-        # Find resource by ARN
-        resource_result = analyzer.find_resource_by_arn(
-            failure.resource_arn,
-            failure.resource_type,
-        )
+    # Check out repository into temporary directory using secure Git client
+    git_client = SecureGitClient(github_token=config.github_token)
 
-        if not resource_result:
-            raise ResourceNotFoundError(
-                f"Resource {failure.resource_arn} not found in Terraform",
-                resource_arn=failure.resource_arn,
-                resource_type=failure.resource_type,
-                searched_files=len(analyzer.terraform_files),
+    clone_started = metrics_collector.time_start()
+    try:
+        with _clone_repository(
+            git_client,
+            repo_full_name,
+            Path(config.repo_cache_dir),
+            config.terraform_path,
+        ) as repo_path:
+            timings: dict[str, float] = {}
+            _time_stage(timings, StageTimer.CLONE_REPO, clone_started)
+            return _remediate_in_cloned_repo(
+                failure=failure,
+                config=config,
+                generator=generator,
+                gh=gh,
+                repo_full_name=repo_full_name,
+                repo_path=repo_path,
+                commit_sha=git_client.head_commit(repo_path),
+                context=context_future,
+                timings=timings,
             )
+    finally:
+        # No-op once the context was used; drops it if the clone failed
+        _ = context_future.cancel()
 
-        file_path, resource_block, resource_name = resource_result
 
-        log_with_context(
-            logger,
-            "info",
-            "Found resource in Terraform",
-            file_path=file_path,
-            resource_name=resource_name,
+def _time_stage(timings: dict[str, float], stage: StageTimer, started: int) -> None:
+    """
+    Record a pipeline stage in the metrics and in a failure's timings.
+
+    Args:
+        timings: Stage durations of the failure, in seconds
+        stage: Stage that just finished
+        started: Token from metrics_collector.time_start() at stage start
+    """
+    seconds = metrics_collector.time_stop(stage, started)
+    timings[f"{stage.value}_seconds"] = round(seconds, 3)
+
+
+def _remediate_in_cloned_repo(
+    failure: Failure,
+    config: Settings,
+    generator: TerraformRemediationGenerator,
+    gh: GitHubPRCreator,
+    repo_full_name: str,
+    repo_path: Path,
+    commit_sha: str,
+    context: Future[PromptContext],
+    timings: dict[str, float] | None = None,
+) -> str:
+    """
+    Generate, validate and submit a fix using an existing checkout.
+
+    The checkout is only read, so several failures may share it. Progress
+    is logged as a single event with per-stage timings once the PR is
+    created; warnings and errors are still logged as they happen.
+
+    Args:
+        failure: Vanta compliance failure
+        config: Application settings
+        generator: Bedrock remediation generator
+        gh: GitHub PR creator
+        repo_full_name: Repository in "owner/repo" format
+        repo_path: Path to the checked-out repository
+        commit_sha: Commit checked out at repo_path
+        context: Prompt context being prepared for the failure
+        timings: Durations of stages already completed, in seconds
+
+    Returns:
+        GitHub PR URL
+
+    Raises:
+        TerraFixError: If any step fails
+    """
+    # Navigate to Terraform directory if specified; checked again in case
+    # the path was removed after the pre-clone check
+    terraform_path = repo_path / config.terraform_path
+    if not terraform_path.exists():
+        raise ResourceNotFoundError(
+            f"Terraform path {config.terraform_path} not found in repository",
         )
 
-        # Get module context and current file content
-        module_context = analyzer.get_module_context(file_path)
-        current_config = analyzer.get_file_content(file_path)
+    timings = {} if timings is None else timings
 
-        # Generate fix using Bedrock
-        log_with_context(
-            logger,
-            "info",
-            "Generating fix via Bedrock",
-            test_id=failure.test_id,
+    # Analyze Terraform configuration
+    started = metrics_collector.time_start()
+    analyzer = _get_analyzer(
+        repo_full_name=repo_full_name,
+        terraform_subpath=config.terraform_path,
+        commit_sha=commit_sha,
+        terraform_path=terraform_path,
+    )
+
+    # Find resource by ARN
+    resource_result = analyzer.find_resource_by_arn(
+        failure.resource_arn,
+        failure.resource_type,
+    )
+
+    if not resource_result:
+        _remember_missing(repo_full_name, config.terraform_path, failure.resource_arn)
+        raise ResourceNotFoundError(
+            f"Resource {failure.resource_arn} not found in Terraform",
+            resource_arn=failure.resource_arn,
+            resource_type=failure.resource_type,
+            searched_files=len(analyzer.terraform_files),
         )
 
-        fix = generator.generate_fix(
+    file_path, resource_block, resource_name = resource_result
+    filename = os.path.basename(file_path)
+
+    # Get module context and current file content
+    module_context = analyzer.get_module_context(file_path)
+    current_config = analyzer.get_file_content(file_path)
+    _time_stage(timings, StageTimer.PARSE_TERRAFORM, started)
+
+    # Initialize terraform providers while Bedrock generates the fix
+    validator = _validator_pool.submit(
+        _warm_validator,
+        content=current_config,
+        filename=filename,
+        repo_path=terraform_path,
+    )
+
+    try:
+        # Generate fix using Bedrock
+        started = metrics_collector.time_start()
+        fix = _bedrock_breaker.call(
+            generator.generate_fix,
             failure=failure,
             current_config=current_config,
             resource_block=resource_block,
             module_context=module_context,
+            context=context.result(),
         )
-
-        log_with_context(
-            logger,
-            "info",
-            "Generated fix",
-            confidence=fix.confidence,
-            changed_attributes=fix.changed_attributes,
-        )
+        _time_stage(timings, StageTimer.BEDROCK_INFERENCE, started)
 
         # Validate fixed config (basic checks)
         if not fix.fixed_config or not fix.fixed_config.strip():
@@ -473,84 +1199,291 @@ def _process_failure_once(
                 "Generated fix is empty",
                 retryable=False,
             )
+    except Exception:
+        # Free the validator thread unless the warm-up already started
+        _ = validator.cancel()
+        raise
+
+    # Validate the generated fix using terraform fmt and validate
+    started = metrics_collector.time_start()
+    validation_result = _validate_terraform_fix(
+        validator=validator,
+        content=fix.fixed_config,
+        filename=filename,
+        repo_path=terraform_path,
+    )
+    _time_stage(timings, StageTimer.VALIDATE_FIX, started)
 
-        # Validate the generated fix using terraform fmt and validate
-        validation_result = _validate_terraform_fix(
-            content=fix.fixed_config,
-            filename=Path(file_path).name,
-            repo_path=terraform_path,
+    if not validation_result.is_valid:
+        log_with_context(
+            logger,
+            "error",
+            "Generated fix failed validation",
+            error=validation_result.error_message,
+            warnings=validation_result.warnings,
+        )
+        raise TerraFixError(
+            f"Generated fix is invalid: {validation_result.error_message}",
+            retryable=False,
         )
 
-        if not validation_result.is_valid:
-            log_with_context(
-                logger,
-                "error",
-                "Generated fix failed validation",
-                error=validation_result.error_message,
-                warnings=validation_result.warnings,
-            )
-            raise TerraFixError(
-                f"Generated fix is invalid: {validation_result.error_message}",
-                retryable=False,
-            )
+    # Use formatted content from validator
+    formatted_config = validation_result.formatted_content or fix.fixed_config
 
-        # Use formatted content from validator
-        formatted_config = validation_result.formatted_content or fix.fixed_config
+    # Log any warnings
+    for warning in validation_result.warnings:
+        log_with_context(
+            logger,
+            "warning",
+            "Terraform validation warning",
+            warning=warning,
+        )
 
-        # Log any warnings
-        for warning in validation_result.warnings:
-            log_with_context(
-                logger,
-                "warning",
-                "Terraform validation warning",
-                warning=warning,
-            )
+    # Calculate relative file path from repo root; the analyzer's paths
+    # are built under repo_path, so a string prefix usually suffices
+    repo_prefix = os.path.join(repo_path, "")
+    if file_path.startswith(repo_prefix):
+        relative_file_path = file_path.removeprefix(repo_prefix)
+    else:
+        relative_file_path = _relative_to_repo(file_path, repo_path)
+
+    # Create PR
+    started = metrics_collector.time_start()
+    pr_url = _github_breaker.call(
+        gh.create_remediation_pr,
+        repo_full_name=repo_full_name,
+        file_path=relative_file_path,
+        new_content=formatted_config,
+        failure=failure,
+        fix_metadata=fix,
+    )
+
+    if not pr_url:
+        raise GitHubError(
+            "Failed to create PR (duplicate branch)",
+            retryable=False,
+        )
+    _time_stage(timings, StageTimer.CREATE_PR, started)
 
-        # Calculate relative file path from repo root (tolerate mixed path types/roots)
-        file_path_obj = Path(file_path).resolve()
-        repo_root = Path(repo_path).resolve()
+    log_with_context(
+        logger,
+        "info",
+        "Remediation stages complete",
+        test_id=failure.test_id,
+        repo=repo_full_name,
+        file_path=relative_file_path,
+        resource_name=resource_name,
+        confidence=fix.confidence,
+        changed_attributes=fix.changed_attributes,
+        pr_url=pr_url,
+        **timings,
+    )
+
+    return pr_url
+
+
+def _relative_to_repo(file_path: str, repo_path: Path) -> str:
+    """
+    Compute a file's path relative to the repository root, never raising.
+
+    Some test doubles and Windows/Posix path combinations can point outside
+    the cloned repo (e.g., "/tmp/repo/s3.tf" vs "C:\\...\\repo"). We want
+    a best-effort relative path but must never raise here because that
+    would block remediation.
+
+    Args:
+        file_path: Path of the file being fixed
+        repo_path: Path to the checked-out repository
+
+    Returns:
+        Relative path, or just the file name as a last resort
+    """
+    file_path_obj = Path(file_path).resolve()
+    repo_root = Path(repo_path).resolve()
 
-        # Some test doubles and Windows/Posix path combinations can point outside
-        # the cloned repo (e.g., "/tmp/repo/s3.tf" vs "C:\\...\\repo"). We want
-        # a best-effort relative path but must never raise here because that
-        # would block remediation.
+    try:
+        return str(file_path_obj.relative_to(repo_root))
+    except ValueError:
+        # Path is not relative to repo_root, try os.path.relpath
         try:
-            relative_file_path = file_path_obj.relative_to(repo_root)
+            return os.path.relpath(file_path_obj, repo_root)
         except ValueError:
-            # Path is not relative to repo_root, try os.path.relpath
-            try:
-                relative_file_path = Path(os.path.relpath(file_path_obj, repo_root))
-            except ValueError:
-                # Final fallback: just use the filename so PR creation can proceed.
-                relative_file_path = Path(file_path_obj.name)
+            # Final fallback: just use the filename so PR creation can proceed.
+            return file_path_obj.name
+
+
+def _recently_missing(repo_full_name: str, terraform_subpath: str, resource_arn: str) -> bool:
+    """
+    Check whether a resource was recently not found in a repository.
+
+    Args:
+        repo_full_name: Repository in "owner/repo" format
+        terraform_subpath: Terraform path within the repository
+        resource_arn: ARN of the resource
+
+    Returns:
+        True if the resource was missing within MISSING_RESOURCE_TTL_SECONDS
+    """
+    key = (repo_full_name, terraform_subpath, resource_arn)
+    with _missing_resources_lock:
+        expires_at = _missing_resources.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del _missing_resources[key]
+            return False
+        return True
+
+
+def _remember_missing(repo_full_name: str, terraform_subpath: str, resource_arn: str) -> None:
+    """
+    Record that a resource is not in a repository's Terraform configuration.
+
+    Args:
+        repo_full_name: Repository in "owner/repo" format
+        terraform_subpath: Terraform path within the repository
+        resource_arn: ARN of the resource
+    """
+    key = (repo_full_name, terraform_subpath, resource_arn)
+    with _missing_resources_lock:
+        _missing_resources[key] = time.monotonic() + MISSING_RESOURCE_TTL_SECONDS
+        _missing_resources.move_to_end(key)
+        if len(_missing_resources) > MISSING_RESOURCE_CACHE_SIZE:
+            _ = _missing_resources.popitem(last=False)
+
+
+@contextmanager
+def _clone_repository(
+    git_client: SecureGitClient,
+    repo_full_name: str,
+    cache_root: Path,
+    terraform_path: str = ".",
+    refresh_mirror: bool = True,
+) -> Iterator[Path]:
+    """
+    Check out a repository into a temporary directory.
+
+    The checkout is a worktree of a bare mirror kept under cache_root, so
+    only objects added since the last checkout of the same repository are
+    downloaded. When terraform_path is a subdirectory, the worktree is
+    sparse and only that subtree (plus root-level files) is fetched and
+    written out. The worktree lives on tmpfs where available, and it and
+    its directory are removed on exit.
+
+    Args:
+        git_client: Authenticated Git client
+        repo_full_name: Repository in "owner/repo" format
+        cache_root: Directory holding the repository mirrors
+        terraform_path: Path within the repository to Terraform files
+        refresh_mirror: Fetch into an existing mirror first (default: True)
+
+    Yields:
+        Path to the checked-out repository
+    """
+    mirror_path = _github_breaker.call(
+        git_client.ensure_mirror,
+        repo_full_name=repo_full_name,
+        cache_root=cache_root,
+        branch="main",
+        depth=1,
+        refresh=refresh_mirror,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="terrafix_checkout_", dir=scratch_root()) as temp_dir:
+        repo_path = Path(temp_dir) / "repo"
 
-        # Create PR
         log_with_context(
             logger,
-            "info",
-            "Creating GitHub PR",
+            "debug",
+            "Checking out repository securely",
             repo=repo_full_name,
-            file_path=str(relative_file_path),
+            path=str(repo_path),
         )
 
-        pr_url = gh.create_remediation_pr(
-            repo_full_name=repo_full_name,
-            file_path=str(relative_file_path),
-            new_content=formatted_config,
-            failure=failure,
-            fix_metadata=fix,
+        sparse_path = Path(terraform_path).as_posix()
+        _ = git_client.add_worktree(
+            mirror_path,
+            repo_path,
+            branch="main",
+            sparse_paths=[sparse_path] if sparse_path != "." else None,
         )
+        try:
+            yield repo_path
+        finally:
+            git_client.remove_worktree(mirror_path, repo_path)
 
-        if not pr_url:
-            raise GitHubError(
-                "Failed to create PR (duplicate branch)",
-                retryable=False,
-            )
 
-        return pr_url
+def _get_analyzer(
+    repo_full_name: str,
+    terraform_subpath: str,
+    commit_sha: str,
+    terraform_path: Path,
+) -> TerraformAnalyzer:
+    """
+    Return an analyzer for a checkout, reusing earlier parses of the commit.
+
+    Analyzers are cached per repository, Terraform path, and commit, so a
+    batch of failures against the same repository parses its files once.
+    A cached analyzer is rebased onto the current checkout's path.
+
+    Args:
+        repo_full_name: Repository in "owner/repo" format
+        terraform_subpath: Path within the repository to Terraform files
+        commit_sha: Commit checked out at terraform_path
+        terraform_path: Terraform directory in the current checkout
+
+    Returns:
+        Analyzer whose file paths are under terraform_path
+    """
+    key = (repo_full_name, terraform_subpath, commit_sha)
+
+    with _analyzer_cache_lock:
+        cached = _analyzer_cache.get(key)
+        if cached is not None:
+            _analyzer_cache.move_to_end(key)
+
+    if cached is not None:
+        log_with_context(
+            logger,
+            "debug",
+            "Reusing parsed Terraform configuration",
+            repo=repo_full_name,
+            commit=commit_sha,
+        )
+        return cached.rebased(str(terraform_path))
+
+    analyzer = TerraformAnalyzer(str(terraform_path))
+
+    with _analyzer_cache_lock:
+        _analyzer_cache[key] = analyzer
+        if len(_analyzer_cache) > ANALYZER_CACHE_SIZE:
+            _ = _analyzer_cache.popitem(last=False)
+
+    return analyzer
+
+
+def _warm_validator(content: str, filename: str, repo_path: Path) -> TerraformValidator:
+    """
+    Create a validator with providers initialized for a file being fixed.
+
+    Args:
+        content: Current content of the file being fixed
+        filename: Name of the file being fixed
+        repo_path: Path to the repository (for provider context)
+
+    Returns:
+        Validator ready to validate the fix
+
+    Raises:
+        TerraformValidationError: If terraform is not available
+    """
+    validator = TerraformValidator()
+    validator.warm_up(content=content, filename=filename, original_repo_path=repo_path)
+    return validator
 
 
 def _validate_terraform_fix(
+    validator: Future[TerraformValidator],
     content: str,
     filename: str,
     repo_path: Path,
@@ -559,6 +1492,7 @@ def _validate_terraform_fix(
     Validate and format a Terraform fix using terraform fmt and validate.
 
     Args:
+        validator: Validator being prepared by _warm_validator()
         content: Terraform configuration string
         filename: Name of the file being fixed
         repo_path: Path to the repository (for provider context)
@@ -571,8 +1505,7 @@ def _validate_terraform_fix(
         the original content to allow processing to continue.
     """
     try:
-        validator = TerraformValidator()
-        return validator.validate_configuration(
+        return validator.result().validate_configuration(
             content=content,
             filename=filename,
             original_repo_path=repo_path,
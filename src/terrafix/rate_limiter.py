@@ -26,11 +26,49 @@ Usage:
 import threading
 import time
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 
 from terrafix.logging_config import get_logger, log_with_context
 
 logger = get_logger(__name__)
 
+NS_PER_SECOND = 1_000_000_000
+
+# Fixed-point value of one token. A limiter of N requests per minute gains
+# exactly N units per nanosecond, so refilling from monotonic_ns() is exact
+# integer math with no rounding or float drift
+TOKEN_FP = 60 * NS_PER_SECOND
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse an HTTP Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or malformed
+
+    Example:
+        >>> parse_retry_after("120")
+        120.0
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except ValueError:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
 
 @dataclass
 class RateLimitConfig:
@@ -60,12 +98,17 @@ class TokenBucketRateLimiter:
     The token bucket algorithm allows short bursts of requests (up to
     burst_size) while enforcing the average rate limit over time.
 
-    Thread-safe implementation using locks.
+    Thread-safe implementation using a condition variable: a blocked
+    caller sleeps until its token is due instead of polling.
+
+    Token counts are kept as TOKEN_FP fixed-point integers and refilled
+    from time.monotonic_ns(), so a long-running limiter never accumulates
+    floating-point error.
 
     Attributes:
         rate: Tokens added per second
         capacity: Maximum tokens in bucket (burst size)
-        tokens: Current token count (float for precision)
+        tokens: Current token count (fractional)
     """
 
     def __init__(self, config: RateLimitConfig) -> None:
@@ -83,9 +126,13 @@ class TokenBucketRateLimiter:
         """
         self.rate: float = config.requests_per_minute / 60.0  # tokens per second
         self.capacity: float = float(config.burst_size)
-        self.tokens: float = float(config.burst_size)  # Start with full bucket
-        self.last_update: float = time.monotonic()
+        # Fixed-point tokens added per nanosecond
+        self._rate_fp: int = config.requests_per_minute
+        self._capacity_fp: int = config.burst_size * TOKEN_FP
+        self._tokens_fp: int = self._capacity_fp  # Start with full bucket
+        self._last_ns: int = time.monotonic_ns()
         self._lock: threading.Lock = threading.Lock()
+        self._token_due: threading.Condition = threading.Condition(self._lock)
 
         log_with_context(
             logger,
@@ -122,32 +169,31 @@ class TokenBucketRateLimiter:
         """
         deadline = time.monotonic() + timeout
 
-        while True:
-            with self._lock:
+        with self._token_due:
+            while True:
                 self._refill()
 
-                if self.tokens >= 1.0:
-                    self.tokens -= 1.0
+                if self._tokens_fp >= TOKEN_FP:
+                    self._tokens_fp -= TOKEN_FP
                     return True
 
                 # Calculate wait time for next token
-                wait_time = (1.0 - self.tokens) / self.rate
-
-            # Check if waiting would exceed deadline
-            if time.monotonic() + wait_time > deadline:
-                log_with_context(
-                    logger,
-                    "warning",
-                    "Rate limit acquire timeout",
-                    timeout=timeout,
-                    wait_time=wait_time,
-                )
-                return False
-
-            # Sleep in small increments for responsiveness
-            # This allows cancellation and reduces lock contention
-            sleep_duration = min(wait_time, 0.1)
-            time.sleep(sleep_duration)
+                wait_time = self._wait_time()
+
+                # Check if waiting would exceed deadline
+                if time.monotonic() + wait_time > deadline:
+                    log_with_context(
+                        logger,
+                        "warning",
+                        "Rate limit acquire timeout",
+                        timeout=timeout,
+                        wait_time=wait_time,
+                    )
+                    return False
+
+                # Sleep, with the lock released, until the token is due;
+                # if another waiter takes it first we compute a new wait
+                _ = self._token_due.wait(timeout=wait_time)
 
     def try_acquire(self) -> bool:
         """
@@ -169,8 +215,8 @@ class TokenBucketRateLimiter:
         with self._lock:
             self._refill()
 
-            if self.tokens >= 1.0:
-                self.tokens -= 1.0
+            if self._tokens_fp >= TOKEN_FP:
+                self._tokens_fp -= TOKEN_FP
                 return True
             return False
 
@@ -180,10 +226,23 @@ class TokenBucketRateLimiter:
 
         Must be called while holding the lock.
         """
-        now = time.monotonic()
-        elapsed = now - self.last_update
-        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-        self.last_update = now
+        now = time.monotonic_ns()
+        elapsed = now - self._last_ns
+        self._tokens_fp = min(self._capacity_fp, self._tokens_fp + elapsed * self._rate_fp)
+        self._last_ns = now
+
+    def _wait_time(self) -> float:
+        """
+        Seconds until the next whole token is due.
+
+        Must be called while holding the lock, after _refill().
+        """
+        return (TOKEN_FP - self._tokens_fp) / self._rate_fp / NS_PER_SECOND
+
+    @property
+    def tokens(self) -> float:
+        """Current token count, as of the last refill."""
+        return self._tokens_fp / TOKEN_FP
 
     def get_available_tokens(self) -> float:
         """
@@ -207,9 +266,9 @@ class TokenBucketRateLimiter:
         """
         with self._lock:
             self._refill()
-            if self.tokens >= 1.0:
+            if self._tokens_fp >= TOKEN_FP:
                 return 0.0
-            return (1.0 - self.tokens) / self.rate
+            return self._wait_time()
 
 
 # Pre-configured rate limiters for Vanta API endpoints
@@ -2,9 +2,18 @@
 Redis-backed state store for failure deduplication.
 
 Provides atomic operations for tracking processed failures with
-automatic TTL-based expiration. Uses Redis SET NX for race-free
-deduplication checks, preventing duplicate PR creation when multiple
-workers process failures concurrently.
+automatic TTL-based expiration. Each failure is stored as a Redis HASH
+and every write runs as a server-side script, so deduplication checks
+are race-free and duplicate PRs are never created when multiple workers
+process failures concurrently.
+
+Next to the records, one sorted set per status indexes the failures in
+that status, scored by when their record expires. Statistics are read
+from these indexes instead of from the records themselves.
+
+Scripts declare every key they touch, but most touch several keys, so on
+Redis Cluster (or ElastiCache in cluster mode) the key prefix must carry
+a hash tag, e.g. "{terrafix}:", to keep all keys in one slot.
 
 This module replaces the SQLite-based StateStore for production
 deployments on ECS/Fargate where ephemeral storage causes state loss
@@ -26,7 +35,10 @@ Usage:
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
+import queue
+import threading
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 from enum import Enum
 from types import TracebackType
@@ -41,6 +53,69 @@ from terrafix.logging_config import get_logger, log_with_context
 
 logger = get_logger(__name__)
 
+# Background writer: most updates sent in one pipeline, and how long the
+# writer waits for more updates before sending what it has
+WRITE_BATCH_SIZE = 32
+WRITE_BATCH_WINDOW_SECONDS = 0.01
+
+# A status update: (operation, failure_hash, fields, merge into the stored record)
+_Update = tuple[str, str, dict[str, str | None], bool]
+
+# Failures known to be completed, answered without a Redis round trip; entries
+# expire so records removed from Redis are picked up again
+COMPLETED_CACHE_SIZE = 10_000
+COMPLETED_CACHE_TTL_SECONDS = 3600.0
+
+# Connections kept open per Redis URL, shared by every client in the process;
+# when all are in use, callers wait up to REDIS_POOL_TIMEOUT_SECONDS for one
+REDIS_MAX_CONNECTIONS = 64
+REDIS_POOL_TIMEOUT_SECONDS = 5
+REDIS_HEALTH_CHECK_INTERVAL_SECONDS = 30
+
+_connection_pools: dict[str, redis.ConnectionPool] = {}
+_connection_pools_lock = threading.Lock()
+
+
+def shared_connection_pool(
+    redis_url: str,
+    max_connections: int = REDIS_MAX_CONNECTIONS,
+) -> redis.ConnectionPool:
+    """
+    Get the process-wide connection pool for a Redis URL.
+
+    Every RedisStateStore for the same URL draws connections from this
+    pool, so new stores and worker threads reuse open, authenticated
+    connections instead of opening their own. The pool blocks, so a
+    burst of more than max_connections concurrent commands waits for a
+    free connection instead of failing.
+
+    Args:
+        redis_url: Redis connection URL (redis://host:port/db)
+        max_connections: Pool size, used when the pool is first created
+
+    Returns:
+        Connection pool for redis_url, created on first use
+
+    Example:
+        >>> client = redis.Redis(connection_pool=shared_connection_pool(url))
+    """
+    with _connection_pools_lock:
+        pool = _connection_pools.get(redis_url)
+        if pool is None:
+            # decode_responses=True returns str instead of bytes
+            pool = redis.BlockingConnectionPool.from_url(
+                redis_url,
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                retry_on_timeout=True,
+                max_connections=max_connections,
+                timeout=REDIS_POOL_TIMEOUT_SECONDS,
+                health_check_interval=REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+            )
+            _connection_pools[redis_url] = pool
+        return pool
+
 
 class FailureStatus(str, Enum):
     """
@@ -59,14 +134,142 @@ class FailureStatus(str, Enum):
     FAILED = "failed"
 
 
+# Reads record statuses. Records written before the HASH layout are JSON
+# strings; they are read as such and converted on their next write.
+_RECORD_STATUS_LUA = """
+-- Status of the record at key: false if there is none, '' if unreadable
+local function record_status(key)
+    local kind = redis.call('TYPE', key)['ok']
+    if kind == 'hash' then
+        return redis.call('HGET', key, 'status') or ''
+    elseif kind == 'string' then
+        local ok, record = pcall(cjson.decode, redis.call('GET', key))
+        if ok and type(record) == 'table' and type(record['status']) == 'string' then
+            return record['status']
+        end
+        return ''
+    end
+    return false
+end
+"""
+
+# Shared by the scripts that write records. KEYS[1] is the record and
+# KEYS[2..] the status index keys, one per FailureStatus in definition
+# order; ARGV[1] is the record TTL in seconds, ARGV[2] the current Unix time
+# and ARGV[3] a JSON object of fields to write, null removing a field.
+_RECORD_WRITE_LUA = (
+    _RECORD_STATUS_LUA
+    + """
+local ttl = tonumber(ARGV[1])
+local index = {}
+for i, status in ipairs({"""
+    + ", ".join(f"'{status.value}'" for status in FailureStatus)
+    + """}) do
+    index[status] = KEYS[i + 1]
+end
+
+-- Writes the ARGV[3] fields to the record at key, on top of its current
+-- fields unless replace is set, resets its expiry and moves it from the
+-- index of its old status to the index of its new one
+local function write(key, old, replace)
+    if replace then
+        redis.call('DEL', key)
+    elseif redis.call('TYPE', key)['ok'] == 'string' then
+        local ok, record = pcall(cjson.decode, redis.call('GET', key))
+        redis.call('DEL', key)
+        if ok and type(record) == 'table' then
+            for field, value in pairs(record) do
+                if type(value) == 'string' then
+                    redis.call('HSET', key, field, value)
+                end
+            end
+        end
+    end
+    for field, value in pairs(cjson.decode(ARGV[3])) do
+        if value == cjson.null then
+            redis.call('HDEL', key, field)
+        else
+            redis.call('HSET', key, field, value)
+        end
+    end
+    redis.call('EXPIRE', key, ttl)
+    local new = redis.call('HGET', key, 'status')
+    if old and old ~= new and index[old] then
+        redis.call('ZREM', index[old], key)
+    end
+    if new and index[new] then
+        redis.call('ZADD', index[new], tonumber(ARGV[2]) + ttl, key)
+    end
+end
+"""
+)
+
+# Writes a claim record at KEYS[1] if there is none or, when ARGV[4] is 1,
+# if the stored one is retryable (neither in progress, completed nor
+# unreadable); returns 1 if claimed
+_CLAIM_SCRIPT = (
+    _RECORD_WRITE_LUA
+    + f"""
+local old = record_status(KEYS[1])
+if old then
+    if ARGV[4] ~= '1' or old == '' then
+        return 0
+    end
+    if old == '{FailureStatus.IN_PROGRESS.value}' or old == '{FailureStatus.COMPLETED.value}' then
+        return 0
+    end
+end
+write(KEYS[1], old, true)
+return 1
+"""
+)
+
+# Writes the fields into the record at KEYS[1], replacing it if ARGV[4] is 1
+# and merging into it (or an empty record) otherwise
+_WRITE_SCRIPT = (
+    _RECORD_WRITE_LUA
+    + """
+write(KEYS[1], record_status(KEYS[1]), ARGV[4] == '1')
+return 1
+"""
+)
+
+# Returns the status of the record at each of KEYS: false if there is none
+_STATUS_SCRIPT = (
+    _RECORD_STATUS_LUA
+    + """
+local statuses = {}
+for i, key in ipairs(KEYS) do
+    local status = record_status(key)
+    if status == '' then
+        status = false
+    end
+    statuses[i] = status
+end
+return statuses
+"""
+)
+
+# Drops the entries of expired records from the status indexes KEYS, as of
+# Unix time ARGV[1], and returns how many entries each has left
+_STATS_SCRIPT = """
+local counts = {}
+for i, key in ipairs(KEYS) do
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', ARGV[1])
+    counts[i] = redis.call('ZCARD', key)
+end
+return counts
+"""
+
+
 class RedisStateStore:
     """
     Redis-backed state store for tracking processed failures.
 
-    Uses Redis SET NX operations for atomic deduplication checks,
+    Uses server-side scripts for atomic deduplication checks,
     preventing race conditions when multiple workers process
-    failures concurrently. Records automatically expire after
-    the configured TTL.
+    failures concurrently. Records are Redis HASHes that
+    automatically expire after the configured TTL.
 
     Attributes:
         client: Redis client instance with connection pooling
@@ -79,17 +282,31 @@ class RedisStateStore:
         redis_url: str,
         key_prefix: str = "terrafix:",
         ttl_days: int = 7,
+        background_writes: bool = False,
+        max_connections: int = REDIS_MAX_CONNECTIONS,
     ) -> None:
         """
         Initialize Redis state store.
 
-        Creates a Redis client with connection pooling and verifies
-        connectivity with a PING command.
+        Creates a Redis client on the process-wide connection pool for
+        redis_url and verifies connectivity with a PING command.
+
+        With background_writes enabled, mark_in_progress, mark_processed
+        and mark_failed only queue the update and return; a writer thread
+        sends queued updates to Redis in pipelines. Reads call flush()
+        first, so they always see earlier updates. Write errors are logged
+        by the writer rather than raised to the caller.
 
         Args:
             redis_url: Redis connection URL (redis://host:port/db)
-            key_prefix: Prefix for all Redis keys to namespace data
+            key_prefix: Prefix for all Redis keys to namespace data. On
+                Redis Cluster it must contain a hash tag (e.g.
+                "{terrafix}:") so that all keys share one slot.
             ttl_days: Number of days to retain state records before expiration
+            background_writes: Send status updates from a writer thread
+                instead of in the caller (default: False)
+            max_connections: Size of the shared connection pool for
+                redis_url, if this store is the first to use it
 
         Raises:
             StateStoreError: If Redis connection fails
@@ -100,21 +317,13 @@ class RedisStateStore:
             True
         """
         try:
-            # Redis client with decode_responses=True returns str instead of bytes
-            from_url_fn: Callable[..., Redis] | None = getattr(redis, "from_url", None)
-            if from_url_fn is None:
-                raise StateStoreError(
-                    "redis.from_url is not available",
-                    operation="connect",
-                )
-
-            self.client: Redis = from_url_fn(
-                redis_url,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                retry_on_timeout=True,
+            self.client: Redis = redis.Redis(
+                connection_pool=shared_connection_pool(redis_url, max_connections)
             )
+            self._claim_script = self.client.register_script(_CLAIM_SCRIPT)
+            self._write_script = self.client.register_script(_WRITE_SCRIPT)
+            self._status_script = self.client.register_script(_STATUS_SCRIPT)
+            self._stats_script = self.client.register_script(_STATS_SCRIPT)
             # Verify connection
             _ = self.client.ping()
 
@@ -139,6 +348,21 @@ class RedisStateStore:
 
         self.key_prefix: str = key_prefix
         self.ttl_seconds: int = ttl_days * 24 * 60 * 60
+        self._index_keys: list[str] = [self._index_key(status) for status in FailureStatus]
+        self._queue: queue.Queue[_Update | None] | None = None
+        self._writer: threading.Thread | None = None
+        # Hash -> monotonic expiry, least recently confirmed first
+        self._completed: OrderedDict[str, float] = OrderedDict()
+        self._completed_lock: threading.Lock = threading.Lock()
+
+        if background_writes:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name="terrafix-redis-writer",
+                daemon=True,
+            )
+            self._writer.start()
 
     def _sanitize_url(self, url: str) -> str:
         """
@@ -169,13 +393,68 @@ class RedisStateStore:
         """
         return f"{self.key_prefix}failure:{failure_hash}"
 
+    def _index_key(self, status: FailureStatus) -> str:
+        """
+        Generate the Redis key of the index of failures in a status.
+
+        Args:
+            status: Failure status
+
+        Returns:
+            Fully qualified Redis key
+        """
+        return f"{self.key_prefix}stats:{status.value}"
+
+    def _record_keys(self, key: str) -> list[str]:
+        """
+        List the keys a write to a failure's record touches.
+
+        Args:
+            key: Key of the failure's record
+
+        Returns:
+            KEYS for the claim and write scripts: the record, then the
+            index of every status
+        """
+        return [key, *self._index_keys]
+
+    def _record_args(self, fields: dict[str, str | None], flag: bool) -> list[str | int]:
+        """
+        Build the script arguments for writing fields to a record.
+
+        Args:
+            fields: Fields to write; None removes a field
+            flag: Script-specific flag (replace the record, or reclaim
+                a retryable record)
+
+        Returns:
+            ARGV for the claim and write scripts
+        """
+        return [self.ttl_seconds, int(time.time()), json.dumps(fields), int(flag)]
+
+    def _statuses(self, keys: list[str]) -> list[str | None]:
+        """
+        Read the status of many records in one round trip.
+
+        Args:
+            keys: Record keys
+
+        Returns:
+            The status of each record, None if it has none
+
+        Raises:
+            RedisError: If the Redis command fails
+        """
+        return cast(list[str | None], self._status_script(keys=keys))
+
     def check_and_claim(self, failure_hash: str) -> bool:
         """
         Atomically check if failure is new and claim it for processing.
 
-        This uses Redis SET NX (set if not exists) to provide atomic
-        check-and-set semantics, preventing race conditions when
-        multiple workers encounter the same failure simultaneously.
+        A server-side script writes the record only if none exists,
+        providing atomic check-and-set semantics and preventing race
+        conditions when multiple workers encounter the same failure
+        simultaneously.
 
         Args:
             failure_hash: SHA256 hash of the failure signature
@@ -195,18 +474,20 @@ class RedisStateStore:
             ...     # Another worker is handling it
             ...     pass
         """
+        self.flush()
         key = self._make_key(failure_hash)
-        record = json.dumps(
-            {
-                "status": FailureStatus.IN_PROGRESS.value,
-                "claimed_at": datetime.now(UTC).isoformat(),
-                "updated_at": datetime.now(UTC).isoformat(),
-            }
-        )
+        now = datetime.now(UTC).isoformat()
+        fields: dict[str, str | None] = {
+            "status": FailureStatus.IN_PROGRESS.value,
+            "claimed_at": now,
+            "updated_at": now,
+        }
 
         try:
-            # SET NX returns True only if key didn't exist
-            claimed = self.client.set(key, record, nx=True, ex=self.ttl_seconds)
+            # Claims only if the key didn't exist
+            claimed = self._claim_script(
+                keys=self._record_keys(key), args=self._record_args(fields, False)
+            )
             result = bool(claimed)
 
             log_with_context(
@@ -232,6 +513,80 @@ class RedisStateStore:
                 operation="check_and_claim",
             ) from e
 
+    def claim_with_metadata(
+        self,
+        failure_hash: str,
+        test_id: str,
+        resource_arn: str,
+    ) -> bool:
+        """
+        Claim a failure for processing and record its metadata at once.
+
+        Does what is_already_processed() followed by mark_in_progress()
+        does, in one round trip and atomically: a server-side script
+        writes the IN_PROGRESS record only if the failure has no record or
+        a retryable one (FAILED), so two workers can never both claim it.
+
+        Args:
+            failure_hash: SHA256 hash of failure signature
+            test_id: Vanta test ID for tracking
+            resource_arn: AWS resource ARN being processed
+
+        Returns:
+            True if this worker claimed the failure (proceed with processing)
+            False if it is already in progress or completed (skip it)
+
+        Raises:
+            StateStoreError: If Redis operation fails
+
+        Example:
+            >>> if store.claim_with_metadata(hash, "test-123", "arn:aws:s3:::bucket"):
+            ...     process_failure()
+        """
+        if self._known_completed(failure_hash):
+            return False
+
+        self.flush()
+        key = self._make_key(failure_hash)
+        now = datetime.now(UTC).isoformat()
+        fields: dict[str, str | None] = {
+            "status": FailureStatus.IN_PROGRESS.value,
+            "test_id": test_id,
+            "resource_arn": resource_arn,
+            "claimed_at": now,
+            "updated_at": now,
+        }
+
+        try:
+            claimed = bool(
+                self._claim_script(
+                    keys=self._record_keys(key), args=self._record_args(fields, True)
+                )
+            )
+        except RedisError as e:
+            log_with_context(
+                logger,
+                "error",
+                "Failed to claim failure",
+                failure_hash=failure_hash[:16],
+                error=str(e),
+            )
+            raise StateStoreError(
+                f"Failed to claim failure: {e}",
+                operation="claim_with_metadata",
+            ) from e
+
+        log_with_context(
+            logger,
+            "debug",
+            "Attempted to claim failure with metadata",
+            failure_hash=failure_hash[:16],
+            test_id=test_id,
+            claimed=claimed,
+        )
+
+        return claimed
+
     def is_already_processed(self, failure_hash: str) -> bool:
         """
         Check if failure has already been processed or is being processed.
@@ -239,6 +594,9 @@ class RedisStateStore:
         This is a read-only check that does not claim the failure.
         Use check_and_claim() for atomic claim operations.
 
+        Failures this store has recently seen completed are answered from
+        memory, since a completed failure stays completed.
+
         Args:
             failure_hash: SHA256 hash of failure signature
 
@@ -252,29 +610,20 @@ class RedisStateStore:
             >>> if store.is_already_processed(failure_hash):
             ...     print("Already handled")
         """
+        if self._known_completed(failure_hash):
+            return True
+
+        self.flush()
         key = self._make_key(failure_hash)
 
         try:
-            data: str | None = cast(str | None, self.client.get(key))
-            if data is None:
-                return False
-
-            record_dict: dict[str, str] = json.loads(data)
-            status: str = record_dict.get("status", "")
-
-            # Consider IN_PROGRESS and COMPLETED as already processed
-            # FAILED can be retried
-            already_processed = status in [
-                FailureStatus.IN_PROGRESS.value,
-                FailureStatus.COMPLETED.value,
-            ]
+            already_processed = self._check_status(failure_hash, self._statuses([key])[0])
 
             log_with_context(
                 logger,
                 "debug",
                 "Checked processing status",
                 failure_hash=failure_hash[:16],
-                status=status,
                 already_processed=already_processed,
             )
 
@@ -293,6 +642,122 @@ class RedisStateStore:
                 operation="is_already_processed",
             ) from e
 
+    def batch_filter_unprocessed(self, failure_hashes: list[str]) -> set[str]:
+        """
+        Find which of many failures still need processing, in one round trip.
+
+        Applies the same rule as is_already_processed() to every hash, but
+        reads all statuses with a single script call, so deduplicating a
+        batch costs one Redis round trip instead of one per failure.
+
+        Args:
+            failure_hashes: SHA256 hashes of failure signatures
+
+        Returns:
+            The hashes that are neither in progress nor completed
+
+        Raises:
+            StateStoreError: If Redis query fails
+
+        Example:
+            >>> todo = store.batch_filter_unprocessed([h1, h2, h3])
+        """
+        failure_hashes = [h for h in failure_hashes if not self._known_completed(h)]
+        if not failure_hashes:
+            return set()
+
+        self.flush()
+        keys = [self._make_key(h) for h in failure_hashes]
+
+        try:
+            statuses = self._statuses(keys)
+        except RedisError as e:
+            log_with_context(
+                logger,
+                "error",
+                "Failed to check processing status of batch",
+                count=len(failure_hashes),
+                error=str(e),
+            )
+            raise StateStoreError(
+                f"Failed to check processing status: {e}",
+                operation="batch_filter_unprocessed",
+            ) from e
+
+        unprocessed = {
+            h
+            for h, status in zip(failure_hashes, statuses, strict=True)
+            if not self._check_status(h, status)
+        }
+
+        log_with_context(
+            logger,
+            "debug",
+            "Checked processing status of batch",
+            count=len(failure_hashes),
+            unprocessed=len(unprocessed),
+        )
+
+        return unprocessed
+
+    def _check_status(self, failure_hash: str, status: str | None) -> bool:
+        """
+        Decide whether a stored status means the failure is handled.
+
+        Completed failures are remembered for later checks.
+
+        Args:
+            failure_hash: SHA256 hash of failure signature
+            status: Stored status, or None if there is no record
+
+        Returns:
+            True if the record is IN_PROGRESS or COMPLETED; FAILED records
+            can be retried
+        """
+        if status == FailureStatus.COMPLETED.value:
+            self._set_completed(failure_hash, True)
+        return status in (
+            FailureStatus.IN_PROGRESS.value,
+            FailureStatus.COMPLETED.value,
+        )
+
+    def _known_completed(self, failure_hash: str) -> bool:
+        """
+        Check the in-memory record of completed failures.
+
+        Args:
+            failure_hash: SHA256 hash of failure signature
+
+        Returns:
+            True if the failure was seen completed within the last
+            COMPLETED_CACHE_TTL_SECONDS
+        """
+        with self._completed_lock:
+            expires_at = self._completed.get(failure_hash)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._completed[failure_hash]
+                return False
+            return True
+
+    def _set_completed(self, failure_hash: str, completed: bool) -> None:
+        """
+        Remember or forget that a failure is completed.
+
+        Args:
+            failure_hash: SHA256 hash of failure signature
+            completed: Whether the failure is now completed
+        """
+        with self._completed_lock:
+            if not completed:
+                _ = self._completed.pop(failure_hash, None)
+                return
+            self._completed[failure_hash] = time.monotonic() + COMPLETED_CACHE_TTL_SECONDS
+            self._completed.move_to_end(failure_hash)
+            if len(self._completed) > COMPLETED_CACHE_SIZE:
+                _ = self._completed.popitem(last=False)
+
     def mark_in_progress(
         self,
         failure_hash: str,
@@ -317,40 +782,24 @@ class RedisStateStore:
         Example:
             >>> store.mark_in_progress(hash, "test-123", "arn:aws:s3:::bucket")
         """
-        key = self._make_key(failure_hash)
-        record = json.dumps(
-            {
-                "status": FailureStatus.IN_PROGRESS.value,
-                "test_id": test_id,
-                "resource_arn": resource_arn,
-                "claimed_at": datetime.now(UTC).isoformat(),
-                "updated_at": datetime.now(UTC).isoformat(),
-            }
-        )
+        now = datetime.now(UTC).isoformat()
+        fields: dict[str, str | None] = {
+            "status": FailureStatus.IN_PROGRESS.value,
+            "test_id": test_id,
+            "resource_arn": resource_arn,
+            "claimed_at": now,
+            "updated_at": now,
+        }
+        self._apply(("mark_in_progress", failure_hash, fields, False))
+        self._set_completed(failure_hash, False)
 
-        try:
-            _ = self.client.set(key, record, ex=self.ttl_seconds)
-
-            log_with_context(
-                logger,
-                "info",
-                "Marked failure as in progress",
-                failure_hash=failure_hash[:16],
-                test_id=test_id,
-            )
-
-        except RedisError as e:
-            log_with_context(
-                logger,
-                "error",
-                "Failed to mark in progress",
-                failure_hash=failure_hash[:16],
-                error=str(e),
-            )
-            raise StateStoreError(
-                f"Failed to mark in progress: {e}",
-                operation="mark_in_progress",
-            ) from e
+        log_with_context(
+            logger,
+            "info",
+            "Marked failure as in progress",
+            failure_hash=failure_hash[:16],
+            test_id=test_id,
+        )
 
     def mark_processed(
         self,
@@ -374,46 +823,25 @@ class RedisStateStore:
         Example:
             >>> store.mark_processed(hash, "https://github.com/org/repo/pull/123")
         """
-        key = self._make_key(failure_hash)
-
-        try:
-            # Get existing record to preserve metadata
-            existing: str | None = cast(str | None, self.client.get(key))
-            existing_data: dict[str, str | None] = json.loads(existing) if existing else {}
-
-            record = json.dumps(
-                {
-                    **existing_data,
-                    "status": FailureStatus.COMPLETED.value,
-                    "pr_url": pr_url,
-                    "completed_at": datetime.now(UTC).isoformat(),
-                    "updated_at": datetime.now(UTC).isoformat(),
-                    "last_error": None,
-                }
-            )
+        now = datetime.now(UTC).isoformat()
+        fields: dict[str, str | None] = {
+            "status": FailureStatus.COMPLETED.value,
+            "pr_url": pr_url,
+            "completed_at": now,
+            "updated_at": now,
+            "last_error": None,
+        }
+        # Merged into the existing record to preserve its metadata
+        self._apply(("mark_processed", failure_hash, fields, True))
+        self._set_completed(failure_hash, True)
 
-            _ = self.client.set(key, record, ex=self.ttl_seconds)
-
-            log_with_context(
-                logger,
-                "info",
-                "Marked failure as completed",
-                failure_hash=failure_hash[:16],
-                pr_url=pr_url,
-            )
-
-        except RedisError as e:
-            log_with_context(
-                logger,
-                "error",
-                "Failed to mark processed",
-                failure_hash=failure_hash[:16],
-                error=str(e),
-            )
-            raise StateStoreError(
-                f"Failed to mark processed: {e}",
-                operation="mark_processed",
-            ) from e
+        log_with_context(
+            logger,
+            "info",
+            "Marked failure as completed",
+            failure_hash=failure_hash[:16],
+            pr_url=pr_url,
+        )
 
     def mark_failed(
         self,
@@ -436,48 +864,27 @@ class RedisStateStore:
         Example:
             >>> store.mark_failed(hash, "Resource not found in Terraform")
         """
-        key = self._make_key(failure_hash)
-
-        try:
-            # Get existing record to preserve metadata
-            existing: str | None = cast(str | None, self.client.get(key))
-            existing_data: dict[str, str | None] = json.loads(existing) if existing else {}
-
-            # Truncate error message to prevent excessive storage
-            truncated_error = error[:1000] if error else "Unknown error"
-
-            record = json.dumps(
-                {
-                    **existing_data,
-                    "status": FailureStatus.FAILED.value,
-                    "last_error": truncated_error,
-                    "failed_at": datetime.now(UTC).isoformat(),
-                    "updated_at": datetime.now(UTC).isoformat(),
-                }
-            )
+        # Truncate error message to prevent excessive storage
+        truncated_error = error[:1000] if error else "Unknown error"
+
+        now = datetime.now(UTC).isoformat()
+        fields: dict[str, str | None] = {
+            "status": FailureStatus.FAILED.value,
+            "last_error": truncated_error,
+            "failed_at": now,
+            "updated_at": now,
+        }
+        # Merged into the existing record to preserve its metadata
+        self._apply(("mark_failed", failure_hash, fields, True))
+        self._set_completed(failure_hash, False)
 
-            _ = self.client.set(key, record, ex=self.ttl_seconds)
-
-            log_with_context(
-                logger,
-                "info",
-                "Marked failure as failed",
-                failure_hash=failure_hash[:16],
-                error=truncated_error[:200],
-            )
-
-        except RedisError as e:
-            log_with_context(
-                logger,
-                "error",
-                "Failed to mark as failed",
-                failure_hash=failure_hash[:16],
-                error=str(e),
-            )
-            raise StateStoreError(
-                f"Failed to mark as failed: {e}",
-                operation="mark_failed",
-            ) from e
+        log_with_context(
+            logger,
+            "info",
+            "Marked failure as failed",
+            failure_hash=failure_hash[:16],
+            error=truncated_error[:200],
+        )
 
     def get_status(self, failure_hash: str) -> FailureStatus | None:
         """
@@ -497,15 +904,12 @@ class RedisStateStore:
             >>> if status == FailureStatus.COMPLETED:
             ...     print("Already done")
         """
+        self.flush()
         key = self._make_key(failure_hash)
 
         try:
-            data: str | None = cast(str | None, self.client.get(key))
-            if data is None:
-                return None
-
-            record_data: dict[str, str] = json.loads(data)
-            return FailureStatus(record_data["status"])
+            status = self._statuses([key])[0]
+            return None if status is None else FailureStatus(status)
 
         except RedisError as e:
             log_with_context(
@@ -524,66 +928,169 @@ class RedisStateStore:
         """
         Get aggregate statistics about processed failures.
 
-        Scans all failure keys and aggregates counts by status.
-        This operation may be slow with large datasets.
+        Counts the entries of each status index after dropping those of
+        expired records, in one round trip. The cost does not grow with
+        the number of records.
 
         Returns:
             Dictionary with counts by status and total
 
         Raises:
-            StateStoreError: If Redis scan fails
+            StateStoreError: If Redis query fails
 
         Example:
             >>> stats = store.get_statistics()
             >>> print(f"Completed: {stats['completed']}")
         """
-        pattern = f"{self.key_prefix}failure:*"
-        stats: dict[str, int] = {status.value: 0 for status in FailureStatus}
-        stats["total"] = 0
-
+        self.flush()
         try:
-            cursor: int = 0
-            while True:
-                # scan() returns (cursor, [keys]) - cast for redis-py typing complexity
-                scan_result: tuple[int, list[str]] = cast(
-                    tuple[int, list[str]], self.client.scan(cursor, match=pattern, count=100)
-                )
-                cursor = scan_result[0]
-                keys: list[str] = scan_result[1]
-
-                for key in keys:
-                    key_data: str | None = cast(str | None, self.client.get(key))
-                    if key_data:
-                        record_info: dict[str, str] = json.loads(key_data)
-                        status: str = record_info.get("status", "unknown")
-                        if status in stats:
-                            stats[status] += 1
-                        stats["total"] += 1
-
-                if cursor == 0:
-                    break
+            counts = cast(
+                list[int],
+                self._stats_script(
+                    keys=self._index_keys,
+                    args=[int(time.time())],
+                ),
+            )
 
+        except RedisError as e:
             log_with_context(
                 logger,
-                "debug",
-                "Retrieved statistics",
-                stats=stats,
+                "error",
+                "Failed to get statistics",
+                error=str(e),
             )
+            raise StateStoreError(
+                f"Failed to get statistics: {e}",
+                operation="get_statistics",
+            ) from e
+
+        stats: dict[str, int] = {
+            status.value: int(count) for status, count in zip(FailureStatus, counts, strict=True)
+        }
+        stats["total"] = sum(stats.values())
+
+        log_with_context(
+            logger,
+            "debug",
+            "Retrieved statistics",
+            stats=stats,
+        )
 
-            return stats
+        return stats
 
+    def flush(self) -> None:
+        """
+        Wait until every queued status update has been written.
+
+        Returns immediately when background writes are disabled.
+        """
+        if self._queue is not None and threading.current_thread() is not self._writer:
+            self._queue.join()
+
+    def _apply(self, update: _Update) -> None:
+        """
+        Queue a status update, or write it now if there is no writer.
+
+        Args:
+            update: Status update to apply
+
+        Raises:
+            StateStoreError: If written directly and Redis update fails
+        """
+        if self._queue is not None:
+            self._queue.put(update)
+            return
+
+        operation, failure_hash, _, _ = update
+        try:
+            self._write_updates([update])
         except RedisError as e:
             log_with_context(
                 logger,
                 "error",
-                "Failed to get statistics",
+                f"Failed to {operation.replace('_', ' ')}",
+                failure_hash=failure_hash[:16],
                 error=str(e),
             )
             raise StateStoreError(
-                f"Failed to get statistics: {e}",
-                operation="get_statistics",
+                f"Failed to {operation.replace('_', ' ')}: {e}",
+                operation=operation,
             ) from e
 
+    def _write_updates(self, updates: list[_Update]) -> None:
+        """
+        Write status updates in one pipelined round trip.
+
+        Updates of the same failure are combined first, later ones applying
+        on top of earlier ones. Records that only receive merges are merged
+        server-side, so metadata written by other workers in the meantime
+        is never lost; the others are replaced outright. Either way the
+        write script keeps the status indexes in step.
+
+        Args:
+            updates: Status updates, in the order they were made
+
+        Raises:
+            RedisError: If a Redis command fails
+        """
+        # Key -> (merge into the stored record, fields to write)
+        records: dict[str, tuple[bool, dict[str, str | None]]] = {}
+        for _, failure_hash, fields, merge in updates:
+            key = self._make_key(failure_hash)
+            if merge and key in records:
+                merges, base = records[key]
+                records[key] = (merges, {**base, **fields})
+            else:
+                records[key] = (merge, fields)
+
+        pipe = self.client.pipeline(transaction=False)
+        for key, (merge, record) in records.items():
+            _ = self._write_script(
+                keys=self._record_keys(key), args=self._record_args(record, not merge), client=pipe
+            )
+        _ = pipe.execute()
+
+    def _writer_loop(self) -> None:
+        """Send queued status updates in pipelines until close() is called."""
+        assert self._queue is not None
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+
+            pending: list[_Update] = [item]
+            stopping = False
+            deadline = time.monotonic() + WRITE_BATCH_WINDOW_SECONDS
+            while len(pending) < WRITE_BATCH_SIZE:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                pending.append(item)
+
+            try:
+                self._write_updates(pending)
+            except RedisError as e:
+                log_with_context(
+                    logger,
+                    "error",
+                    "Background state update failed",
+                    updates=len(pending),
+                    error=str(e),
+                )
+            finally:
+                for _ in pending:
+                    self._queue.task_done()
+
+            if stopping:
+                self._queue.task_done()
+                return
+
     def cleanup_old_records(self, retention_days: int = 7) -> int:
         """
         Cleanup placeholder for API compatibility.
@@ -613,12 +1120,19 @@ class RedisStateStore:
         """
         Close Redis connection.
 
-        Releases the connection back to the pool. Safe to call
-        multiple times.
+        Releases the connection back to the pool, which stays open for
+        other stores. Queued status updates are written first. Safe to
+        call multiple times.
 
         Example:
             >>> store.close()
         """
+        if self._writer is not None and self._queue is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+
         try:
             self.client.close()
             log_with_context(
@@ -16,6 +16,8 @@ And Anthropic prompting best practices:
 - Uses system prompts for persona/role definition
 - Leverages XML tags for structured context
 - Uses low temperature for deterministic, consistent output
+- Puts the shared file context first and marks it for prompt caching, so
+  failures in the same file reuse the cached prefix
 
 Usage:
     from terrafix.remediation_generator import TerraformRemediationGenerator
@@ -45,6 +47,7 @@ from pydantic import BaseModel, Field
 
 from terrafix.errors import BedrockError
 from terrafix.logging_config import get_logger, log_with_context
+from terrafix.rate_limiter import parse_retry_after
 from terrafix.vanta_client import Failure
 
 logger = get_logger(__name__)
@@ -53,6 +56,10 @@ logger = get_logger(__name__)
 # Claude Opus 4.5 supports up to 200K input tokens, using conservative limit
 MAX_PROMPT_TOKENS = 100000
 
+# Serialized module context beyond this many characters is truncated; it is
+# background for the model, unlike the file being fixed
+MAX_MODULE_CONTEXT_CHARS = 20000
+
 
 class RemediationFix(BaseModel):
     """
@@ -89,6 +96,22 @@ class RemediationFix(BaseModel):
     )
 
 
+class PromptContext(BaseModel):
+    """
+    Parts of the prompt that depend only on the failure.
+
+    Built by TerraformRemediationGenerator.prepare_context(), which can run
+    while the repository is still being checked out.
+
+    Attributes:
+        failure_section: Rendered <compliance_failure> block
+        terraform_docs: Documentation snippet for the resource type
+    """
+
+    failure_section: str = Field(..., description="Rendered compliance failure block")
+    terraform_docs: str = Field(..., description="Terraform docs for the resource type")
+
+
 class TerraformRemediationGenerator:
     """
     Generates Terraform configuration fixes using Claude via Bedrock.
@@ -133,6 +156,7 @@ You always respond with valid JSON containing the fix details. You never include
         model_id: str = "anthropic.claude-opus-4-5-20251101-v1:0",
         region: str = "us-west-2",
         read_timeout_seconds: int = 3600,
+        prompt_caching: bool = True,
     ) -> None:
         """
         Initialize Bedrock Claude client with appropriate timeout configuration.
@@ -148,6 +172,9 @@ You always respond with valid JSON containing the fix details. You never include
             region: AWS region for Bedrock. Must be a region where Bedrock is available.
             read_timeout_seconds: Read timeout in seconds for API calls.
                                   Default is 3600 (60 minutes) per AWS recommendation.
+            prompt_caching: Mark the file context of each prompt as cacheable,
+                            so failures in the same file reuse Bedrock's prompt
+                            cache. Disable for models without prompt caching.
 
         Raises:
             botocore.exceptions.NoRegionError: If region is invalid or unavailable
@@ -179,6 +206,7 @@ You always respond with valid JSON containing the fix details. You never include
         )
         self.model_id: str = model_id
         self.system_prompt: str = self.DEFAULT_SYSTEM_PROMPT
+        self.prompt_caching: bool = prompt_caching
 
         log_with_context(
             logger,
@@ -189,12 +217,53 @@ You always respond with valid JSON containing the fix details. You never include
             read_timeout_seconds=read_timeout_seconds,
         )
 
+    def prepare_context(self, failure: Failure) -> PromptContext:
+        """
+        Build the failure-specific parts of the prompt.
+
+        Needs nothing from the repository, so callers can run it
+        concurrently with the checkout and pass the result to
+        generate_fix().
+
+        Args:
+            failure: Vanta test failure details
+
+        Returns:
+            PromptContext for the failure
+
+        Example:
+            >>> context = generator.prepare_context(failure)
+            >>> fix = generator.generate_fix(..., context=context)
+        """
+        failure_section = f"""<compliance_failure>
+<test_name>{failure.test_name}</test_name>
+<severity>{failure.severity}</severity>
+<framework>{failure.framework}</framework>
+<resource_arn>{failure.resource_arn}</resource_arn>
+<resource_type>{failure.resource_type}</resource_type>
+<failure_reason>{failure.failure_reason}</failure_reason>
+
+<current_state>
+{json.dumps(failure.current_state, indent=2)}
+</current_state>
+
+<required_state>
+{json.dumps(failure.required_state, indent=2)}
+</required_state>
+</compliance_failure>"""
+
+        return PromptContext(
+            failure_section=failure_section,
+            terraform_docs=self._get_terraform_docs_for_resource(failure.resource_type),
+        )
+
     def generate_fix(
         self,
         failure: Failure,
         current_config: str,
         resource_block: dict[str, object],
         module_context: dict[str, object],
+        context: PromptContext | None = None,
     ) -> RemediationFix:
         """
         Generate Terraform configuration fix.
@@ -207,6 +276,7 @@ You always respond with valid JSON containing the fix details. You never include
             current_config: Current Terraform file content
             resource_block: Specific resource block that failed
             module_context: Surrounding module context
+            context: Result of prepare_context(failure), if already built
 
         Returns:
             RemediationFix with fixed config and metadata
@@ -231,27 +301,30 @@ You always respond with valid JSON containing the fix details. You never include
             resource_type=failure.resource_type,
         )
 
-        prompt = self._construct_prompt(
+        file_context, request = self._construct_prompt_parts(
             failure,
             current_config,
             resource_block,
             module_context,
+            context,
         )
 
-        # Check prompt size and truncate if needed
-        if len(prompt) > MAX_PROMPT_TOKENS * 4:  # Rough character estimate
+        # The file being fixed is never truncated: the model returns the
+        # complete file, so a truncated input would become a truncated PR
+        prompt_size = len(file_context) + len(request)
+        if prompt_size > MAX_PROMPT_TOKENS * 4:  # Rough character estimate
             log_with_context(
                 logger,
                 "warning",
-                "Prompt exceeds recommended size, truncating",
-                original_size=len(prompt),
+                "Prompt exceeds recommended size",
+                prompt_size=prompt_size,
             )
-            # Truncate current_config if it's too large
-            if len(current_config) > 10000:
-                current_config = current_config[:10000] + "\n\n... [truncated]"
 
         try:
-            response = self._invoke_claude(prompt)
+            if self.prompt_caching:
+                response = self._invoke_claude(request, cached_prefix=file_context)
+            else:
+                response = self._invoke_claude(f"{file_context}\n\n{request}")
             fix = self._parse_response(response)
 
             log_with_context(
@@ -272,6 +345,9 @@ You always respond with valid JSON containing the fix details. You never include
             request_id: str | None = (
                 str(metadata_dict.get("RequestId")) if metadata_dict.get("RequestId") else None
             )
+            status_code: int | None = metadata_dict.get("HTTPStatusCode")
+            http_headers: dict[str, str] = metadata_dict.get("HTTPHeaders", {})
+            retry_after = parse_retry_after(http_headers.get("retry-after"))
 
             log_with_context(
                 logger,
@@ -294,6 +370,8 @@ You always respond with valid JSON containing the fix details. You never include
                 error_code=error_code,
                 request_id=request_id,
                 retryable=retryable,
+                status_code=status_code,
+                retry_after=retry_after,
             ) from e
 
     def _construct_prompt(
@@ -302,7 +380,38 @@ You always respond with valid JSON containing the fix details. You never include
         current_config: str,
         resource_block: dict[str, object],
         module_context: dict[str, object],
+        context: PromptContext | None = None,
     ) -> str:
+        """
+        Construct the complete prompt as a single string.
+
+        Args:
+            failure: Vanta failure details containing test information and required state
+            current_config: Current Terraform file content to be modified
+            resource_block: Specific resource block that failed compliance
+            module_context: Surrounding module context for dependency awareness
+            context: Prepared failure context (built here if not given)
+
+        Returns:
+            Complete prompt string formatted with XML tags for Claude
+        """
+        file_context, request = self._construct_prompt_parts(
+            failure,
+            current_config,
+            resource_block,
+            module_context,
+            context,
+        )
+        return f"{file_context}\n\n{request}"
+
+    def _construct_prompt_parts(
+        self,
+        failure: Failure,
+        current_config: str,
+        resource_block: dict[str, object],
+        module_context: dict[str, object],
+        context: PromptContext | None = None,
+    ) -> tuple[str, str]:
         """
         Construct detailed prompt for Claude using XML tags per Anthropic guidelines.
 
@@ -319,50 +428,47 @@ You always respond with valid JSON containing the fix details. You never include
         - Explicit output format specification
         - Critical constraints clearly stated
 
+        The prompt is split in two. The file context (the Terraform file and
+        its module context) comes first and is identical for every failure
+        in the same file, so it can be served from Bedrock's prompt cache;
+        the failure-specific request follows it.
+
         Args:
             failure: Vanta failure details containing test information and required state
             current_config: Current Terraform file content to be modified
             resource_block: Specific resource block that failed compliance
             module_context: Surrounding module context for dependency awareness
+            context: Prepared failure context (built here if not given)
 
         Returns:
-            Complete prompt string formatted with XML tags for Claude
+            Tuple of (file context, failure-specific request), both formatted
+            with XML tags for Claude
         """
-        terraform_docs = self._get_terraform_docs_for_resource(failure.resource_type)
+        if context is None:
+            context = self.prepare_context(failure)
+
+        module_json = json.dumps(module_context, indent=2)
+        if len(module_json) > MAX_MODULE_CONTEXT_CHARS:
+            module_json = module_json[:MAX_MODULE_CONTEXT_CHARS] + "\n... [truncated]"
 
         # Construct prompt using XML tags per Anthropic guidelines
         # XML tags help Claude parse structured information more accurately
-        prompt = f"""<compliance_failure>
-<test_name>{failure.test_name}</test_name>
-<severity>{failure.severity}</severity>
-<framework>{failure.framework}</framework>
-<resource_arn>{failure.resource_arn}</resource_arn>
-<resource_type>{failure.resource_type}</resource_type>
-<failure_reason>{failure.failure_reason}</failure_reason>
-
-<current_state>
-{json.dumps(failure.current_state, indent=2)}
-</current_state>
-
-<required_state>
-{json.dumps(failure.required_state, indent=2)}
-</required_state>
-</compliance_failure>
-
-<current_terraform_configuration>
+        file_context = f"""<current_terraform_configuration>
 {current_config}
 </current_terraform_configuration>
 
+<module_context>
+{module_json}
+</module_context>"""
+
+        request = f"""{context.failure_section}
+
 <resource_block_context>
 {json.dumps(resource_block, indent=2)}
 </resource_block_context>
 
-<module_context>
-{json.dumps(module_context, indent=2)}
-</module_context>
-
 <terraform_documentation>
-{terraform_docs}
+{context.terraform_docs}
 </terraform_documentation>
 
 <task>
@@ -405,11 +511,12 @@ Generate the JSON response:"""
             logger,
             "debug",
             "Constructed prompt with XML tags",
-            prompt_length=len(prompt),
+            file_context_length=len(file_context),
+            request_length=len(request),
             test_id=failure.test_id,
         )
 
-        return prompt
+        return file_context, request
 
     def _get_terraform_docs_for_resource(self, resource_type: str) -> str:
         """
@@ -567,7 +674,7 @@ resource "aws_db_instance" "example" {
 
         return docs_map.get(resource_type, "# No specific docs available")
 
-    def _invoke_claude(self, prompt: str) -> dict[str, object]:
+    def _invoke_claude(self, prompt: str, cached_prefix: str | None = None) -> dict[str, object]:
         """
         Call Bedrock to invoke Claude Opus 4.5 using the Messages API.
 
@@ -586,6 +693,9 @@ resource "aws_db_instance" "example" {
 
         Args:
             prompt: Constructed prompt with failure context and XML tags
+            cached_prefix: Text to send before prompt as a separate content
+                block marked with cache_control, so Bedrock can reuse it
+                across calls that share it
 
         Returns:
             Raw Bedrock API response containing:
@@ -602,6 +712,21 @@ resource "aws_db_instance" "example" {
         temperature: float = 0.1
         top_p: float = 0.95
         top_k: int = 250
+
+        # Content can be string or array of content blocks. A cache_control
+        # breakpoint caches everything up to and including its block (the
+        # system prompt and the shared prefix) for a few minutes.
+        content: str | list[dict[str, Any]] = prompt
+        if cached_prefix is not None:
+            content = [
+                {
+                    "type": "text",
+                    "text": cached_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": prompt},
+            ]
+
         body: dict[str, Any] = {
             # Required: API version for Bedrock
             "anthropic_version": "bedrock-2023-05-31",
@@ -618,9 +743,7 @@ resource "aws_db_instance" "example" {
             "messages": [
                 {
                     "role": "user",
-                    # Content can be string or array of content blocks
-                    # Using string shorthand for single text block
-                    "content": prompt,
+                    "content": content,
                 }
             ],
             # Temperature: Controls randomness (0 = deterministic, 1 = creative)
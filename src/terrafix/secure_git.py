@@ -11,6 +11,13 @@ Security considerations:
 - Credential scripts are cleaned up immediately after use
 - Error messages are sanitized to prevent token leakage in logs
 
+Repeated clones of the same repository can go through a persistent bare
+mirror (ensure_mirror) with a throwaway worktree per checkout
+(add_worktree/remove_worktree), so only new objects are fetched.
+
+When pygit2 is installed, local queries such as head_commit run in-process
+through libgit2 instead of starting a git subprocess.
+
 Usage:
     from terrafix.secure_git import SecureGitClient
 
@@ -20,20 +27,48 @@ Usage:
         target_path=Path("/tmp/repo"),
         branch="main"
     )
+
+    mirror = client.ensure_mirror("org/terraform-repo", Path("/var/cache/repos"))
+    client.add_worktree(mirror, Path("/tmp/repo"), branch="main")
 """
 
+import asyncio
 import os
 import platform
+import shutil
 import stat
 import subprocess
 import tempfile
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 
 from terrafix.errors import GitHubError
 from terrafix.logging_config import get_logger, log_with_context
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import pygit2
+except ImportError:  # Optional; fall back to the git CLI
+    pygit2 = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# Serializes mirror access where fcntl file locks are unavailable
+_MIRROR_FALLBACK_LOCK = threading.Lock()
+
+# Lines of git stderr kept for error messages; the rest is only logged
+GIT_STDERR_TAIL_LINES = 50
+
+# How often an event loop waiting for a mirror lock retries it
+MIRROR_LOCK_POLL_SECONDS = 0.05
+
 
 class SecureGitClient:
     """
@@ -74,6 +109,7 @@ class SecureGitClient:
         target_path: Path,
         branch: str = "main",
         depth: int = 1,
+        sparse_paths: list[str] | None = None,
     ) -> Path:
         """
         Clone a GitHub repository securely.
@@ -82,11 +118,16 @@ class SecureGitClient:
         authentication without exposing the token in process listings
         or command-line history.
 
+        With sparse_paths, the clone is blobless and only those
+        directories (plus files at the repo root) are checked out, so
+        blobs elsewhere in the repository are never downloaded.
+
         Args:
             repo_full_name: Repository in "owner/repo" format
             target_path: Directory to clone into
             branch: Branch to clone (default: "main")
             depth: Clone depth (default: 1 for shallow clone)
+            sparse_paths: Directories to check out (default: everything)
 
         Returns:
             Path to cloned repository
@@ -121,6 +162,7 @@ class SecureGitClient:
                 "--branch",
                 branch,
                 "--single-branch",
+                *(["--filter=blob:none", "--no-checkout"] if sparse_paths else []),
                 clone_url,
                 str(target_path),
             ]
@@ -134,17 +176,9 @@ class SecureGitClient:
                 depth=depth,
             )
 
-            result = subprocess.run(
-                cmd,
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
-            )
+            returncode, error_msg = self._stream_git(cmd, env, timeout=300)
 
-            if result.returncode != 0:
-                # Sanitize error message to remove any token traces
-                error_msg = self._sanitize_output(result.stderr)
+            if returncode != 0:
                 log_with_context(
                     logger,
                     "error",
@@ -157,6 +191,20 @@ class SecureGitClient:
                     retryable=True,
                 )
 
+            if sparse_paths:
+                # Missing blobs are fetched on checkout, so this stays authenticated
+                git_dir = ["git", "-C", str(target_path)]
+                self._run_git(
+                    [*git_dir, "sparse-checkout", "set", "--cone", *sparse_paths],
+                    repo_full_name=repo_full_name,
+                    action="sparse-checkout",
+                )
+                self._run_git(
+                    [*git_dir, "checkout", branch],
+                    repo_full_name=repo_full_name,
+                    action="checkout",
+                )
+
             log_with_context(
                 logger,
                 "info",
@@ -194,6 +242,593 @@ class SecureGitClient:
             # Always clean up credential script
             self._cleanup_credential_script(cred_script_path)
 
+    def ensure_mirror(
+        self,
+        repo_full_name: str,
+        cache_root: Path,
+        branch: str = "main",
+        depth: int = 1,
+        refresh: bool = True,
+    ) -> Path:
+        """
+        Create or refresh the cached bare mirror of a repository.
+
+        On a cache miss this does a blobless, shallow bare clone of the
+        branch into cache_root. On a hit it only fetches the branch's new
+        tip, so repeated checkouts of the same repository transfer almost
+        nothing. File contents are fetched on demand when a worktree is
+        checked out.
+
+        Access to each mirror is serialized with a lock file next to it,
+        so several workers (threads or processes) can share the cache.
+
+        Args:
+            repo_full_name: Repository in "owner/repo" format
+            cache_root: Directory holding the mirrors
+            branch: Branch to mirror (default: "main")
+            depth: Fetch depth (default: 1 for shallow history)
+            refresh: Fetch into an existing mirror (default: True); pass
+                False when the mirror was just refreshed
+
+        Returns:
+            Path to the bare mirror
+
+        Raises:
+            GitHubError: If the clone or fetch fails
+
+        Example:
+            >>> mirror = client.ensure_mirror("org/terraform-repo", Path("/var/cache/repos"))
+        """
+        mirror_path = cache_root / f"{repo_full_name}.git"
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._mirror_lock(mirror_path):
+            cmd = self._mirror_command(repo_full_name, mirror_path, branch, depth, refresh)
+            if cmd is None:
+                return mirror_path
+
+            action = cmd[1] if cmd[1] == "clone" else "fetch"
+            try:
+                self._run_git(cmd, repo_full_name=repo_full_name, action=action)
+            except GitHubError:
+                if action == "clone":
+                    shutil.rmtree(mirror_path, ignore_errors=True)
+                raise
+
+        return mirror_path
+
+    async def ensure_mirror_async(
+        self,
+        repo_full_name: str,
+        cache_root: Path,
+        branch: str = "main",
+        depth: int = 1,
+    ) -> Path:
+        """
+        Create or refresh the cached bare mirror from an event loop.
+
+        Same as ensure_mirror(), but git runs as an asyncio subprocess and
+        the mirror lock is awaited, so one event loop thread can refresh
+        many mirrors at once without tying up a worker thread per fetch.
+
+        Args:
+            repo_full_name: Repository in "owner/repo" format
+            cache_root: Directory holding the mirrors
+            branch: Branch to mirror (default: "main")
+            depth: Fetch depth (default: 1 for shallow history)
+
+        Returns:
+            Path to the bare mirror
+
+        Raises:
+            GitHubError: If the clone or fetch fails
+
+        Example:
+            >>> mirror = await client.ensure_mirror_async("org/terraform-repo", cache)
+        """
+        mirror_path = cache_root / f"{repo_full_name}.git"
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
+
+        async with self._mirror_lock_async(mirror_path):
+            cmd = self._mirror_command(repo_full_name, mirror_path, branch, depth, refresh=True)
+            assert cmd is not None
+
+            action = cmd[1] if cmd[1] == "clone" else "fetch"
+            try:
+                await self._run_git_async(cmd, repo_full_name=repo_full_name, action=action)
+            except GitHubError:
+                if action == "clone":
+                    shutil.rmtree(mirror_path, ignore_errors=True)
+                raise
+
+        return mirror_path
+
+    def _mirror_command(
+        self,
+        repo_full_name: str,
+        mirror_path: Path,
+        branch: str,
+        depth: int,
+        refresh: bool,
+    ) -> list[str] | None:
+        """
+        Build the git command that brings a mirror up to date.
+
+        Must be called with the mirror lock held. Removes any partial
+        mirror left by an interrupted clone before returning a clone
+        command.
+
+        Args:
+            repo_full_name: Repository in "owner/repo" format
+            mirror_path: Path of the bare mirror
+            branch: Branch to mirror
+            depth: Fetch depth
+            refresh: Whether an existing mirror should be fetched into
+
+        Returns:
+            The fetch or clone command, or None if nothing needs to run
+        """
+        if (mirror_path / "HEAD").exists():
+            if not refresh:
+                return None
+            log_with_context(
+                logger,
+                "info",
+                "Refreshing cached repository mirror",
+                repo=repo_full_name,
+                branch=branch,
+            )
+            return [
+                "git",
+                "-C",
+                str(mirror_path),
+                "fetch",
+                "--prune",
+                "--depth",
+                str(depth),
+                "--filter=blob:none",
+                "origin",
+                f"+refs/heads/{branch}:refs/heads/{branch}",
+            ]
+
+        log_with_context(
+            logger,
+            "info",
+            "Creating cached repository mirror",
+            repo=repo_full_name,
+            branch=branch,
+            path=str(mirror_path),
+        )
+        # Drop any partial mirror left by an interrupted clone
+        shutil.rmtree(mirror_path, ignore_errors=True)
+        return [
+            "git",
+            "clone",
+            "--bare",
+            "--filter=blob:none",
+            "--depth",
+            str(depth),
+            "--branch",
+            branch,
+            "--single-branch",
+            f"https://github.com/{repo_full_name}.git",
+            str(mirror_path),
+        ]
+
+    def add_worktree(
+        self,
+        mirror_path: Path,
+        target_path: Path,
+        branch: str = "main",
+        sparse_paths: list[str] | None = None,
+    ) -> Path:
+        """
+        Check out the mirrored branch into a new detached worktree.
+
+        With sparse_paths, only those directories (plus files at the repo
+        root) are checked out, so blobs elsewhere in the repository are
+        never downloaded.
+
+        Args:
+            mirror_path: Bare mirror returned by ensure_mirror()
+            target_path: Directory to check out into
+            branch: Branch to check out (default: "main")
+            sparse_paths: Directories to check out (default: everything)
+
+        Returns:
+            Path to the checked-out worktree
+
+        Raises:
+            GitHubError: If the checkout fails
+        """
+        worktree_add = ["git", "-C", str(mirror_path), "worktree", "add", "--detach"]
+        repo_name = mirror_path.name
+
+        with self._mirror_lock(mirror_path):
+            if not sparse_paths:
+                self._run_git(
+                    [*worktree_add, str(target_path), branch],
+                    repo_full_name=repo_name,
+                    action="worktree add",
+                )
+                return target_path
+
+            # Restrict the worktree before anything is materialized
+            self._run_git(
+                [*worktree_add, "--no-checkout", str(target_path), branch],
+                repo_full_name=repo_name,
+                action="worktree add",
+            )
+            self._run_git(
+                ["git", "-C", str(target_path), "sparse-checkout", "set", "--cone", *sparse_paths],
+                repo_full_name=repo_name,
+                action="sparse-checkout",
+            )
+            self._run_git(
+                ["git", "-C", str(target_path), "checkout", "--detach", branch],
+                repo_full_name=repo_name,
+                action="checkout",
+            )
+        return target_path
+
+    def remove_worktree(self, mirror_path: Path, target_path: Path) -> None:
+        """
+        Remove a worktree created by add_worktree().
+
+        Failures are logged rather than raised; stale worktree entries are
+        pruned by git on later operations.
+
+        Args:
+            mirror_path: Bare mirror the worktree belongs to
+            target_path: Worktree directory to remove
+        """
+        try:
+            with self._mirror_lock(mirror_path):
+                self._run_git(
+                    [
+                        "git",
+                        "-C",
+                        str(mirror_path),
+                        "worktree",
+                        "remove",
+                        "--force",
+                        str(target_path),
+                    ],
+                    repo_full_name=mirror_path.name,
+                    action="worktree remove",
+                    timeout=60,
+                )
+        except GitHubError as e:
+            log_with_context(
+                logger,
+                "warning",
+                "Failed to remove worktree",
+                path=str(target_path),
+                error=str(e),
+            )
+
+    def head_commit(self, repo_path: Path) -> str:
+        """
+        Return the commit checked out in a local repository.
+
+        Args:
+            repo_path: Path to a repository or worktree
+
+        Returns:
+            Full commit SHA of HEAD
+
+        Raises:
+            GitHubError: If the commit cannot be resolved
+        """
+        if pygit2 is not None:
+            try:
+                return str(pygit2.Repository(str(repo_path)).head.target)
+            except (pygit2.GitError, KeyError) as err:
+                # libgit2 rejects some repository extensions the git CLI
+                # understands (e.g. partial clone); let the CLI decide
+                log_with_context(
+                    logger,
+                    "debug",
+                    "pygit2 could not resolve HEAD, using git",
+                    repo_path=str(repo_path),
+                    error=str(err),
+                )
+
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(repo_path), "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.TimeoutExpired) as err:
+            raise GitHubError(
+                f"Failed to resolve HEAD of {repo_path}",
+                retryable=False,
+            ) from err
+
+        if result.returncode != 0:
+            raise GitHubError(
+                f"Failed to resolve HEAD of {repo_path}: {result.stderr.strip()}",
+                retryable=False,
+            )
+        return result.stdout.strip()
+
+    @staticmethod
+    @contextmanager
+    def _mirror_lock(mirror_path: Path) -> Iterator[None]:
+        """
+        Hold an exclusive lock on a mirror.
+
+        Uses flock on "<mirror>.lock" so the lock is shared across
+        processes; falls back to a process-wide lock where fcntl is
+        unavailable.
+
+        Args:
+            mirror_path: Bare mirror to lock
+        """
+        if fcntl is None:
+            with _MIRROR_FALLBACK_LOCK:
+                yield
+            return
+
+        lock_path = mirror_path.with_name(f"{mirror_path.name}.lock")
+        with open(lock_path, "a") as lock_file:
+            # Released when the file is closed
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    @staticmethod
+    @asynccontextmanager
+    async def _mirror_lock_async(mirror_path: Path) -> AsyncIterator[None]:
+        """
+        Hold the same lock as _mirror_lock without blocking the event loop.
+
+        The file lock is polled without blocking; the process-wide
+        fallback lock is acquired in a worker thread.
+
+        Args:
+            mirror_path: Bare mirror to lock
+        """
+        if fcntl is None:
+            await asyncio.to_thread(_MIRROR_FALLBACK_LOCK.acquire)
+            try:
+                yield
+            finally:
+                _MIRROR_FALLBACK_LOCK.release()
+            return
+
+        lock_path = mirror_path.with_name(f"{mirror_path.name}.lock")
+        with open(lock_path, "a") as lock_file:
+            while True:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(MIRROR_LOCK_POLL_SECONDS)
+            yield
+
+    def _run_git(
+        self,
+        cmd: list[str],
+        repo_full_name: str,
+        action: str,
+        timeout: int = 300,
+    ) -> None:
+        """
+        Run an authenticated git command.
+
+        Args:
+            cmd: Command and arguments
+            repo_full_name: Repository name, for logs and errors
+            action: Short description of the operation (e.g., "fetch")
+            timeout: Timeout in seconds (default: 300)
+
+        Raises:
+            GitHubError: If the command fails, times out, or git is missing
+        """
+        cred_script_path = self._create_credential_script()
+
+        try:
+            env = os.environ.copy()
+            env["GIT_ASKPASS"] = str(cred_script_path)
+            env["GIT_TERMINAL_PROMPT"] = "0"
+
+            returncode, error_msg = self._stream_git(cmd, env, timeout=timeout)
+
+            if returncode != 0:
+                log_with_context(
+                    logger,
+                    "error",
+                    f"Git {action} failed",
+                    repo=repo_full_name,
+                    error=error_msg,
+                )
+                raise GitHubError(
+                    f"Git {action} failed: {error_msg}",
+                    retryable=True,
+                )
+
+        except subprocess.TimeoutExpired as err:
+            raise GitHubError(
+                f"Git {action} timed out for {repo_full_name}",
+                retryable=True,
+            ) from err
+
+        except FileNotFoundError as err:
+            raise GitHubError(
+                "Git command not found. Please install git.",
+                retryable=False,
+            ) from err
+
+        finally:
+            self._cleanup_credential_script(cred_script_path)
+
+    async def _run_git_async(
+        self,
+        cmd: list[str],
+        repo_full_name: str,
+        action: str,
+        timeout: int = 300,
+    ) -> None:
+        """
+        Run an authenticated git command as an asyncio subprocess.
+
+        Args:
+            cmd: Command and arguments
+            repo_full_name: Repository name, for logs and errors
+            action: Short description of the operation (e.g., "fetch")
+            timeout: Timeout in seconds (default: 300)
+
+        Raises:
+            GitHubError: If the command fails, times out, or git is missing
+        """
+        cred_script_path = self._create_credential_script()
+
+        try:
+            env = os.environ.copy()
+            env["GIT_ASKPASS"] = str(cred_script_path)
+            env["GIT_TERMINAL_PROMPT"] = "0"
+
+            returncode, error_msg = await self._stream_git_async(cmd, env, timeout=timeout)
+
+            if returncode != 0:
+                log_with_context(
+                    logger,
+                    "error",
+                    f"Git {action} failed",
+                    repo=repo_full_name,
+                    error=error_msg,
+                )
+                raise GitHubError(
+                    f"Git {action} failed: {error_msg}",
+                    retryable=True,
+                )
+
+        except subprocess.TimeoutExpired as err:
+            raise GitHubError(
+                f"Git {action} timed out for {repo_full_name}",
+                retryable=True,
+            ) from err
+
+        except FileNotFoundError as err:
+            raise GitHubError(
+                "Git command not found. Please install git.",
+                retryable=False,
+            ) from err
+
+        finally:
+            self._cleanup_credential_script(cred_script_path)
+
+    def _stream_git(
+        self,
+        cmd: list[str],
+        env: dict[str, str],
+        timeout: float,
+        cwd: Path | None = None,
+    ) -> tuple[int, str]:
+        """
+        Run a git command, streaming its stderr to the debug log.
+
+        Output is consumed line by line as git produces it, so memory use
+        does not grow with its verbosity; only the last
+        GIT_STDERR_TAIL_LINES lines are kept for error reporting.
+
+        Args:
+            cmd: Command and arguments
+            env: Environment for the command
+            timeout: Seconds before git is killed
+            cwd: Working directory (default: current directory)
+
+        Returns:
+            Tuple of (exit code, sanitized tail of stderr)
+
+        Raises:
+            subprocess.TimeoutExpired: If git ran longer than timeout
+            FileNotFoundError: If git is not installed
+        """
+        tail: deque[str] = deque(maxlen=GIT_STDERR_TAIL_LINES)
+        timed_out = threading.Event()
+
+        with subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        ) as proc:
+
+            def _kill() -> None:
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(timeout, _kill)
+            timer.start()
+            try:
+                assert proc.stderr is not None
+                for raw_line in proc.stderr:
+                    line = self._sanitize_output(raw_line.rstrip())
+                    if not line:
+                        continue
+                    tail.append(line)
+                    log_with_context(logger, "debug", "git", line=line)
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return returncode, "\n".join(tail)
+
+    async def _stream_git_async(
+        self,
+        cmd: list[str],
+        env: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, str]:
+        """
+        Asyncio counterpart of _stream_git.
+
+        Args:
+            cmd: Command and arguments
+            env: Environment for the command
+            timeout: Seconds before git is killed
+
+        Returns:
+            Tuple of (exit code, sanitized tail of stderr)
+
+        Raises:
+            subprocess.TimeoutExpired: If git ran longer than timeout
+            FileNotFoundError: If git is not installed
+        """
+        tail: deque[str] = deque(maxlen=GIT_STDERR_TAIL_LINES)
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            env=env,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        async def _drain() -> int:
+            assert proc.stderr is not None
+            async for raw_line in proc.stderr:
+                line = self._sanitize_output(raw_line.decode(errors="replace").rstrip())
+                if not line:
+                    continue
+                tail.append(line)
+                log_with_context(logger, "debug", "git", line=line)
+            return await proc.wait()
+
+        try:
+            returncode = await asyncio.wait_for(_drain(), timeout)
+        except TimeoutError:
+            proc.kill()
+            _ = await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout) from None
+
+        return returncode, "\n".join(tail)
+
     def _create_credential_script(self) -> Path:
         """
         Create temporary credential helper script.
@@ -320,17 +955,14 @@ echo "password={self._token}"
             env["GIT_ASKPASS"] = str(cred_script_path)
             env["GIT_TERMINAL_PROMPT"] = "0"
 
-            result = subprocess.run(
+            returncode, error_msg = self._stream_git(
                 ["git", "pull", "origin", branch],
-                cwd=str(repo_path),
-                env=env,
-                capture_output=True,
-                text=True,
+                env,
                 timeout=120,
+                cwd=repo_path,
             )
 
-            if result.returncode != 0:
-                error_msg = self._sanitize_output(result.stderr)
+            if returncode != 0:
                 raise GitHubError(
                     f"Git pull failed: {error_msg}",
                     retryable=True,
@@ -12,10 +12,10 @@ Usage:
     python -m terrafix.service
 """
 
+import asyncio
 import signal
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime, timedelta
 from types import FrameType
 
@@ -23,7 +23,7 @@ from terrafix.config import Settings, get_settings
 from terrafix.github_pr_creator import GitHubPRCreator
 from terrafix.health_check import HealthCheckServer
 from terrafix.logging_config import get_logger, log_with_context, setup_logging
-from terrafix.orchestrator import ProcessingResult, process_failure
+from terrafix.orchestrator import ProcessingResult, process_failures_async
 from terrafix.redis_state_store import RedisStateStore
 from terrafix.remediation_generator import TerraformRemediationGenerator
 from terrafix.vanta_client import Failure, VantaClient
@@ -169,6 +169,7 @@ def main() -> int:
         state_store = RedisStateStore(
             redis_url=settings.redis_url,
             ttl_days=settings.state_retention_days,
+            background_writes=True,
         )
 
         log_with_context(
@@ -382,8 +383,8 @@ def process_failures_concurrent(
     """
     Process multiple failures concurrently.
 
-    Uses a thread pool to process failures in parallel while respecting
-    the max_workers limit. Returns results for all failures.
+    Runs the failures through process_failures_async() with at most
+    max_workers in flight at once. Returns results for all failures.
 
     Args:
         failures: List of failures to process
@@ -397,10 +398,8 @@ def process_failures_concurrent(
     Returns:
         List of ProcessingResult for each failure
     """
-    results: list[ProcessingResult] = []
-
     if not failures:
-        return results
+        return []
 
     log_with_context(
         logger,
@@ -410,70 +409,42 @@ def process_failures_concurrent(
         max_workers=max_workers,
     )
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all failures for processing
-        future_to_failure = {
-            executor.submit(
-                process_failure,
-                failure=failure,
-                config=settings,
-                state_store=state_store,
-                vanta=vanta,
-                generator=generator,
-                gh=gh,
-            ): failure
-            for failure in failures
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_failure):
-            failure = future_to_failure[future]
-            try:
-                result = future.result()
-                results.append(result)
-
-                if result.success and not result.skipped:
-                    log_with_context(
-                        logger,
-                        "info",
-                        "Successfully processed failure",
-                        test_id=failure.test_id,
-                        pr_url=result.pr_url,
-                    )
-                elif result.skipped:
-                    log_with_context(
-                        logger,
-                        "info",
-                        "Skipped duplicate failure",
-                        test_id=failure.test_id,
-                    )
-                else:
-                    log_with_context(
-                        logger,
-                        "error",
-                        "Failed to process failure",
-                        test_id=failure.test_id,
-                        error=result.error,
-                    )
-
-            except Exception as e:
-                log_with_context(
-                    logger,
-                    "error",
-                    "Unexpected error processing failure",
-                    test_id=failure.test_id,
-                    error=str(e),
-                )
+    results = asyncio.run(
+        process_failures_async(
+            failures=failures,
+            config=settings,
+            state_store=state_store,
+            vanta=vanta,
+            generator=generator,
+            gh=gh,
+            concurrency=max_workers,
+        )
+    )
 
-                # Create error result
-                failure_hash = vanta.generate_failure_hash(failure)
-                results.append(
-                    ProcessingResult(
-                        success=False,
-                        failure_hash=failure_hash,
-                        error=str(e),
-                    )
-                )
+    for failure, result in zip(failures, results, strict=True):
+        if result.success and not result.skipped:
+            log_with_context(
+                logger,
+                "info",
+                "Successfully processed failure",
+                test_id=failure.test_id,
+                pr_url=result.pr_url,
+            )
+        elif result.skipped:
+            log_with_context(
+                logger,
+                "info",
+                "Skipped duplicate failure",
+                test_id=failure.test_id,
+            )
+        else:
+            log_with_context(
+                logger,
+                "error",
+                "Failed to process failure",
+                test_id=failure.test_id,
+                error=result.error,
+            )
 
     return results
 
@@ -19,11 +19,21 @@ Usage:
         store.mark_in_progress(failure_hash, test_id, resource_arn)
         # ... process failure ...
         store.mark_processed(failure_hash, pr_url)
+
+    # Group a batch of status updates into one transaction
+    with store.batch():
+        for failure_hash, pr_url in results:
+            store.mark_processed(failure_hash, pr_url)
 """
 
 from __future__ import annotations
 
+import queue
 import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from pathlib import Path
@@ -35,6 +45,14 @@ from terrafix.logging_config import get_logger, log_with_context
 
 logger = get_logger(__name__)
 
+# Background writer: most updates committed together, and how long the
+# writer waits for more updates before committing what it has
+WRITE_BATCH_SIZE = 100
+WRITE_BATCH_WINDOW_SECONDS = 0.05
+
+# A deferred status update: the mark_* method and its arguments
+_Write = tuple[Callable[..., None], tuple[str, ...]]
+
 
 class ProcessingStatus(str, Enum):
     """
@@ -61,17 +79,29 @@ class StateStore:
     been processed to avoid duplicate PR creation. Thread-safe for
     single-process use via connection serialization.
 
+    Status updates normally commit immediately. Between begin_batch() and
+    commit_batch() they accumulate in one transaction so a batch of
+    failures costs a single commit instead of one per update.
+
+    With background_writes enabled, mark_in_progress, mark_processed and
+    mark_failed only queue the update and return; a writer thread commits
+    queued updates in groups. Reads call flush() first, so they always see
+    earlier updates. Write errors are logged by the writer rather than
+    raised to the caller.
+
     Attributes:
         db_path: Path to SQLite database file
         conn: SQLite connection (one per process)
     """
 
-    def __init__(self, db_path: str = "./terrafix.db") -> None:
+    def __init__(self, db_path: str = "./terrafix.db", background_writes: bool = False) -> None:
         """
         Initialize state store.
 
         Args:
             db_path: Path to SQLite database file
+            background_writes: Commit status updates on a writer thread
+                instead of in the caller (default: False)
 
         Example:
             >>> store = StateStore("./terrafix.db")
@@ -79,6 +109,19 @@ class StateStore:
         """
         self.db_path: Path = Path(db_path)
         self.conn: sqlite3.Connection | None = None
+        self._batch_depth: int = 0
+        self._batch_lock: threading.Lock = threading.Lock()
+        self._queue: queue.Queue[_Write | None] | None = None
+        self._writer: threading.Thread | None = None
+
+        if background_writes:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name="terrafix-state-writer",
+                daemon=True,
+            )
+            self._writer.start()
 
         log_with_context(
             logger,
@@ -168,6 +211,7 @@ class StateStore:
             >>> if not store.is_already_processed(hash):
             ...     process_failure()
         """
+        self.flush()
         self._ensure_connection()
 
         # At this point, self.conn is guaranteed to be non-None by _ensure_connection
@@ -241,6 +285,9 @@ class StateStore:
         Example:
             >>> store.mark_in_progress(hash, test_id, arn)
         """
+        if self._defer(self.mark_in_progress, failure_hash, test_id, resource_arn):
+            return
+
         self._ensure_connection()
 
         # At this point, self.conn is guaranteed to be non-None by _ensure_connection
@@ -266,7 +313,7 @@ class StateStore:
                 ),
             )
 
-            self.conn.commit()
+            self._commit()
 
             log_with_context(
                 logger,
@@ -308,6 +355,9 @@ class StateStore:
         Example:
             >>> store.mark_processed(hash, "https://github.com/...")
         """
+        if self._defer(self.mark_processed, failure_hash, pr_url):
+            return
+
         self._ensure_connection()
 
         # At this point, self.conn is guaranteed to be non-None by _ensure_connection
@@ -331,7 +381,7 @@ class StateStore:
                 ),
             )
 
-            self.conn.commit()
+            self._commit()
 
             log_with_context(
                 logger,
@@ -373,6 +423,9 @@ class StateStore:
         Example:
             >>> store.mark_failed(hash, "Resource not found")
         """
+        if self._defer(self.mark_failed, failure_hash, error):
+            return
+
         self._ensure_connection()
 
         # At this point, self.conn is guaranteed to be non-None by _ensure_connection
@@ -399,7 +452,7 @@ class StateStore:
                 ),
             )
 
-            self.conn.commit()
+            self._commit()
 
             log_with_context(
                 logger,
@@ -500,6 +553,7 @@ class StateStore:
             >>> stats = store.get_statistics()
             >>> print(f"Completed: {stats['completed']}")
         """
+        self.flush()
         self._ensure_connection()
 
         # At this point, self.conn is guaranteed to be non-None by _ensure_connection
@@ -546,6 +600,166 @@ class StateStore:
                 sqlite_error=str(e),
             ) from e
 
+    def begin_batch(self) -> None:
+        """
+        Start grouping status updates into a single transaction.
+
+        Calls may be nested; the transaction is committed when the
+        outermost batch ends.
+
+        Raises:
+            StateStoreError: If the transaction cannot be started
+        """
+        self._ensure_connection()
+
+        # At this point, self.conn is guaranteed to be non-None by _ensure_connection
+        assert self.conn is not None
+
+        with self._batch_lock:
+            try:
+                if self._batch_depth == 0 and not self.conn.in_transaction:
+                    _ = self.conn.execute("BEGIN IMMEDIATE")
+                self._batch_depth += 1
+            except sqlite3.Error as e:
+                raise StateStoreError(
+                    f"Failed to begin batch: {e}",
+                    operation="begin_batch",
+                    sqlite_error=str(e),
+                ) from e
+
+    def commit_batch(self) -> None:
+        """
+        End a batch started with begin_batch.
+
+        Commits the accumulated updates when the outermost batch ends.
+
+        Raises:
+            StateStoreError: If the commit fails
+        """
+        with self._batch_lock:
+            if self._batch_depth == 0:
+                return
+            self._batch_depth -= 1
+            if self._batch_depth > 0 or self.conn is None:
+                return
+            try:
+                self.conn.commit()
+            except sqlite3.Error as e:
+                raise StateStoreError(
+                    f"Failed to commit batch: {e}",
+                    operation="commit_batch",
+                    sqlite_error=str(e),
+                ) from e
+
+    @contextmanager
+    def batch(self) -> Iterator[StateStore]:
+        """
+        Group the status updates made inside the block into one transaction.
+
+        Updates are committed even if the block raises, so work already
+        recorded for earlier failures in the batch is not lost.
+
+        Yields:
+            This state store
+
+        Example:
+            >>> with store.batch():
+            ...     store.mark_processed(hash_a, url_a)
+            ...     store.mark_failed(hash_b, "error")
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.commit_batch()
+
+    def flush(self) -> None:
+        """
+        Wait until every queued status update has been written.
+
+        Returns immediately when background writes are disabled.
+        """
+        if self._queue is not None and threading.current_thread() is not self._writer:
+            self._queue.join()
+
+    def _defer(self, write: Callable[..., None], *args: str) -> bool:
+        """
+        Queue a status update for the writer thread.
+
+        Args:
+            write: mark_* method to run on the writer thread
+            *args: Arguments for write
+
+        Returns:
+            True if the update was queued, False if the caller should
+            write it directly (background writes disabled, or already on
+            the writer thread)
+        """
+        if self._queue is None or threading.current_thread() is self._writer:
+            return False
+        self._queue.put((write, args))
+        return True
+
+    def _writer_loop(self) -> None:
+        """Commit queued status updates in groups until close() is called."""
+        assert self._queue is not None
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+
+            pending: list[_Write] = [item]
+            stopping = False
+            deadline = time.monotonic() + WRITE_BATCH_WINDOW_SECONDS
+            while len(pending) < WRITE_BATCH_SIZE:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                pending.append(item)
+
+            try:
+                with self.batch():
+                    for write, args in pending:
+                        try:
+                            write(*args)
+                        except Exception as e:
+                            # Any escaping exception would end the writer and
+                            # leave flush() waiting on the queue forever
+                            log_with_context(
+                                logger,
+                                "error",
+                                "Background state update failed",
+                                operation=write.__name__,
+                                error=str(e),
+                            )
+            except Exception as e:
+                log_with_context(
+                    logger,
+                    "error",
+                    "Background state commit failed",
+                    updates=len(pending),
+                    error=str(e),
+                )
+            finally:
+                for _ in pending:
+                    self._queue.task_done()
+
+            if stopping:
+                self._queue.task_done()
+                return
+
+    def _commit(self) -> None:
+        """Commit the current update unless a batch is collecting updates."""
+        assert self.conn is not None
+        if self._batch_depth == 0:
+            self.conn.commit()
+
     def _ensure_connection(self) -> None:
         """
         Ensure database connection is open.
@@ -568,8 +782,11 @@ class StateStore:
                 check_same_thread=False,  # Allow use across threads
             )
 
-            # Enable WAL mode for better concurrency
+            # Enable WAL mode for better concurrency. In WAL mode NORMAL
+            # only syncs at checkpoints, and a crash can lose at most the
+            # last commits, never corrupt the database.
             _ = self.conn.execute("PRAGMA journal_mode=WAL")
+            _ = self.conn.execute("PRAGMA synchronous=NORMAL")
 
             log_with_context(
                 logger,
@@ -597,15 +814,23 @@ class StateStore:
         Close database connection.
 
         Should be called when the state store is no longer needed.
-        Safe to call multiple times.
+        Queued status updates are written first. Safe to call multiple
+        times.
 
         Example:
             >>> store.close()
         """
+        if self._writer is not None and self._queue is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+
         if self.conn is not None:
             try:
                 self.conn.close()
                 self.conn = None
+                self._batch_depth = 0
 
                 log_with_context(
                     logger,
@@ -21,7 +21,15 @@ Usage:
         print(f"Found resource in {file_path}")
 """
 
+from __future__ import annotations
+
+import copy
+import multiprocessing
+import os
+import threading
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any, cast
 
@@ -33,6 +41,99 @@ from terrafix.resource_mappings import aws_to_terraform_type
 
 logger = get_logger(__name__)
 
+# Threads reading .tf files; reads release the GIL, so on network-backed
+# volumes they overlap
+READ_WORKERS = 8
+
+# Parsing holds the GIL, so repositories with at least this many files are
+# parsed in a process pool shared by every analyzer in the process
+PARALLEL_PARSE_MIN_FILES = 16
+PARSE_WORKERS = os.cpu_count() or 1
+
+_parse_pool: ProcessPoolExecutor | None = None
+_parse_pool_lock = threading.Lock()
+
+# (position, file_path, resource_config, resource_name) of an indexed resource;
+# position orders resources as the files were scanned
+_IndexedResource = tuple[int, str, dict[str, Any], str]
+
+
+def _parse_hcl_text(content: str) -> dict[str, Any]:
+    """
+    Parse Terraform HCL content into a dictionary.
+
+    Uses python-hcl2's loads function while verifying it exists to avoid
+    attribute errors when the library interface changes.
+
+    Args:
+        content: Raw Terraform file contents
+
+    Returns:
+        Parsed HCL as a dictionary
+
+    Raises:
+        TerraformParseError: If the hcl2.loads function is unavailable.
+    """
+    load_fn: Callable[[str], object] | None = getattr(hcl2, "loads", None)
+    if load_fn is None:
+        raise TerraformParseError("hcl2.loads is not available for Terraform parsing")
+
+    parsed_raw = load_fn(content)
+    return cast(dict[str, Any], parsed_raw)
+
+
+def _parse_in_worker(content: str) -> dict[str, Any] | str:
+    """
+    Parse one file in a worker process.
+
+    Parser exceptions do not all survive pickling, so errors are returned
+    as text.
+
+    Args:
+        content: Raw Terraform file contents
+
+    Returns:
+        Parsed HCL on success, the error message on failure
+    """
+    try:
+        return _parse_hcl_text(content)
+    except Exception as e:
+        return str(e)
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Return the shared parse pool, starting it on first use.
+
+    Workers are spawned rather than forked, since the service forks from
+    a multi-threaded process otherwise.
+
+    Returns:
+        Process pool with PARSE_WORKERS workers
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _parse_pool
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Drop a broken parse pool so the next parse starts a new one.
+
+    Args:
+        pool: Pool that failed
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is pool:
+            _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
 
 class TerraformAnalyzer:
     """
@@ -46,6 +147,9 @@ class TerraformAnalyzer:
         repo_path: Path to cloned Terraform repository
         terraform_files: List of .tf file paths found
         parsed_configs: Dict mapping file paths to parsed HCL
+        _name_index: First resource per (terraform type or None, name)
+        _identity_index: First resource per (terraform type or None, kind, value)
+            of its identifying attribute (see _resource_identity)
     """
 
     def __init__(self, repo_path: str) -> None:
@@ -65,6 +169,8 @@ class TerraformAnalyzer:
         self.repo_path: Path = Path(repo_path)
         self.terraform_files: list[Path] = list(self.repo_path.rglob("*.tf"))
         self.parsed_configs: dict[str, dict[str, Any]] = {}
+        self._name_index: dict[tuple[str | None, str], _IndexedResource] = {}
+        self._identity_index: dict[tuple[str | None, str, str], _IndexedResource] = {}
 
         log_with_context(
             logger,
@@ -75,6 +181,7 @@ class TerraformAnalyzer:
         )
 
         self._parse_all_files()
+        self._build_index()
 
     def _parse_all_files(self) -> None:
         """
@@ -87,12 +194,14 @@ class TerraformAnalyzer:
         Raises:
             TerraformParseError: Not raised directly, but logged for each failure
         """
-        for tf_file in self.terraform_files:
+        contents = self._read_all_files()
+        parsed_files = self._parse_contents(contents)
+        for tf_file, content, parsed in zip(
+            self.terraform_files, contents, parsed_files, strict=True
+        ):
             try:
-                with open(tf_file, encoding="utf-8") as f:
-                    content = f.read()
-
-                parsed: dict[str, Any] = self._parse_hcl(content)
+                if isinstance(parsed, Exception):
+                    raise parsed
 
                 self.parsed_configs[str(tf_file)] = {
                     "content": content,
@@ -127,13 +236,80 @@ class TerraformAnalyzer:
             failed_files=len(self.terraform_files) - len(self.parsed_configs),
         )
 
+    def _read_all_files(self) -> list[str | Exception]:
+        """
+        Read all Terraform files concurrently.
+
+        Returns:
+            Content of each file in self.terraform_files, in the same
+            order, or the exception raised while reading it
+        """
+
+        def read(tf_file: Path) -> str | Exception:
+            try:
+                return tf_file.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                return e
+
+        if len(self.terraform_files) <= 1:
+            return [read(tf_file) for tf_file in self.terraform_files]
+
+        with ThreadPoolExecutor(
+            max_workers=min(READ_WORKERS, len(self.terraform_files)),
+            thread_name_prefix="terrafix-tf-read",
+        ) as pool:
+            return list(pool.map(read, self.terraform_files))
+
+    def _parse_contents(self, contents: list[str | Exception]) -> list[dict[str, Any] | Exception]:
+        """
+        Parse the content of every file that could be read.
+
+        Large repositories are parsed in the shared process pool; small
+        ones, or any repository if the pool cannot be used, are parsed in
+        this thread.
+
+        Args:
+            contents: Result of _read_all_files()
+
+        Returns:
+            Parsed HCL, or the read or parse error, for each file in the
+            same order as contents
+        """
+        texts = [content for content in contents if isinstance(content, str)]
+        parsed: list[dict[str, Any] | Exception] | None = None
+
+        if len(texts) >= PARALLEL_PARSE_MIN_FILES and PARSE_WORKERS > 1:
+            pool = _get_parse_pool()
+            try:
+                chunksize = max(1, len(texts) // (PARSE_WORKERS * 4))
+                parsed = [
+                    TerraformParseError(result) if isinstance(result, str) else result
+                    for result in pool.map(_parse_in_worker, texts, chunksize=chunksize)
+                ]
+            except (BrokenProcessPool, OSError) as e:
+                _discard_parse_pool(pool)
+                log_with_context(
+                    logger,
+                    "warning",
+                    "Parallel Terraform parsing failed, parsing sequentially",
+                    error=str(e),
+                )
+
+        if parsed is None:
+            parsed = []
+            for text in texts:
+                try:
+                    parsed.append(self._parse_hcl(text))
+                except Exception as e:
+                    parsed.append(e)
+
+        remaining = iter(parsed)
+        return [next(remaining) if isinstance(content, str) else content for content in contents]
+
     def _parse_hcl(self, content: str) -> dict[str, Any]:
         """
         Safely parse Terraform HCL content into a dictionary.
 
-        Uses python-hcl2's loads function while verifying it exists to avoid
-        attribute errors when the library interface changes.
-
         Args:
             content: Raw Terraform file contents
 
@@ -143,12 +319,110 @@ class TerraformAnalyzer:
         Raises:
             TerraformParseError: If the hcl2.loads function is unavailable.
         """
-        load_fn: Callable[[str], object] | None = getattr(hcl2, "loads", None)
-        if load_fn is None:
-            raise TerraformParseError("hcl2.loads is not available for Terraform parsing")
+        return _parse_hcl_text(content)
+
+    def _build_index(self) -> None:
+        """
+        Index every resource by name and identifying attribute.
+
+        Each key maps to the first matching resource in scan order, both
+        per Terraform type and across all types (type None), so ARN
+        lookups are dictionary hits instead of a scan of every file.
+        """
+        self._name_index = {}
+        self._identity_index = {}
+        position = 0
+
+        for file_path, config in self.parsed_configs.items():
+            parsed_data: dict[str, Any] = cast(dict[str, Any], config["parsed"])
+            resources_list: list[dict[str, Any]] = cast(
+                list[dict[str, Any]], parsed_data.get("resource", [])
+            )
+            for resources in resources_list:
+                for res_type, res_instances in resources.items():
+                    res_instances_dict: dict[str, Any] = cast(dict[str, Any], res_instances)
+                    for res_name, res_config in res_instances_dict.items():
+                        res_cfg: dict[str, Any] = cast(dict[str, Any], res_config)
+                        entry: _IndexedResource = (position, file_path, res_cfg, res_name)
+                        position += 1
+
+                        for type_key in (res_type, None):
+                            _ = self._name_index.setdefault((type_key, res_name), entry)
+
+                        identity = self._resource_identity(res_cfg)
+                        if identity is not None:
+                            kind, value = identity
+                            for type_key in (res_type, None):
+                                _ = self._identity_index.setdefault((type_key, kind, value), entry)
+
+    def _lookup(
+        self,
+        tf_type: str | None,
+        resource_arn: str,
+    ) -> tuple[str, dict[str, Any], str] | None:
+        """
+        Find the first resource matching an ARN by name or attributes.
+
+        Args:
+            tf_type: Terraform resource type, or None to match any type
+            resource_arn: AWS resource ARN
+
+        Returns:
+            Tuple of (file_path, resource_block, resource_name) or None
+        """
+        resource_name = self._extract_name_from_arn(resource_arn)
+        candidates = [
+            self._name_index.get((tf_type, resource_name)),
+            self._identity_index.get((tf_type, "arn", resource_arn)),
+            self._identity_index.get((tf_type, "name", resource_name)),
+        ]
+        hits = [c for c in candidates if c is not None]
+        if not hits:
+            return None
+
+        _, file_path, res_config, res_name = min(hits, key=lambda hit: hit[0])
+        return (file_path, res_config, res_name)
+
+    def rebased(self, repo_path: str) -> TerraformAnalyzer:
+        """
+        Return a copy of this analyzer for an identical checkout elsewhere.
+
+        The parsed configurations are shared with this analyzer; only the
+        file paths are rewritten to point under repo_path, so no files
+        are read or parsed and the resource index is remapped rather than
+        rebuilt. Returns this analyzer itself if it is already there.
 
-        parsed_raw = load_fn(content)
-        return cast(dict[str, Any], parsed_raw)
+        Args:
+            repo_path: Path to another checkout of the same Terraform files
+
+        Returns:
+            Analyzer whose paths refer to repo_path
+
+        Example:
+            >>> analyzer = cached.rebased("/tmp/other-checkout/terraform")
+        """
+        new_root = Path(repo_path)
+        if new_root == self.repo_path:
+            return self
+
+        def move(path: str | Path) -> Path:
+            return new_root / Path(path).relative_to(self.repo_path)
+
+        moved = {k: str(move(k)) for k in self.parsed_configs}
+
+        clone = copy.copy(self)
+        clone.repo_path = new_root
+        clone.terraform_files = [move(f) for f in self.terraform_files]
+        clone.parsed_configs = {moved[k]: v for k, v in self.parsed_configs.items()}
+        clone._name_index = {
+            key: (pos, moved[path], cfg, name)
+            for key, (pos, path, cfg, name) in self._name_index.items()
+        }
+        clone._identity_index = {
+            key: (pos, moved[path], cfg, name)
+            for key, (pos, path, cfg, name) in self._identity_index.items()
+        }
+        return clone
 
     def find_resource_by_arn(
         self,
@@ -158,8 +432,9 @@ class TerraformAnalyzer:
         """
         Locate a Terraform resource block by AWS ARN.
 
-        Searches all parsed Terraform files for a resource matching the
-        given ARN. Returns the file path, resource block, and resource name.
+        Looks up the resource matching the given ARN in the index built
+        when the files were parsed. Returns the file path, resource block,
+        and resource name.
 
         Args:
             resource_arn: AWS resource ARN
@@ -212,34 +487,19 @@ class TerraformAnalyzer:
             )
             return self._fuzzy_find_by_arn(resource_arn)
 
-        # Search all parsed configs for matching resource
-        for file_path, config in self.parsed_configs.items():
-            parsed_data: dict[str, Any] = cast(dict[str, Any], config["parsed"])
-
-            # Look for matching resource blocks
-            if "resource" in parsed_data:
-                resources_list: list[dict[str, Any]] = cast(
-                    list[dict[str, Any]], parsed_data["resource"]
-                )
-                for resources in resources_list:
-                    for res_type, res_instances in resources.items():
-                        if res_type == tf_type:
-                            res_instances_dict: dict[str, Any] = cast(dict[str, Any], res_instances)
-                            for res_name, res_config in res_instances_dict.items():
-                                # Match by name or by inline ARN/ID
-                                res_config_typed: dict[str, Any] = cast(dict[str, Any], res_config)
-                                if res_name == resource_name or self._resource_matches_arn(
-                                    res_config_typed, resource_arn
-                                ):
-                                    log_with_context(
-                                        logger,
-                                        "info",
-                                        "Found resource in Terraform",
-                                        file_path=file_path,
-                                        resource_type=res_type,
-                                        resource_name=res_name,
-                                    )
-                                    return (file_path, res_config_typed, res_name)
+        # Look up the first resource of this type matching by name or attributes
+        result = self._lookup(tf_type, resource_arn)
+        if result is not None:
+            file_path, _, res_name = result
+            log_with_context(
+                logger,
+                "info",
+                "Found resource in Terraform",
+                file_path=file_path,
+                resource_type=tf_type,
+                resource_name=res_name,
+            )
+            return result
 
         log_with_context(
             logger,
@@ -268,47 +528,17 @@ class TerraformAnalyzer:
         Returns:
             Tuple of (file_path, resource_block, resource_name) or None
         """
-        resource_name = self._extract_name_from_arn(resource_arn)
-
-        for file_path, config in self.parsed_configs.items():
-            parsed_data: dict[str, Any] = cast(dict[str, Any], config["parsed"])
-
-            if "resource" not in parsed_data:
-                continue
-
-            resources_list: list[dict[str, Any]] = cast(
-                list[dict[str, Any]], parsed_data["resource"]
+        result = self._lookup(None, resource_arn)
+        if result is not None:
+            file_path, _, res_name = result
+            log_with_context(
+                logger,
+                "info",
+                "Found resource via fuzzy match",
+                file_path=file_path,
+                resource_name=res_name,
             )
-            for resources in resources_list:
-                for res_type, res_instances in resources.items():
-                    res_instances_dict: dict[str, Any] = cast(dict[str, Any], res_instances)
-                    for res_name, res_config in res_instances_dict.items():
-                        res_cfg: dict[str, Any] = cast(dict[str, Any], res_config)
-                        # Check if resource matches ARN
-                        if self._resource_matches_arn(res_cfg, resource_arn):
-                            log_with_context(
-                                logger,
-                                "info",
-                                "Found resource via fuzzy match",
-                                file_path=file_path,
-                                resource_type=res_type,
-                                resource_name=res_name,
-                            )
-                            return (file_path, res_cfg, res_name)
-
-                        # Check if resource name matches
-                        if res_name == resource_name:
-                            log_with_context(
-                                logger,
-                                "info",
-                                "Found resource by name match",
-                                file_path=file_path,
-                                resource_type=res_type,
-                                resource_name=res_name,
-                            )
-                            return (file_path, res_cfg, res_name)
-
-        return None
+        return result
 
     def _extract_name_from_arn(self, arn: str) -> str:
         """
@@ -363,37 +593,44 @@ class TerraformAnalyzer:
             >>> analyzer._resource_matches_arn(config, "arn:aws:s3:::bucket")
             True
         """
-        # Check for explicit ARN in config
-        if "arn" in resource_config:
-            arn_value: str = str(resource_config["arn"])
-            return arn_value == arn
+        identity = self._resource_identity(resource_config)
+        if identity is None:
+            return False
 
-        # Check for bucket name in S3 resources
-        if "bucket" in resource_config:
-            bucket_name = self._extract_name_from_arn(arn)
-            config_bucket: str | list[str] = resource_config["bucket"]
+        kind, value = identity
+        if kind == "arn":
+            return value == arn
+        return value == self._extract_name_from_arn(arn)
 
-            # Handle both string and list values
-            if isinstance(config_bucket, list):
-                bucket_str: str = str(config_bucket[0]) if config_bucket else ""
-            else:
-                bucket_str = str(config_bucket)
+    def _resource_identity(self, resource_config: dict[str, Any]) -> tuple[str, str] | None:
+        """
+        Return the attribute used to match a resource against an ARN.
 
-            return bucket_str == bucket_name
+        An explicit arn attribute takes precedence, then an S3 bucket
+        name, then a name attribute.
 
-        # Check for name attribute
-        if "name" in resource_config:
-            extracted_name = self._extract_name_from_arn(arn)
-            config_name: str | list[str] = resource_config["name"]
+        Args:
+            resource_config: Terraform resource configuration block
+
+        Returns:
+            ("arn", full_arn) or ("name", resource_name), or None if the
+            resource has none of these attributes
+        """
+        # Check for explicit ARN in config
+        if "arn" in resource_config:
+            return ("arn", str(resource_config["arn"]))
 
-            if isinstance(config_name, list):
-                name_str: str = str(config_name[0]) if config_name else ""
-            else:
-                name_str = str(config_name)
+        # Check for bucket name in S3 resources, then for name attribute
+        for attribute in ("bucket", "name"):
+            if attribute in resource_config:
+                attr_value: str | list[str] = resource_config[attribute]
 
-            return name_str == extracted_name
+                # Handle both string and list values
+                if isinstance(attr_value, list):
+                    return ("name", str(attr_value[0]) if attr_value else "")
+                return ("name", str(attr_value))
 
-        return False
+        return None
 
     def get_module_context(self, file_path: str) -> dict[str, Any]:
         """
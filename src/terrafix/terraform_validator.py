@@ -7,7 +7,9 @@ that would fail during terraform plan or apply.
 
 Validation steps:
 1. terraform fmt - Check/fix formatting
-2. terraform init - Initialize provider plugins (required for validate)
+2. terraform init - Initialize provider plugins (required for validate); the
+   initialized .terraform directory is reused for every configuration with
+   the same provider context
 3. terraform validate - Semantic validation of configuration
 
 Usage:
@@ -27,19 +29,82 @@ Usage:
         pass
 """
 
+import hashlib
 import json
+import os
+import re
 import shutil
 import subprocess
 import tempfile
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from terrafix.errors import TerraformValidationError
 from terrafix.logging_config import get_logger, log_with_context
 
 logger = get_logger(__name__)
 
+# In-memory filesystem for scratch directories, where available
+SCRATCH_ROOT = "/dev/shm"
+
+# Providers are installed here and linked into scratch directories, so
+# terraform init neither re-downloads them nor fills the in-memory scratch
+PLUGIN_CACHE_DIR = Path(
+    os.environ.get("TF_PLUGIN_CACHE_DIR") or Path(tempfile.gettempdir()) / "terrafix-plugin-cache"
+)
+
+# Initialized .terraform directories, one per provider context, linked into
+# scratch directories so terraform init runs once per context per process
+INIT_CACHE_DIR = Path(tempfile.gettempdir()) / "terrafix-init-cache"
+
+# Files copied from the repository for provider and variable context
+PROVIDER_FILES = (
+    "versions.tf",
+    "providers.tf",
+    "terraform.tf",
+    "variables.tf",
+    ".terraform.lock.hcl",
+)
+
+# Blocks whose presence in a fix means init depends on the fix itself
+# (module sources, required_providers), so the shared init cannot be used
+_PER_FIX_INIT_BLOCK = re.compile(r'^\s*(?:module\s+"|terraform\s*\{)', re.MULTILINE)
+
+# Provider local names implied by resource and data source types
+_IMPLIED_PROVIDER = re.compile(r'^\s*(?:resource|data)\s+"([a-z0-9]+)_', re.MULTILINE)
+
+_init_locks: dict[str, threading.Lock] = {}
+_init_locks_guard = threading.Lock()
+
+
+def _init_lock(key: str) -> threading.Lock:
+    """
+    Return the lock serializing terraform init for one provider context.
+
+    Args:
+        key: Provider context key
+
+    Returns:
+        Lock shared by every validation with the same key
+    """
+    with _init_locks_guard:
+        return _init_locks.setdefault(key, threading.Lock())
+
+
+def scratch_root() -> str | None:
+    """
+    Return the directory to create scratch directories in.
+
+    Returns:
+        SCRATCH_ROOT if it exists and is writable, otherwise None for the
+        platform's default temporary directory
+    """
+    if os.path.isdir(SCRATCH_ROOT) and os.access(SCRATCH_ROOT, os.W_OK):
+        return SCRATCH_ROOT
+    return None
+
 
 @dataclass
 class ValidationResult:
@@ -69,8 +134,11 @@ class TerraformValidator:
 
     Attributes:
         terraform_path: Path to terraform binary
+        _verified_binaries: Binaries whose version check already passed
     """
 
+    _verified_binaries: ClassVar[set[str]] = set()
+
     def __init__(self, terraform_path: str = "terraform") -> None:
         """
         Initialize Terraform validator.
@@ -93,9 +161,15 @@ class TerraformValidator:
         """
         Verify terraform CLI is available and functional.
 
+        The check runs once per binary path per process; later validators
+        for the same binary skip the extra process spawn.
+
         Raises:
             TerraformValidationError: If terraform is not available
         """
+        if self.terraform_path in self._verified_binaries:
+            return
+
         try:
             result = subprocess.run(
                 [self.terraform_path, "version"],
@@ -108,6 +182,7 @@ class TerraformValidator:
                     f"Terraform version check failed: {result.stderr}",
                 )
 
+            self._verified_binaries.add(self.terraform_path)
             version_line = result.stdout.split("\n")[0]
             log_with_context(
                 logger,
@@ -141,8 +216,9 @@ class TerraformValidator:
         """
         Validate a Terraform configuration.
 
-        Creates an isolated temporary directory, writes the configuration,
-        and runs terraform fmt followed by terraform validate.
+        Formats the configuration with terraform fmt over stdin, then
+        writes the formatted result to an isolated temporary directory
+        (on tmpfs where available) and runs terraform validate there.
 
         Args:
             content: Terraform configuration content (HCL)
@@ -160,24 +236,26 @@ class TerraformValidator:
             >>> if result.is_valid:
             ...     print(result.formatted_content)
         """
-        with tempfile.TemporaryDirectory(prefix="terrafix_validate_") as tmpdir:
+        # Step 1: Run terraform fmt
+        fmt_result = self._run_terraform_fmt(content)
+        if not fmt_result.is_valid:
+            return fmt_result
+
+        with tempfile.TemporaryDirectory(prefix="terrafix_validate_", dir=scratch_root()) as tmpdir:
             tmppath = Path(tmpdir)
 
-            # Write the configuration to validate
+            # Write the formatted configuration to validate
             config_file = tmppath / filename
-            _ = config_file.write_text(content, encoding="utf-8")
+            _ = config_file.write_text(fmt_result.formatted_content or content, encoding="utf-8")
 
             # Copy provider configuration if available
             if original_repo_path:
                 self._copy_provider_files(original_repo_path, tmppath)
 
-            # Step 1: Run terraform fmt
-            fmt_result = self._run_terraform_fmt(tmppath, config_file)
-            if not fmt_result.is_valid:
-                return fmt_result
-
             # Step 2: Run terraform init (required for validate)
-            init_result = self._run_terraform_init(tmppath)
+            init_result = self._prepare_providers(
+                tmppath, filename, fmt_result.formatted_content or content
+            )
             if not init_result.is_valid:
                 # Init failure is a warning, not a hard failure
                 # (might be missing provider credentials)
@@ -204,27 +282,66 @@ class TerraformValidator:
                 warnings=validate_result.warnings,
             )
 
-    def _run_terraform_fmt(
+    def warm_up(
         self,
-        work_dir: Path,
-        config_file: Path,
-    ) -> ValidationResult:
+        content: str,
+        filename: str = "main.tf",
+        original_repo_path: Path | None = None,
+    ) -> None:
+        """
+        Initialize providers for a configuration ahead of validation.
+
+        Prepares the provider context validate_configuration() would use
+        for content, so validating a fix that keeps the same resource
+        types and provider files later skips terraform init. Meant to run
+        while the fix is still being generated; failures are only logged,
+        since validation reports them.
+
+        Args:
+            content: Configuration the fix will replace (HCL)
+            filename: Name for the temporary file
+            original_repo_path: Path to original repo for provider context
+        """
+        if _PER_FIX_INIT_BLOCK.search(content):
+            return
+
+        try:
+            with tempfile.TemporaryDirectory(
+                prefix="terrafix_warmup_", dir=scratch_root()
+            ) as tmpdir:
+                tmppath = Path(tmpdir)
+                _ = (tmppath / filename).write_text(content, encoding="utf-8")
+                if original_repo_path:
+                    self._copy_provider_files(original_repo_path, tmppath)
+                _ = self._prepare_providers(tmppath, filename, content)
+        except OSError as e:
+            log_with_context(
+                logger,
+                "warning",
+                "Terraform warm-up failed",
+                error=str(e),
+            )
+
+    def _run_terraform_fmt(self, content: str) -> ValidationResult:
         """
         Run terraform fmt on configuration.
 
+        The configuration is piped through "terraform fmt -", so no
+        files are written or read back.
+
         Args:
-            work_dir: Working directory
-            config_file: Path to configuration file
+            content: Terraform configuration content
 
         Returns:
             ValidationResult with formatted content or error
         """
         try:
             result = subprocess.run(
-                [self.terraform_path, "fmt", "-write=true", str(config_file)],
-                cwd=work_dir,
+                [self.terraform_path, "fmt", "-"],
+                input=content,
                 capture_output=True,
                 text=True,
+                encoding="utf-8",
                 timeout=60,
             )
 
@@ -240,7 +357,7 @@ class TerraformValidator:
                     error_message=f"terraform fmt failed: {result.stderr}",
                 )
 
-            formatted_content = config_file.read_text(encoding="utf-8")
+            formatted_content = result.stdout
 
             log_with_context(
                 logger,
@@ -259,10 +376,86 @@ class TerraformValidator:
                 error_message="terraform fmt timed out after 60 seconds",
             )
 
+    def _prepare_providers(self, work_dir: Path, filename: str, content: str) -> ValidationResult:
+        """
+        Make initialized providers available in a scratch directory.
+
+        Configurations with the same provider files and the same implied
+        providers share one initialized directory under INIT_CACHE_DIR;
+        its .terraform directory is symlinked into the scratch directory
+        and its lock file copied, so terraform init only runs the first
+        time a provider context is seen. Fixes declaring modules or a
+        terraform block are initialized in place, as before.
+
+        Args:
+            work_dir: Scratch directory holding the configuration
+            filename: Name of the configuration file in work_dir
+            content: Configuration content
+
+        Returns:
+            ValidationResult indicating init success/failure
+        """
+        if _PER_FIX_INIT_BLOCK.search(content):
+            return self._run_terraform_init(work_dir)
+
+        provider_files = [name for name in PROVIDER_FILES if (work_dir / name).is_file()]
+        key = self._provider_context_key(work_dir, provider_files, content)
+        init_dir = INIT_CACHE_DIR / key
+
+        with _init_lock(key):
+            if not (init_dir / ".terraform").is_dir():
+                shutil.rmtree(init_dir, ignore_errors=True)
+                init_dir.mkdir(parents=True)
+                for name in [*provider_files, filename]:
+                    _ = shutil.copy2(work_dir / name, init_dir / name)
+
+                result = self._run_terraform_init(init_dir)
+                if not result.is_valid:
+                    shutil.rmtree(init_dir, ignore_errors=True)
+                    return result
+
+                log_with_context(
+                    logger,
+                    "debug",
+                    "Cached initialized provider context",
+                    key=key,
+                )
+
+        (work_dir / ".terraform").symlink_to(init_dir / ".terraform", target_is_directory=True)
+        lock_file = init_dir / ".terraform.lock.hcl"
+        if lock_file.is_file():
+            _ = shutil.copy2(lock_file, work_dir / ".terraform.lock.hcl")
+        return ValidationResult(is_valid=True)
+
+    def _provider_context_key(self, work_dir: Path, provider_files: list[str], content: str) -> str:
+        """
+        Build the cache key for an initialized provider context.
+
+        Args:
+            work_dir: Scratch directory holding the provider files
+            provider_files: Names of the provider files present
+            content: Configuration content, for its implied providers
+
+        Returns:
+            Hex digest identifying the terraform binary, provider files
+            and implied providers
+        """
+        digest = hashlib.sha256(self.terraform_path.encode())
+        for name in provider_files:
+            digest.update(name.encode())
+            digest.update((work_dir / name).read_bytes())
+        for provider in sorted(set(_IMPLIED_PROVIDER.findall(content))):
+            digest.update(provider.encode())
+        return digest.hexdigest()[:32]
+
     def _run_terraform_init(self, work_dir: Path) -> ValidationResult:
         """
         Run terraform init for provider installation.
 
+        Providers come from the shared plugin cache; the lock-file check
+        that would otherwise bypass the cache is disabled because the
+        working directory is thrown away after validation.
+
         Args:
             work_dir: Working directory
 
@@ -270,6 +463,7 @@ class TerraformValidator:
             ValidationResult indicating init success/failure
         """
         try:
+            PLUGIN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
             result = subprocess.run(
                 [
                     self.terraform_path,
@@ -279,6 +473,11 @@ class TerraformValidator:
                     "-no-color",
                 ],
                 cwd=work_dir,
+                env={
+                    **os.environ,
+                    "TF_PLUGIN_CACHE_DIR": str(PLUGIN_CACHE_DIR),
+                    "TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE": "true",
+                },
                 capture_output=True,
                 text=True,
                 timeout=300,  # Init can be slow for provider downloads
@@ -309,6 +508,11 @@ class TerraformValidator:
                 is_valid=False,
                 error_message="terraform init timed out after 300 seconds",
             )
+        except OSError as e:
+            return ValidationResult(
+                is_valid=False,
+                error_message=f"terraform init failed: {e}",
+            )
 
     def _run_terraform_validate(self, work_dir: Path) -> ValidationResult:
         """
@@ -403,15 +607,7 @@ class TerraformValidator:
             source: Original repository path
             dest: Temporary validation directory
         """
-        files_to_copy = [
-            "versions.tf",
-            "providers.tf",
-            "terraform.tf",
-            "variables.tf",
-            ".terraform.lock.hcl",
-        ]
-
-        for filename in files_to_copy:
+        for filename in PROVIDER_FILES:
             source_file = source / filename
             if source_file.exists():
                 try:
@@ -446,13 +642,8 @@ class TerraformValidator:
         Example:
             >>> formatted = validator.format_only(config)
         """
-        with tempfile.TemporaryDirectory(prefix="terrafix_fmt_") as tmpdir:
-            tmppath = Path(tmpdir)
-            config_file = tmppath / "main.tf"
-            _ = config_file.write_text(content, encoding="utf-8")
-
-            result = self._run_terraform_fmt(tmppath, config_file)
+        result = self._run_terraform_fmt(content)
 
-            if result.is_valid and result.formatted_content:
-                return result.formatted_content
-            return content
+        if result.is_valid and result.formatted_content:
+            return result.formatted_content
+        return content
@@ -37,10 +37,17 @@ from pydantic import BaseModel, Field
 
 from terrafix.errors import VantaApiError
 from terrafix.logging_config import get_logger, log_with_context
-from terrafix.rate_limiter import VANTA_MANAGEMENT_LIMITER
+from terrafix.rate_limiter import VANTA_MANAGEMENT_LIMITER, parse_retry_after
 
 logger = get_logger(__name__)
 
+# Severity indicators used in PR titles
+SEVERITY_EMOJI: dict[str, str] = {
+    "high": "🔴",
+    "medium": "🟡",
+    "low": "🟢",
+}
+
 
 class Failure(BaseModel):
     """
@@ -90,6 +97,38 @@ class Failure(BaseModel):
         description="Additional resource metadata",
     )
 
+    @property
+    def commit_message(self) -> str:
+        """
+        Conventional commit message for the remediation commit.
+
+        Returns:
+            Commit message following conventional commits format
+        """
+        return f"""fix(compliance): {self.test_name}
+
+Automated fix generated by TerraFix to address compliance failure.
+
+Test: {self.test_name}
+Framework: {self.framework}
+Severity: {self.severity}
+Resource: {self.resource_arn}
+
+This commit was automatically generated. Please review carefully
+before merging.
+"""
+
+    @property
+    def pr_title(self) -> str:
+        """
+        Concise PR title with severity indicator.
+
+        Returns:
+            PR title like: 🔴 [TerraFix] S3 Bucket Block Public Access
+        """
+        emoji = SEVERITY_EMOJI.get(self.severity, "⚪")
+        return f"{emoji} [TerraFix] {self.test_name}"
+
     @override
     def __str__(self) -> str:
         """Return human-readable string representation."""
@@ -361,6 +400,11 @@ class VantaClient:
                         "Vanta API rate limit exceeded",
                         status_code=429,
                         retryable=True,
+                        retry_after=(
+                            parse_retry_after(e.response.headers.get("Retry-After"))
+                            if e.response is not None
+                            else None
+                        ),
                     ) from e
 
                 log_with_context(
@@ -504,7 +504,7 @@ def mock_redis_client() -> Generator[object, None, None]:
     try:
         import fakeredis
         fake_redis = fakeredis.FakeRedis(decode_responses=True)
-        with patch("redis.from_url", return_value=fake_redis):
+        with patch("redis.Redis", return_value=fake_redis):
             yield fake_redis
     except ImportError:
         # Fallback to MagicMock if fakeredis not available
@@ -513,7 +513,7 @@ def mock_redis_client() -> Generator[object, None, None]:
         mock_redis.set.return_value = True  # pyright: ignore[reportAny]
         mock_redis.get.return_value = None  # pyright: ignore[reportAny]
         mock_redis.scan.return_value = (0, [])  # pyright: ignore[reportAny]
-        with patch("redis.from_url", return_value=mock_redis):
+        with patch("redis.Redis", return_value=mock_redis):
             yield mock_redis
 
 
@@ -596,10 +596,13 @@ def reset_singletons() -> Generator[None, None, None]:
     """
     # Clear the Settings lru_cache before each test
     from terrafix.config import get_settings
+    from terrafix.orchestrator import _missing_resources  # pyright: ignore[reportPrivateUsage]
     get_settings.cache_clear()
+    _missing_resources.clear()
 
     yield
 
     # Clear again after test
     get_settings.cache_clear()
+    _missing_resources.clear()
 
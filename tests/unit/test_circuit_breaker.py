@@ -0,0 +1,99 @@
+"""
+Unit tests for the circuit breaker module.
+
+Tests cover state transitions, failure filtering, and the error raised
+while the circuit is open.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from terrafix.circuit_breaker import CircuitBreaker
+from terrafix.errors import TerraFixError
+
+
+class TestCircuitBreaker:
+    """Tests for the CircuitBreaker class."""
+
+    def test_passes_through_while_closed(self) -> None:
+        """Test that calls reach the service and return its result."""
+        breaker = CircuitBreaker("svc")
+        fn = MagicMock(return_value="ok")
+
+        assert breaker.call(fn, 1, key="value") == "ok"
+        fn.assert_called_once_with(1, key="value")
+        assert breaker.state == "closed"
+
+    def test_opens_after_threshold(self) -> None:
+        """Test that consecutive failures open the circuit and reject calls."""
+        breaker = CircuitBreaker("svc", failure_threshold=3)
+        fn = MagicMock(side_effect=RuntimeError("down"))
+
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                _ = breaker.call(fn)
+
+        with pytest.raises(TerraFixError, match="svc circuit open") as exc_info:
+            _ = breaker.call(fn)
+
+        assert breaker.state == "open"
+        assert not exc_info.value.retryable
+        assert fn.call_count == 3
+
+    def test_success_resets_failure_count(self) -> None:
+        """Test that only consecutive failures count towards the threshold."""
+        breaker = CircuitBreaker("svc", failure_threshold=2)
+        fn = MagicMock(side_effect=[RuntimeError("down"), "ok", RuntimeError("down")])
+
+        with pytest.raises(RuntimeError):
+            _ = breaker.call(fn)
+        _ = breaker.call(fn)
+        with pytest.raises(RuntimeError):
+            _ = breaker.call(fn)
+
+        assert breaker.state == "closed"
+        assert breaker.failure_count == 1
+
+    def test_ignored_errors_do_not_count(self) -> None:
+        """Test that exceptions rejected by is_failure leave the circuit closed."""
+        breaker = CircuitBreaker(
+            "svc",
+            failure_threshold=1,
+            is_failure=lambda e: not isinstance(e, ValueError),
+        )
+
+        with pytest.raises(ValueError):
+            _ = breaker.call(MagicMock(side_effect=ValueError("bad input")))
+
+        assert breaker.state == "closed"
+
+    def test_half_open_trial_closes_on_success(self) -> None:
+        """Test that a successful trial call after the cooldown closes the circuit."""
+        breaker = CircuitBreaker("svc", failure_threshold=1, cooldown=60.0)
+
+        with (
+            patch("terrafix.circuit_breaker.time.monotonic", return_value=100.0),
+            pytest.raises(RuntimeError),
+        ):
+            _ = breaker.call(MagicMock(side_effect=RuntimeError("down")))
+
+        with patch("terrafix.circuit_breaker.time.monotonic", return_value=161.0):
+            assert breaker.call(MagicMock(return_value="ok")) == "ok"
+
+        assert breaker.state == "closed"
+        assert breaker.failure_count == 0
+
+    def test_half_open_trial_reopens_on_failure(self) -> None:
+        """Test that a failed trial call re-opens the circuit for a new cooldown."""
+        breaker = CircuitBreaker("svc", failure_threshold=5, cooldown=60.0)
+        breaker.state = "open"
+        breaker.opened_at = 100.0
+
+        with patch("terrafix.circuit_breaker.time.monotonic", return_value=161.0):
+            with pytest.raises(RuntimeError):
+                _ = breaker.call(MagicMock(side_effect=RuntimeError("still down")))
+
+            assert breaker.state == "open"
+            with pytest.raises(TerraFixError, match="circuit open"):
+                _ = breaker.call(MagicMock())
@@ -154,6 +154,29 @@ class TestGitHubRepoMapping:
         repo = settings.get_repo_for_resource("arn:aws:s3:::prod-bucket-123")
         assert repo == "myorg/prod-repo"
 
+    def test_get_repo_for_resource_longest_prefix_wins(
+        self,
+        mock_env_vars: dict[str, str],
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """Test the most specific prefix is used regardless of mapping order."""
+        # Fixture used for side effects
+        _ = mock_env_vars
+        mapping = json.dumps({
+            "arn:aws:s3:::": "myorg/s3-repo",
+            "arn:aws:s3:::prod-": "myorg/prod-repo",
+            "default": "myorg/default-repo",
+        })
+        monkeypatch.setenv("GITHUB_REPO_MAPPING", mapping)
+
+        get_settings.cache_clear()
+
+        settings = Settings()  # pyright: ignore[reportCallIssue]
+
+        assert settings.get_repo_for_resource("arn:aws:s3:::prod-bucket") == "myorg/prod-repo"
+        assert settings.get_repo_for_resource("arn:aws:s3:::dev-bucket") == "myorg/s3-repo"
+        assert settings.get_repo_for_resource("arn:aws:iam::1:role/x") == "myorg/default-repo"
+
     def test_get_repo_for_resource_default_fallback(
         self,
         mock_env_vars: dict[str, str],
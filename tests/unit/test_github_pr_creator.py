@@ -31,9 +31,26 @@ class TestGitHubPRCreatorInit:
 
         creator = GitHubPRCreator(github_token="ghp_test_token")
 
-        mock_github_class.assert_called_once_with("ghp_test_token")
+        mock_github_class.assert_called_once()
+        assert mock_github_class.call_args.args == ("ghp_test_token",)
+        assert mock_github_class.call_args.kwargs["pool_size"] == 20
+        assert mock_github_class.call_args.kwargs["per_page"] == 100
+        assert creator.gh_client is mock_client
         assert creator.token == "ghp_test_token"
 
+    @patch("terrafix.github_pr_creator.Github")
+    def test_init_reuses_injected_client(
+        self,
+        mock_github_class: MagicMock,
+    ) -> None:
+        """Test that an injected GitHub client is reused instead of creating one."""
+        shared_client = MagicMock()
+
+        creator = GitHubPRCreator(github_token="ghp_test_token", gh_client=shared_client)
+
+        mock_github_class.assert_not_called()
+        assert creator.gh_client is shared_client
+
 
 class TestCreateRemediationPR:
     """Tests for GitHubPRCreator.create_remediation_pr method."""
@@ -216,6 +233,36 @@ class TestCreateRemediationPR:
         _ = _exc_info  # Suppress unused warning
 
 
+class TestCheckPathExists:
+    """Tests for GitHubPRCreator.check_path_exists method."""
+
+    @patch("terrafix.github_pr_creator.Github")
+    def test_missing_path_returns_false(
+        self,
+        mock_github_class: MagicMock,
+    ) -> None:
+        """Test that a 404 from the contents API means the path is missing."""
+        mock_repo = MagicMock()
+        mock_repo.get_contents.side_effect = UnknownObjectException(404, {}, {})  # pyright: ignore[reportAny]
+        mock_github_class.return_value.get_repo.return_value = mock_repo  # pyright: ignore[reportAny]
+
+        creator = GitHubPRCreator(github_token="ghp_test")
+
+        assert creator.check_path_exists("org/repo", "./infra/") is False
+        mock_repo.get_contents.assert_called_once_with("infra", ref="main")  # pyright: ignore[reportAny]
+
+    @patch("terrafix.github_pr_creator.Github")
+    def test_repository_root_is_not_probed(
+        self,
+        mock_github_class: MagicMock,
+    ) -> None:
+        """Test that the repository root is assumed to exist."""
+        creator = GitHubPRCreator(github_token="ghp_test")
+
+        assert creator.check_path_exists("org/repo", ".") is True
+        mock_github_class.return_value.get_repo.assert_not_called()  # pyright: ignore[reportAny]
+
+
 class TestGenerateBranchName:
     """Tests for GitHubPRCreator._generate_branch_name method."""
 
@@ -265,86 +312,29 @@ class TestGenerateBranchName:
         assert "_" not in parts[1]
         assert "/" not in parts[1]
 
-
-class TestGenerateCommitMessage:
-    """Tests for GitHubPRCreator._generate_commit_message method."""
-
-    @patch("terrafix.github_pr_creator.Github")
-    def test_commit_message_conventional_format(
-        self,
-        mock_github_class: MagicMock,
-        sample_failure: Failure,
-    ) -> None:
-        """Test that commit message follows conventional commits."""
-        mock_github_class.return_value = MagicMock()
-
-        creator = GitHubPRCreator(github_token="ghp_test")
-        message = creator._generate_commit_message(sample_failure)  # pyright: ignore[reportPrivateUsage]
-
-        # Check conventional commit format
-        assert message.startswith("fix(compliance):")
-        assert sample_failure.test_name in message
-        assert sample_failure.framework in message
-        assert sample_failure.severity in message
-
-
-class TestGeneratePRTitle:
-    """Tests for GitHubPRCreator._generate_pr_title method."""
-
     @patch("terrafix.github_pr_creator.Github")
-    def test_pr_title_contains_severity_emoji(
+    def test_branch_name_collapses_separator_runs(
         self,
         mock_github_class: MagicMock,
     ) -> None:
-        """Test that PR title includes severity emoji."""
+        """Test that runs of whitespace, underscores and slashes become one dash."""
         mock_github_class.return_value = MagicMock()
 
-        creator = GitHubPRCreator(github_token="ghp_test")
-
-        high_failure = Failure(
-            test_id="test-1",
-            test_name="Test High",
+        failure = Failure(
+            test_id="test-456",
+            test_name="S3 / Bucket\tBlock__Public",
             resource_arn="arn:aws:s3:::bucket",
             resource_type="AWS::S3::Bucket",
             failure_reason="Test",
             severity="high",
             framework="SOC2",
             failed_at="2025-01-15T10:00:00Z",
-            resource_id="res-test-1",
-        )
-
-        medium_failure = Failure(
-            test_id="test-2",
-            test_name="Test Medium",
-            resource_arn="arn:aws:s3:::bucket",
-            resource_type="AWS::S3::Bucket",
-            failure_reason="Test",
-            severity="medium",
-            framework="SOC2",
-            failed_at="2025-01-15T10:00:00Z",
-            resource_id="res-test-2",
         )
 
-        low_failure = Failure(
-            test_id="test-3",
-            test_name="Test Low",
-            resource_arn="arn:aws:s3:::bucket",
-            resource_type="AWS::S3::Bucket",
-            failure_reason="Test",
-            severity="low",
-            framework="SOC2",
-            failed_at="2025-01-15T10:00:00Z",
-            resource_id="res-test-3",
-        )
-
-        high_title = creator._generate_pr_title(high_failure)  # pyright: ignore[reportPrivateUsage]
-        medium_title = creator._generate_pr_title(medium_failure)  # pyright: ignore[reportPrivateUsage]
-        low_title = creator._generate_pr_title(low_failure)  # pyright: ignore[reportPrivateUsage]
+        creator = GitHubPRCreator(github_token="ghp_test")
+        branch_name = creator._generate_branch_name(failure)  # pyright: ignore[reportPrivateUsage]
 
-        assert "🔴" in high_title
-        assert "🟡" in medium_title
-        assert "🟢" in low_title
-        assert "[TerraFix]" in high_title
+        assert branch_name.startswith("terrafix/s3-bucket-block-public-")
 
 
 class TestGeneratePRBody:
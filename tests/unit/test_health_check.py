@@ -0,0 +1,396 @@
+"""
+Unit tests for the health check server.
+
+Tests cover the liveness, readiness, and status endpoints, response
+headers, and server lifecycle. Each test runs a real server bound to an
+ephemeral port and issues plain HTTP requests against it.
+"""
+
+import json
+import os
+import socket
+import threading
+from collections.abc import Callable, Generator
+from http.client import HTTPConnection, HTTPResponse
+from unittest.mock import patch
+
+import pytest
+
+from terrafix.health_check import HealthCheckHandler, HealthCheckServer
+
+ServerFactory = Callable[..., HealthCheckServer]
+
+
+@pytest.fixture
+def start_server() -> Generator[ServerFactory]:
+    """
+    Start health check servers on ephemeral ports and stop them after the test.
+
+    Yields:
+        Factory accepting HealthCheckServer keyword arguments
+    """
+    servers: list[HealthCheckServer] = []
+
+    def _start(
+        readiness_check: Callable[[], bool] | None = None,
+        status_provider: Callable[[], dict[str, object]] | None = None,
+        max_requests_per_second: int | None = None,
+    ) -> HealthCheckServer:
+        server = HealthCheckServer(
+            port=0,
+            readiness_check=readiness_check,
+            status_provider=status_provider,
+            max_requests_per_second=max_requests_per_second,
+        )
+        server.start()
+        servers.append(server)
+        return server
+
+    yield _start
+
+    for server in servers:
+        server.stop()
+
+
+def _get(server: HealthCheckServer, path: str) -> tuple[HTTPResponse, bytes]:
+    """Issue a GET request against a running server and read the body."""
+    assert server.socket is not None
+    port = server.socket.getsockname()[1]
+    conn = HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        body = response.read()
+        return response, body
+    finally:
+        conn.close()
+
+
+class TestHealthEndpoint:
+    """Tests for the /health liveness endpoint."""
+
+    def test_health_returns_healthy(self, start_server: ServerFactory) -> None:
+        """Test that /health always reports healthy."""
+        server = start_server()
+
+        response, body = _get(server, "/health")
+
+        assert response.status == 200
+        assert json.loads(body) == {"status": "healthy"}
+
+    def test_response_headers(self, start_server: ServerFactory) -> None:
+        """Test that JSON responses carry content and caching headers."""
+        server = start_server()
+
+        response, body = _get(server, "/health")
+
+        assert response.getheader("Content-Type") == "application/json"
+        assert response.getheader("Cache-Control") == "no-cache, no-store, must-revalidate"
+        assert response.getheader("Content-Length") == str(len(body))
+
+    def test_no_reverse_dns_lookup(self, start_server: ServerFactory) -> None:
+        """Test that serving a probe never resolves the client's hostname."""
+        server = start_server()
+        lookup = AssertionError("reverse DNS lookup")
+
+        with (
+            patch("socket.getfqdn", side_effect=lookup),
+            patch("socket.gethostbyaddr", side_effect=lookup),
+        ):
+            response, _ = _get(server, "/health")
+
+        assert response.status == 200
+
+    def test_static_responses_are_preencoded(self) -> None:
+        """Test that constant responses are complete pre-built HTTP messages."""
+        raw = HealthCheckHandler._RESP_HEALTHY  # pyright: ignore[reportPrivateUsage]
+        head, _, body = raw.partition(b"\r\n\r\n")
+
+        assert head.startswith(b"HTTP/1.1 200 OK\r\n")
+        assert b"Connection: close" in head
+        assert f"Content-Length: {len(body)}".encode() in head
+        assert json.loads(body) == {"status": "healthy"}
+
+
+class TestReadyEndpoint:
+    """Tests for the /ready readiness endpoint."""
+
+    def test_ready_without_check(self, start_server: ServerFactory) -> None:
+        """Test that /ready assumes ready when no check is configured."""
+        server = start_server()
+
+        response, body = _get(server, "/ready")
+
+        assert response.status == 200
+        assert json.loads(body) == {"status": "ready"}
+
+    def test_ready_when_check_passes(self, start_server: ServerFactory) -> None:
+        """Test that /ready returns 200 when the readiness check passes."""
+        server = start_server(readiness_check=lambda: True)
+
+        response, body = _get(server, "/ready")
+
+        assert response.status == 200
+        assert json.loads(body) == {"status": "ready"}
+
+    def test_not_ready_when_check_fails(self, start_server: ServerFactory) -> None:
+        """Test that /ready returns 503 when the readiness check fails."""
+        server = start_server(readiness_check=lambda: False)
+
+        response, body = _get(server, "/ready")
+
+        assert response.status == 503
+        assert json.loads(body) == {"status": "not ready"}
+
+    def test_not_ready_when_check_raises(self, start_server: ServerFactory) -> None:
+        """Test that /ready returns 503 with the error when the check raises."""
+
+        def _broken() -> bool:
+            raise RuntimeError("redis down")
+
+        server = start_server(readiness_check=_broken)
+
+        response, body = _get(server, "/ready")
+
+        assert response.status == 503
+        assert json.loads(body) == {"status": "not ready", "error": "redis down"}
+
+
+class TestStatusEndpoint:
+    """Tests for the /status endpoint."""
+
+    def test_status_without_provider(self, start_server: ServerFactory) -> None:
+        """Test that /status reports running with no provider."""
+        server = start_server()
+
+        response, body = _get(server, "/status")
+
+        assert response.status == 200
+        assert json.loads(body) == {"status": "running"}
+
+    def test_status_merges_provider(self, start_server: ServerFactory) -> None:
+        """Test that /status merges the provider's fields."""
+        server = start_server(status_provider=lambda: {"failures_processed": 3})
+
+        response, body = _get(server, "/status")
+
+        assert response.status == 200
+        assert json.loads(body) == {"status": "running", "failures_processed": 3}
+
+    def test_status_provider_can_override_status(self, start_server: ServerFactory) -> None:
+        """Test that a provider's own "status" field replaces "running"."""
+        server = start_server(status_provider=lambda: {"status": "degraded", "queue": 2})
+
+        response, body = _get(server, "/status")
+
+        assert response.status == 200
+        assert json.loads(body) == {"status": "degraded", "queue": 2}
+
+    def test_status_with_empty_provider_result(self, start_server: ServerFactory) -> None:
+        """Test that an empty provider result yields well-formed JSON."""
+        server = start_server(status_provider=dict)
+
+        _, body = _get(server, "/status")
+
+        assert json.loads(body) == {"status": "running"}
+
+    def test_status_provider_result_is_cached(self, start_server: ServerFactory) -> None:
+        """Test that rapid /status polls reuse a recent provider result."""
+        calls: list[int] = []
+
+        def _counting() -> dict[str, object]:
+            calls.append(1)
+            return {"calls": len(calls)}
+
+        server = start_server(status_provider=_counting)
+
+        _, first = _get(server, "/status")
+        _, second = _get(server, "/status")
+
+        assert len(calls) == 1
+        assert json.loads(first) == json.loads(second) == {"status": "running", "calls": 1}
+
+    def test_status_reports_provider_error(self, start_server: ServerFactory) -> None:
+        """Test that /status reports provider errors instead of failing."""
+
+        def _broken() -> dict[str, object]:
+            raise RuntimeError("boom")
+
+        server = start_server(status_provider=_broken)
+
+        response, body = _get(server, "/status")
+
+        assert response.status == 200
+        assert json.loads(body) == {"status": "running", "status_error": "boom"}
+
+
+class TestConcurrentProbes:
+    """Tests for concurrent request handling."""
+
+    def test_slow_status_does_not_block_health(self, start_server: ServerFactory) -> None:
+        """Test that /health is served while a slow /status request is in flight."""
+        release = threading.Event()
+        entered = threading.Event()
+
+        def _slow_status() -> dict[str, object]:
+            entered.set()
+            _ = release.wait(timeout=5)
+            return {}
+
+        server = start_server(status_provider=_slow_status)
+        status_thread = threading.Thread(target=_get, args=(server, "/status"))
+        status_thread.start()
+        try:
+            assert entered.wait(timeout=5)
+
+            response, _ = _get(server, "/health")
+
+            assert response.status == 200
+        finally:
+            release.set()
+            status_thread.join(timeout=5)
+
+
+class TestRequestLimiter:
+    """Tests for load shedding under excessive request rates."""
+
+    def test_excess_requests_get_429(self, start_server: ServerFactory) -> None:
+        """Test that requests beyond the burst budget are rejected with 429."""
+        calls: list[int] = []
+
+        def _status() -> dict[str, object]:
+            calls.append(1)
+            return {}
+
+        server = start_server(status_provider=_status, max_requests_per_second=1)
+
+        statuses = [_get(server, "/nope")[0].status for _ in range(2)]
+        response, body = _get(server, "/status")
+
+        assert statuses == [404, 404]
+        assert response.status == 429
+        assert json.loads(body) == {"error": "too many requests"}
+        assert calls == []
+
+    def test_probes_are_not_shed(self, start_server: ServerFactory) -> None:
+        """Test that /health and /ready still answer once the budget is drained."""
+        server = start_server(readiness_check=lambda: True, max_requests_per_second=1)
+
+        statuses = [_get(server, "/status")[0].status for _ in range(3)]
+        health, _ = _get(server, "/health")
+        ready, _ = _get(server, "/ready")
+
+        assert statuses == [200, 200, 429]
+        assert health.status == 200
+        assert ready.status == 200
+
+
+class TestUnknownPath:
+    """Tests for unknown paths."""
+
+    def test_unknown_path_returns_404(self, start_server: ServerFactory) -> None:
+        """Test that unknown paths return 404."""
+        server = start_server()
+
+        response, body = _get(server, "/nope")
+
+        assert response.status == 404
+        assert json.loads(body) == {"error": "not found"}
+
+    def test_static_paths_skip_serialization(self, start_server: ServerFactory) -> None:
+        """Test that 404 and /health are served without encoding JSON per request."""
+        server = start_server()
+
+        with patch("terrafix.health_check._dumps", side_effect=AssertionError("encoded")):
+            not_found, _ = _get(server, "/nope")
+            healthy, _ = _get(server, "/health")
+
+        assert not_found.status == 404
+        assert healthy.status == 200
+
+
+class TestRequestParsing:
+    """Tests for requests outside the supported GET probes."""
+
+    def test_unsupported_method_returns_501(self, start_server: ServerFactory) -> None:
+        """Test that non-GET requests are rejected with 501."""
+        server = start_server()
+        assert server.socket is not None
+        conn = HTTPConnection("127.0.0.1", server.socket.getsockname()[1], timeout=5)
+        try:
+            conn.request("POST", "/health", body=b"{}")
+            response = conn.getresponse()
+            body = response.read()
+        finally:
+            conn.close()
+
+        assert response.status == 501
+        assert json.loads(body) == {"error": "unsupported method"}
+
+    def test_malformed_request_line_returns_400(self, start_server: ServerFactory) -> None:
+        """Test that a malformed request line is rejected with 400."""
+        server = start_server()
+        assert server.socket is not None
+
+        with socket.create_connection(("127.0.0.1", server.socket.getsockname()[1]), 5) as sock:
+            sock.sendall(b"GARBAGE\r\n\r\n")
+            raw = sock.makefile("rb").read()
+
+        assert raw.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+
+
+class TestHealthCheckServerInit:
+    """Tests for HealthCheckServer construction."""
+
+    def test_rejects_non_callable_readiness_check(self) -> None:
+        """Test that a non-callable readiness check raises TypeError."""
+        with pytest.raises(TypeError, match="readiness_check"):
+            _ = HealthCheckServer(readiness_check="yes")  # type: ignore[call-overload]
+
+    def test_rejects_non_callable_status_provider(self) -> None:
+        """Test that a non-callable status provider raises TypeError."""
+        with pytest.raises(TypeError, match="status_provider"):
+            _ = HealthCheckServer(status_provider=42)  # type: ignore[call-overload]
+
+    @pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT unsupported")
+    def test_listening_socket_allows_port_reuse(self, start_server: ServerFactory) -> None:
+        """Test that the listening socket is bound with SO_REUSEPORT."""
+        server = start_server()
+        assert server.socket is not None
+
+        reuse_port = server.socket.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+
+        assert reuse_port != 0
+
+    @pytest.mark.skipif(not hasattr(os, "sched_getaffinity"), reason="CPU affinity unsupported")
+    def test_affinity_cpu_pins_request_threads(self) -> None:
+        """Test that requests are handled on the configured CPU only."""
+        cpu = min(os.sched_getaffinity(0))
+        observed: list[set[int]] = []
+
+        def _ready() -> bool:
+            observed.append(os.sched_getaffinity(0))
+            return True
+
+        with HealthCheckServer(port=0, readiness_check=_ready, affinity_cpu=cpu) as server:
+            response, _ = _get(server, "/ready")
+
+        assert response.status == 200
+        assert observed == [{cpu}]
+
+    def test_servers_keep_separate_callbacks(self, start_server: ServerFactory) -> None:
+        """Test that two servers in one process do not clobber each other's config."""
+        first = start_server(readiness_check=lambda: True, status_provider=lambda: {"n": 1})
+        second = start_server(readiness_check=lambda: False, status_provider=lambda: {"n": 2})
+
+        assert _get(first, "/ready")[0].status == 200
+        assert _get(second, "/ready")[0].status == 503
+        assert json.loads(_get(first, "/status")[1]) == {"status": "running", "n": 1}
+        assert json.loads(_get(second, "/status")[1]) == {"status": "running", "n": 2}
+        assert HealthCheckHandler.readiness_check is None
+
+    def test_stop_without_start_is_safe(self) -> None:
+        """Test that stop() is a no-op when the server never started."""
+        server = HealthCheckServer(port=0)
+
+        server.stop()
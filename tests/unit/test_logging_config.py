@@ -0,0 +1,192 @@
+"""
+Unit tests for structured logging configuration.
+
+Tests cover JSON formatting of log records, extra field handling,
+correlation ID propagation, and the log_with_context helper.
+"""
+
+import io
+import json
+import logging
+import sys
+from collections.abc import Generator
+
+import pytest
+
+from terrafix.logging_config import (
+    BytesStreamHandler,
+    LogContext,
+    StructuredFormatter,
+    clear_correlation_id,
+    log_with_context,
+    set_correlation_id,
+)
+
+
+def _make_record(message: str = "hello", **extra: object) -> logging.LogRecord:
+    """Build a LogRecord carrying the given extra fields."""
+    record = logging.LogRecord(
+        name="terrafix.test",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg=message,
+        args=(),
+        exc_info=None,
+    )
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+@pytest.fixture(autouse=True)
+def _reset_correlation_id() -> Generator[None]:
+    """Ensure each test starts and ends without a correlation ID."""
+    clear_correlation_id()
+    yield
+    clear_correlation_id()
+
+
+class TestStructuredFormatter:
+    """Tests for StructuredFormatter.format."""
+
+    def test_formats_standard_fields(self) -> None:
+        """Test that standard fields are emitted as JSON."""
+        entry = json.loads(StructuredFormatter().format(_make_record("Processing")))
+
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "terrafix.test"
+        assert entry["message"] == "Processing"
+        assert entry["timestamp"].endswith("Z")
+
+    def test_includes_extra_fields(self) -> None:
+        """Test that extras are added as top-level fields."""
+        record = _make_record(test_id="test-123", count=3)
+
+        entry = json.loads(StructuredFormatter().format(record))
+
+        assert entry["test_id"] == "test-123"
+        assert entry["count"] == 3
+        assert "lineno" not in entry
+        assert "msg" not in entry
+        assert "taskName" not in entry
+
+    def test_non_serializable_extra_uses_str(self) -> None:
+        """Test that values JSON cannot encode are rendered with str()."""
+        record = _make_record(error=ValueError("bad value"))
+
+        entry = json.loads(StructuredFormatter().format(record))
+
+        assert entry["error"] == "bad value"
+
+    def test_includes_exception_info(self) -> None:
+        """Test that exception tracebacks are included."""
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = _make_record()
+            record.exc_info = sys.exc_info()
+
+        entry = json.loads(StructuredFormatter().format(record))
+
+        assert "RuntimeError: boom" in entry["exc_info"]
+
+    def test_includes_correlation_id(self) -> None:
+        """Test that the current correlation ID is included."""
+        set_correlation_id("corr-123")
+
+        entry = json.loads(StructuredFormatter().format(_make_record()))
+
+        assert entry["correlation_id"] == "corr-123"
+
+    def test_omits_unset_correlation_id(self) -> None:
+        """Test that correlation_id is left out when none is set."""
+        entry = json.loads(StructuredFormatter().format(_make_record()))
+
+        assert "correlation_id" not in entry
+
+    def test_timestamp_uses_record_creation_time(self) -> None:
+        """Test that the timestamp reflects when the record was created."""
+        record = _make_record()
+        record.created = 1_700_000_000.25
+
+        entry = json.loads(StructuredFormatter().format(record))
+
+        assert entry["timestamp"] == "2023-11-14T22:13:20.250000Z"
+
+
+class TestBytesStreamHandler:
+    """Tests for BytesStreamHandler."""
+
+    def test_writes_json_lines_to_binary_stream(self) -> None:
+        """Test that records are written as newline-terminated JSON bytes."""
+        stream = io.BytesIO()
+        handler = BytesStreamHandler(stream)
+        handler.setFormatter(StructuredFormatter())
+
+        handler.handle(_make_record("first", test_id="t-1"))
+        handler.handle(_make_record("second"))
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["test_id"] == "t-1"
+        assert json.loads(lines[1])["message"] == "second"
+
+    def test_supports_plain_formatters(self) -> None:
+        """Test that non-structured formatters are encoded as UTF-8."""
+        stream = io.BytesIO()
+        handler = BytesStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+
+        handler.handle(_make_record("héllo"))
+
+        assert stream.getvalue() == "INFO héllo\n".encode()
+
+
+class TestLogWithContext:
+    """Tests for the log_with_context helper."""
+
+    def test_passes_context_as_extra(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that context fields are attached to the log record."""
+        logger = logging.getLogger("terrafix.test.context")
+
+        with caplog.at_level(logging.INFO, logger="terrafix.test.context"):
+            log_with_context(logger, "info", "Processing failure", test_id="test-1")
+
+        assert len(caplog.records) == 1
+        record = caplog.records[0]
+        assert record.getMessage() == "Processing failure"
+        assert record.__dict__["test_id"] == "test-1"
+
+    def test_respects_level(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that messages below the logger level are dropped."""
+        logger = logging.getLogger("terrafix.test.level")
+
+        with caplog.at_level(logging.WARNING, logger="terrafix.test.level"):
+            log_with_context(logger, "debug", "Hidden", test_id="test-1")
+            log_with_context(logger, "error", "Shown")
+
+        assert [r.getMessage() for r in caplog.records] == ["Shown"]
+
+    def test_accepts_uppercase_level(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that level names are case-insensitive."""
+        logger = logging.getLogger("terrafix.test.upper")
+
+        with caplog.at_level(logging.INFO, logger="terrafix.test.upper"):
+            log_with_context(logger, "WARNING", "Upper")
+
+        assert caplog.records[0].levelno == logging.WARNING
+
+
+class TestLogContext:
+    """Tests for the LogContext context manager."""
+
+    def test_sets_and_clears_correlation_id(self) -> None:
+        """Test that LogContext scopes the correlation ID."""
+        with LogContext("scoped-id") as correlation_id:
+            entry = json.loads(StructuredFormatter().format(_make_record()))
+            assert correlation_id == "scoped-id"
+            assert entry["correlation_id"] == "scoped-id"
+
+        entry = json.loads(StructuredFormatter().format(_make_record()))
+        assert "correlation_id" not in entry
@@ -0,0 +1,271 @@
+"""
+Unit tests for the metrics module.
+
+Tests cover per-thread counters and their retirement, the cached
+get_metrics snapshot, the timing ring buffer and its summaries, and
+reset.
+"""
+
+import threading
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+from terrafix.metrics import MetricsCollector, StageTimer, metrics_collector
+
+
+@pytest.fixture(autouse=True)
+def collector() -> Generator[MetricsCollector]:
+    """
+    Provide the shared collector, reset before and after each test.
+
+    Yields:
+        The metrics_collector singleton
+    """
+    metrics_collector.reset()
+    yield metrics_collector
+    metrics_collector.reset()
+
+
+def _increment_in_threads(
+    collector: MetricsCollector,
+    threads: int,
+    per_thread: int,
+    name: str = "events_total",
+) -> list[threading.Thread]:
+    """
+    Increment a counter from several threads and wait for them to exit.
+
+    Args:
+        collector: Collector to increment
+        threads: Number of threads
+        per_thread: Increments made by each thread
+        name: Counter name
+
+    Returns:
+        The finished threads
+    """
+    start = threading.Barrier(threads)
+
+    def work() -> None:
+        _ = start.wait()
+        for _ in range(per_thread):
+            collector.increment(name, labels={"source": "test"})
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return workers
+
+
+class TestCounters:
+    """Tests for counters accumulated per thread."""
+
+    def test_counts_are_summed_across_threads(self, collector: MetricsCollector) -> None:
+        """Test that increments from every thread are counted."""
+        _ = _increment_in_threads(collector, threads=8, per_thread=500)
+        collector.increment("events_total", value=3, labels={"source": "test"})
+
+        assert collector.get_counter("events_total", labels={"source": "test"}) == 4003
+        assert collector.get_metrics()["counters"] == {"events_total{source=test}": 4003}
+
+    def test_counts_survive_thread_exit(self, collector: MetricsCollector) -> None:
+        """Test that exited threads are retired without losing their counts."""
+        workers = _increment_in_threads(collector, threads=4, per_thread=100)
+
+        assert collector.get_metrics()["counters"]["events_total{source=test}"] == 400
+        registered = [thread for thread, _ in collector._thread_counts]  # pyright: ignore[reportPrivateUsage]
+        assert not any(worker in registered for worker in workers)
+        assert collector.get_counter("events_total", labels={"source": "test"}) == 400
+
+        _ = _increment_in_threads(collector, threads=2, per_thread=50)
+
+        assert collector.get_metrics()["counters"]["events_total{source=test}"] == 500
+
+    def test_label_set_matches_labels_dict(self, collector: MetricsCollector) -> None:
+        """Test that a precomputed label set counts into the same series."""
+        labels = MetricsCollector.label_set({"service": "bedrock", "kind": "throttle"})
+
+        collector.increment("api_errors_total", labels=labels)
+        collector.increment("api_errors_total", labels={"kind": "throttle", "service": "bedrock"})
+
+        assert collector.get_counter("api_errors_total", labels=labels) == 2
+
+
+class TestSnapshot:
+    """Tests for the cached sections of get_metrics."""
+
+    def test_unchanged_metrics_reuse_snapshot(self, collector: MetricsCollector) -> None:
+        """Test that scrapes without updates do not rebuild the sections."""
+        collector.increment("events_total")
+        first = collector.get_metrics()
+
+        second = collector.get_metrics()
+
+        # The cached sections are returned as they are, not rebuilt
+        assert second["counters"] is first["counters"]
+        assert second["gauges"] is first["gauges"]
+        assert second["timings"] is first["timings"]
+
+    def test_increment_invalidates_snapshot(self, collector: MetricsCollector) -> None:
+        """Test that a counter update shows up in the next scrape."""
+        collector.increment("events_total")
+        _ = collector.get_metrics()
+
+        collector.increment("events_total")
+
+        assert collector.get_metrics()["counters"]["events_total"] == 2
+
+    def test_set_gauge_invalidates_snapshot(self, collector: MetricsCollector) -> None:
+        """Test that a gauge update shows up in the next scrape."""
+        collector.set_gauge("queue_depth", 5)
+        _ = collector.get_metrics()
+
+        collector.set_gauge("queue_depth", 2)
+
+        assert collector.get_metrics()["gauges"]["queue_depth"] == 2
+
+    def test_record_timing_invalidates_snapshot(self, collector: MetricsCollector) -> None:
+        """Test that a new timing sample shows up in the next scrape."""
+        collector._record_timing("op", 1_000_000)  # pyright: ignore[reportPrivateUsage]
+        assert collector.get_metrics()["timings"]["op"]["count"] == 1
+
+        collector._record_timing("op", 3_000_000)  # pyright: ignore[reportPrivateUsage]
+
+        timing = collector.get_metrics()["timings"]["op"]
+        assert timing["count"] == 2
+        assert timing["max_seconds"] == pytest.approx(0.003)
+
+
+class TestTimings:
+    """Tests for the timing ring buffer and its summaries."""
+
+    def test_ring_keeps_most_recent_samples(self, collector: MetricsCollector) -> None:
+        """Test that the ring wraps around and summarizes the latest window."""
+        for ms in range(1, 1501):
+            collector._record_timing("op", ms * 1_000_000)  # pyright: ignore[reportPrivateUsage]
+
+        stats = collector.get_timing_stats("op")
+
+        assert stats is not None
+        assert stats["count"] == 1024
+        # Samples 1..476 ms were overwritten
+        assert stats["min"] == pytest.approx(0.477)
+        assert stats["max"] == pytest.approx(1.5)
+
+    @pytest.mark.parametrize("samples", [1500, 1024, 700])
+    def test_numpy_and_sort_paths_agree(self, collector: MetricsCollector, samples: int) -> None:
+        """Test that summaries match with and without NumPy."""
+
+        def record_samples() -> None:
+            for i in range(samples):
+                # Out of order, so percentiles depend on ranking
+                duration_ns = (i * 7919) % 10_007 * 1000
+                collector._record_timing("op", duration_ns)  # pyright: ignore[reportPrivateUsage]
+
+        record_samples()
+        with_numpy = collector.get_timing_stats("op")
+
+        collector.reset()
+        record_samples()
+        with patch("terrafix.metrics.np", None):
+            with_sort = collector.get_timing_stats("op")
+
+        assert with_numpy is not None
+        assert with_sort is not None
+        assert with_numpy["count"] == min(samples, 1024)
+        for field in ("count", "min", "max", "p50", "p95", "p99"):
+            assert with_numpy[field] == with_sort[field]
+        assert with_numpy["mean"] == pytest.approx(with_sort["mean"])
+
+    def test_time_start_and_stop_record_duration(self, collector: MetricsCollector) -> None:
+        """Test that time_stop records the time elapsed since time_start."""
+        with patch("terrafix.metrics.time.perf_counter_ns", side_effect=[1_000, 2_501_000]):
+            token = collector.time_start()
+            duration = collector.time_stop(StageTimer.BEDROCK_INFERENCE, token)
+
+        assert duration == pytest.approx(0.0025)
+        stats = collector.get_timing_stats(StageTimer.BEDROCK_INFERENCE.value)
+        assert stats is not None
+        assert stats["count"] == 1
+        assert stats["p50"] == pytest.approx(0.0025)
+
+    def test_start_timer_records_on_exit(self, collector: MetricsCollector) -> None:
+        """Test that the Timer context manager records one sample."""
+        with collector.start_timer(StageTimer.CREATE_PR, labels={"repo": "r"}) as timer:
+            pass
+
+        stats = collector.get_timing_stats(StageTimer.CREATE_PR.value, labels={"repo": "r"})
+        assert stats is not None
+        assert stats["count"] == 1
+        assert stats["max"] == pytest.approx(timer.duration)
+
+
+class TestReset:
+    """Tests for MetricsCollector.reset."""
+
+    def test_reset_clears_every_thread(self, collector: MetricsCollector) -> None:
+        """Test that counts of live, exited, and current threads are cleared."""
+        _ = _increment_in_threads(collector, threads=3, per_thread=10)
+        _ = collector.get_metrics()  # Retires the exited threads
+        collector.increment("events_total", labels={"source": "test"})
+
+        stop = threading.Event()
+        counted = threading.Event()
+
+        def live_worker() -> None:
+            collector.increment("events_total", labels={"source": "test"})
+            counted.set()
+            _ = stop.wait()
+
+        worker = threading.Thread(target=live_worker)
+        worker.start()
+        try:
+            _ = counted.wait()
+            collector.set_gauge("queue_depth", 4)
+            collector._record_timing("op", 1_000)  # pyright: ignore[reportPrivateUsage]
+            assert collector.get_counter("events_total", labels={"source": "test"}) == 32
+
+            collector.reset()
+
+            metrics = collector.get_metrics()
+            assert collector.get_counter("events_total", labels={"source": "test"}) == 0
+            assert metrics["counters"] == {}
+            assert metrics["gauges"] == {}
+            assert metrics["timings"] == {}
+        finally:
+            stop.set()
+            worker.join()
+
+    def test_reset_clears_intern_caches(self, collector: MetricsCollector) -> None:
+        """Test that cached keys and label strings are dropped."""
+        collector.increment("requests_total", labels={"repo": "org/a"})
+        _ = collector.get_metrics()
+
+        collector.reset()
+
+        assert collector._key_cache == {}  # pyright: ignore[reportPrivateUsage]
+        assert collector._label_str_cache == {}  # pyright: ignore[reportPrivateUsage]
+
+
+class TestInternCaches:
+    """Tests for the metric key and label string caches."""
+
+    def test_caches_are_bounded(self, collector: MetricsCollector) -> None:
+        """Test that many distinct label sets neither grow the caches nor lose counts."""
+        with (
+            patch("terrafix.metrics._KEY_CACHE_SIZE", 8),
+            patch("terrafix.metrics._LABEL_STR_CACHE_SIZE", 8),
+        ):
+            for i in range(20):
+                collector.increment("requests_total", labels={"repo": f"org/{i}"})
+                collector.increment("requests_total", labels={"repo": f"org/{i}"})
+            counters = collector.get_metrics()["counters"]
+
+        assert len(collector._key_cache["requests_total"]) == 8  # pyright: ignore[reportPrivateUsage]
+        assert len(collector._label_str_cache) == 8  # pyright: ignore[reportPrivateUsage]
+        assert len(counters) == 20
+        assert counters["requests_total{repo=org/19}"] == 2
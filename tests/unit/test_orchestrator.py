@@ -5,9 +5,13 @@ Tests cover the end-to-end processing pipeline, deduplication,
 retry logic, error handling, and validation.
 """
 
+import asyncio
 import tempfile
+import threading
+import time
+from collections.abc import Iterator
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -16,13 +20,21 @@ from terrafix.errors import (
     BedrockError,
     GitHubError,
     ResourceNotFoundError,
+    StateStoreError,
     TerraFixError,
 )
 from terrafix.orchestrator import (
+    CIRCUIT_FAILURE_THRESHOLD,
     ProcessingResult,
+    RepoCheckout,
+    _analyzer_cache,  # pyright: ignore[reportPrivateUsage]
+    _clone_repository,  # pyright: ignore[reportPrivateUsage]
+    _get_analyzer,  # pyright: ignore[reportPrivateUsage]
+    _github_breaker,  # pyright: ignore[reportPrivateUsage]
     _process_failure_once,  # pyright: ignore[reportPrivateUsage]
     _process_failure_with_retry,  # pyright: ignore[reportPrivateUsage]
     process_failure,
+    process_failures_async,
 )
 from terrafix.redis_state_store import RedisStateStore
 from terrafix.remediation_generator import RemediationFix, TerraformRemediationGenerator
@@ -32,6 +44,15 @@ from terrafix.vanta_client import Failure, VantaClient
 class TestProcessingResult:
     """Tests for the ProcessingResult class."""
 
+    def test_result_is_immutable_and_hashable(self) -> None:
+        """Test that results cannot be modified and can be collected in sets."""
+        result = ProcessingResult(success=True, failure_hash="abc123")
+
+        with pytest.raises(AttributeError):
+            result.success = False  # pyright: ignore[reportAttributeAccessIssue]
+
+        assert len({result, ProcessingResult(success=True, failure_hash="abc123")}) == 1
+
     def test_success_result(self) -> None:
         """Test creating a successful processing result."""
         result = ProcessingResult(
@@ -83,7 +104,7 @@ class TestProcessFailure:
         """Test that already-processed failures are skipped."""
         # Mock state store
         mock_state_store = MagicMock(spec=RedisStateStore)
-        mock_state_store.is_already_processed.return_value = True  # pyright: ignore[reportAny]
+        mock_state_store.claim_with_metadata.return_value = False  # pyright: ignore[reportAny]
 
         # Mock vanta client
         mock_vanta = MagicMock(spec=VantaClient)
@@ -117,7 +138,7 @@ class TestProcessFailure:
 
         # Mock state store
         mock_state_store = MagicMock(spec=RedisStateStore)
-        mock_state_store.is_already_processed.return_value = False  # pyright: ignore[reportAny]
+        mock_state_store.claim_with_metadata.return_value = True  # pyright: ignore[reportAny]
 
         # Mock vanta client
         mock_vanta = MagicMock(spec=VantaClient)
@@ -137,9 +158,59 @@ class TestProcessFailure:
 
         assert result.success is True
         assert result.pr_url == "https://github.com/org/repo/pull/42"
-        mock_state_store.mark_in_progress.assert_called_once()  # pyright: ignore[reportAny]
+        mock_state_store.claim_with_metadata.assert_called_once()  # pyright: ignore[reportAny]
         mock_state_store.mark_processed.assert_called_once()  # pyright: ignore[reportAny]
 
+    @patch("terrafix.orchestrator._process_failure_with_retry")
+    def test_process_failure_skips_duplicate_in_flight(
+        self,
+        mock_retry: MagicMock,
+        mock_settings: Settings,
+        sample_failure: Failure,
+    ) -> None:
+        """Test that a failure already being processed is skipped, then released."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_retry(**_: object) -> str:
+            started.set()
+            _ = release.wait(timeout=5)
+            return "https://github.com/org/repo/pull/42"
+
+        mock_retry.side_effect = slow_retry
+
+        mock_state_store = MagicMock(spec=RedisStateStore)
+        mock_state_store.claim_with_metadata.return_value = True  # pyright: ignore[reportAny]
+        mock_vanta = MagicMock(spec=VantaClient)
+        mock_vanta.generate_failure_hash.return_value = "dup_hash"  # pyright: ignore[reportAny]
+
+        def run() -> ProcessingResult:
+            return process_failure(
+                failure=sample_failure,
+                config=mock_settings,
+                state_store=mock_state_store,
+                vanta=mock_vanta,
+                generator=MagicMock(spec=TerraformRemediationGenerator),
+                gh=MagicMock(),
+            )
+
+        results: list[ProcessingResult] = []
+        first = threading.Thread(target=lambda: results.append(run()))
+        first.start()
+        assert started.wait(timeout=5)
+
+        duplicate = run()
+        release.set()
+        first.join(timeout=5)
+
+        assert duplicate.skipped is True
+        assert results[0].pr_url == "https://github.com/org/repo/pull/42"
+        assert mock_retry.call_count == 1
+
+        # Once finished, the same failure can be processed again
+        assert run().skipped is False
+        assert mock_retry.call_count == 2
+
     @patch("terrafix.orchestrator._process_failure_with_retry")
     def test_process_failure_marks_failed_on_error(
         self,
@@ -152,7 +223,7 @@ class TestProcessFailure:
 
         # Mock state store
         mock_state_store = MagicMock(spec=RedisStateStore)
-        mock_state_store.is_already_processed.return_value = False  # pyright: ignore[reportAny]
+        mock_state_store.claim_with_metadata.return_value = True  # pyright: ignore[reportAny]
 
         # Mock vanta client
         mock_vanta = MagicMock(spec=VantaClient)
@@ -175,6 +246,334 @@ class TestProcessFailure:
         mock_state_store.mark_failed.assert_called_once()  # pyright: ignore[reportAny]
 
 
+class TestProcessFailuresAsync:
+    """Tests for the process_failures_async function."""
+
+    @pytest.fixture(autouse=True)
+    def mock_git(self) -> Iterator[MagicMock]:
+        """Keep repository prefetches from running git."""
+        with patch("terrafix.orchestrator.SecureGitClient") as mock_git_class:
+            mock_git = mock_git_class.return_value  # pyright: ignore[reportAny]
+            mock_git.ensure_mirror_async = AsyncMock()
+            yield mock_git  # pyright: ignore[reportAny]
+
+    @pytest.fixture
+    def store(self) -> MagicMock:
+        """State store that has processed nothing yet."""
+        store = MagicMock(spec=RedisStateStore)
+        store.claim_with_metadata.return_value = True  # pyright: ignore[reportAny]
+        store.batch_filter_unprocessed.side_effect = set  # pyright: ignore[reportAny]
+        return store
+
+    @pytest.fixture
+    def vanta(self) -> MagicMock:
+        """Vanta client hashing each failure to its test ID."""
+        vanta = MagicMock(spec=VantaClient)
+        vanta.generate_failure_hash.side_effect = lambda f: f.test_id  # pyright: ignore[reportAny]
+        return vanta
+
+    @staticmethod
+    def _failures(sample_failure: Failure, count: int) -> list[Failure]:
+        """Distinct failures in the sample failure's repository."""
+        return [
+            Failure(**{**sample_failure.model_dump(), "test_id": f"t-{i}"}) for i in range(count)
+        ]
+
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_results_in_input_order(
+        self,
+        mock_process_once: MagicMock,
+        mock_settings: Settings,
+        store: MagicMock,
+        vanta: MagicMock,
+        sample_failure: Failure,
+    ) -> None:
+        """Test results are returned in the order failures were given."""
+
+        def fake_process_once(failure: Failure, **_: object) -> str:
+            # Finish in reverse order
+            time.sleep(0.01 * (5 - int(failure.test_id[2:])))
+            return f"https://github.com/org/repo/pull/{failure.test_id}"
+
+        mock_process_once.side_effect = fake_process_once
+
+        results = asyncio.run(
+            process_failures_async(
+                self._failures(sample_failure, 5),
+                mock_settings,
+                store,
+                vanta,
+                MagicMock(),
+                MagicMock(),
+                concurrency=5,
+            )
+        )
+
+        assert [r.failure_hash for r in results] == [f"t-{i}" for i in range(5)]
+        assert all(r.success for r in results)
+
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_concurrency_limit(
+        self,
+        mock_process_once: MagicMock,
+        mock_settings: Settings,
+        store: MagicMock,
+        vanta: MagicMock,
+        sample_failure: Failure,
+    ) -> None:
+        """Test no more than concurrency failures run at once."""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def fake_process_once(failure: Failure, **_: object) -> str:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return f"https://github.com/org/repo/pull/{failure.test_id}"
+
+        mock_process_once.side_effect = fake_process_once
+
+        results = asyncio.run(
+            process_failures_async(
+                self._failures(sample_failure, 8),
+                mock_settings,
+                store,
+                vanta,
+                MagicMock(),
+                MagicMock(),
+                concurrency=2,
+                batch_size=4,
+            )
+        )
+
+        assert len(results) == 8
+        assert peak == 2
+
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_backoff_does_not_hold_concurrency_slot(
+        self,
+        mock_process_once: MagicMock,
+        mock_settings: Settings,
+        store: MagicMock,
+        vanta: MagicMock,
+        sample_failure: Failure,
+    ) -> None:
+        """Test another failure runs while one waits to retry."""
+        attempts: list[str] = []
+
+        def fake_process_once(failure: Failure, **_: object) -> str:
+            attempts.append(failure.test_id)
+            if attempts == ["t-0"]:
+                raise BedrockError("Throttling", retryable=True)
+            return f"https://github.com/org/repo/pull/{failure.test_id}"
+
+        mock_process_once.side_effect = fake_process_once
+
+        # Leave a 50ms backoff after jitter
+        with patch("terrafix.orchestrator.random.uniform", side_effect=lambda a, b: b - 0.05):
+            results = asyncio.run(
+                process_failures_async(
+                    self._failures(sample_failure, 2),
+                    mock_settings,
+                    store,
+                    vanta,
+                    MagicMock(),
+                    MagicMock(),
+                    concurrency=1,
+                )
+            )
+
+        assert all(r.success for r in results)
+        assert attempts == ["t-0", "t-1", "t-0"]
+
+    @patch("terrafix.orchestrator._claim")
+    def test_exception_becomes_failed_result(
+        self,
+        mock_claim: MagicMock,
+        mock_settings: Settings,
+        store: MagicMock,
+        sample_failure: Failure,
+    ) -> None:
+        """Test an unexpected exception is returned as a failed result."""
+        mock_claim.side_effect = RuntimeError("boom")
+        mock_vanta = MagicMock(spec=VantaClient)
+        mock_vanta.generate_failure_hash.return_value = "abc123"  # pyright: ignore[reportAny]
+
+        results = asyncio.run(
+            process_failures_async(
+                [sample_failure],
+                mock_settings,
+                store,
+                mock_vanta,
+                MagicMock(),
+                MagicMock(),
+            )
+        )
+
+        assert len(results) == 1
+        assert results[0].success is False
+        assert results[0].failure_hash == "abc123"
+        assert results[0].error == "boom"
+
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_batch_is_deduplicated_in_one_lookup(
+        self,
+        mock_process_once: MagicMock,
+        mock_settings: Settings,
+        store: MagicMock,
+        vanta: MagicMock,
+        sample_failure: Failure,
+    ) -> None:
+        """Test handled failures are skipped after one state store lookup."""
+        store.batch_filter_unprocessed.side_effect = lambda hashes: {"t-1"}  # pyright: ignore[reportAny]
+        mock_process_once.return_value = "https://github.com/org/repo/pull/1"
+
+        results = asyncio.run(
+            process_failures_async(
+                self._failures(sample_failure, 3),
+                mock_settings,
+                store,
+                vanta,
+                MagicMock(),
+                MagicMock(),
+            )
+        )
+
+        assert [r.skipped for r in results] == [True, False, True]
+        assert results[1].pr_url == "https://github.com/org/repo/pull/1"
+        store.batch_filter_unprocessed.assert_called_once_with(["t-0", "t-1", "t-2"])  # pyright: ignore[reportAny]
+        store.claim_with_metadata.assert_called_once()  # pyright: ignore[reportAny]
+        mock_process_once.assert_called_once()
+
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_failed_batch_lookup_falls_back_to_individual_checks(
+        self,
+        mock_process_once: MagicMock,
+        mock_settings: Settings,
+        store: MagicMock,
+        vanta: MagicMock,
+        sample_failure: Failure,
+    ) -> None:
+        """Test each failure is checked on its own when the batch lookup fails."""
+        store.batch_filter_unprocessed.side_effect = StateStoreError("down")  # pyright: ignore[reportAny]
+        mock_process_once.return_value = "https://github.com/org/repo/pull/1"
+
+        results = asyncio.run(
+            process_failures_async(
+                self._failures(sample_failure, 2),
+                mock_settings,
+                store,
+                vanta,
+                MagicMock(),
+                MagicMock(),
+            )
+        )
+
+        assert all(r.success and not r.skipped for r in results)
+        assert store.claim_with_metadata.call_count == 2  # pyright: ignore[reportAny]
+
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_failures_in_same_repo_share_checkout(
+        self,
+        mock_process_once: MagicMock,
+        mock_git: MagicMock,
+        mock_settings: Settings,
+        store: MagicMock,
+        vanta: MagicMock,
+        sample_failure: Failure,
+    ) -> None:
+        """Test a repository is checked out once per batch and removed afterwards."""
+        paths: list[Path] = []
+
+        def fake_process_once(failure: Failure, checkout: RepoCheckout | None, **_: object) -> str:
+            assert checkout is not None
+            paths.append(checkout.path())
+            return f"https://github.com/org/repo/pull/{failure.test_id}"
+
+        mock_process_once.side_effect = fake_process_once
+
+        _ = asyncio.run(
+            process_failures_async(
+                self._failures(sample_failure, 3),
+                mock_settings,
+                store,
+                vanta,
+                MagicMock(),
+                MagicMock(),
+            )
+        )
+
+        assert len(paths) == 3
+        assert len(set(paths)) == 1
+        mock_git.ensure_mirror_async.assert_awaited_once()  # pyright: ignore[reportAny]
+        mock_git.ensure_mirror.assert_called_once()  # pyright: ignore[reportAny]
+        assert mock_git.ensure_mirror.call_args.kwargs["refresh"] is False  # pyright: ignore[reportAny]
+        mock_git.add_worktree.assert_called_once()  # pyright: ignore[reportAny]
+        mock_git.remove_worktree.assert_called_once()  # pyright: ignore[reportAny]
+
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_failed_prefetch_falls_back_to_refresh(
+        self,
+        mock_process_once: MagicMock,
+        mock_git: MagicMock,
+        mock_settings: Settings,
+        store: MagicMock,
+        vanta: MagicMock,
+        sample_failure: Failure,
+    ) -> None:
+        """Test the worker refreshes the mirror itself when the prefetch failed."""
+        mock_git.ensure_mirror_async.side_effect = GitHubError("Not found", status_code=404)  # pyright: ignore[reportAny]
+
+        def fake_process_once(failure: Failure, checkout: RepoCheckout | None, **_: object) -> str:
+            assert checkout is not None
+            _ = checkout.path()
+            return f"https://github.com/org/repo/pull/{failure.test_id}"
+
+        mock_process_once.side_effect = fake_process_once
+
+        results = asyncio.run(
+            process_failures_async(
+                [sample_failure],
+                mock_settings,
+                store,
+                vanta,
+                MagicMock(),
+                MagicMock(),
+            )
+        )
+
+        assert results[0].success
+        assert mock_git.ensure_mirror.call_args.kwargs["refresh"] is True  # pyright: ignore[reportAny]
+
+
+class TestRepoCheckout:
+    """Tests for the RepoCheckout class."""
+
+    @patch("terrafix.orchestrator.SecureGitClient")
+    def test_head_commit_looked_up_once(
+        self,
+        mock_git_class: MagicMock,
+        mock_settings: Settings,
+    ) -> None:
+        """Test failures sharing a checkout share one commit lookup."""
+        mock_git = mock_git_class.return_value  # pyright: ignore[reportAny]
+        mock_git.head_commit.return_value = "abc123"  # pyright: ignore[reportAny]
+        checkout = RepoCheckout(mock_settings, "org/repo")
+
+        try:
+            assert [checkout.head_commit() for _ in range(3)] == ["abc123"] * 3
+        finally:
+            checkout.close()
+
+        mock_git.head_commit.assert_called_once()  # pyright: ignore[reportAny]
+        mock_git.add_worktree.assert_called_once()  # pyright: ignore[reportAny]
+
+
 class TestProcessFailureWithRetry:
     """Tests for the _process_failure_with_retry function."""
 
@@ -206,6 +605,131 @@ class TestProcessFailureWithRetry:
         assert result == "https://github.com/org/repo/pull/1"
         assert mock_process_once.call_count == 2
 
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_retry_backoff_is_jittered(
+        self,
+        mock_process_once: MagicMock,
+        mock_settings: Settings,
+        sample_failure: Failure,
+    ) -> None:
+        """Test that retry sleeps are randomized within the exponential cap."""
+        mock_process_once.side_effect = [
+            BedrockError("Throttling", retryable=True),
+            BedrockError("Throttling", retryable=True),
+            "https://github.com/org/repo/pull/1",
+        ]
+
+        with (
+            patch("terrafix.orchestrator.random.uniform", side_effect=lambda a, b: b / 4),
+            patch("terrafix.orchestrator.time.sleep") as mock_sleep,
+        ):
+            _ = _process_failure_with_retry(
+                failure=sample_failure,
+                config=mock_settings,
+                generator=MagicMock(spec=TerraformRemediationGenerator),
+                gh=MagicMock(),
+            )
+
+        # Caps are 2s then 4s; a quarter of each is subtracted as jitter
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.5, 3.0]
+
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_no_retry_on_unauthorized_even_if_flagged_retryable(
+        self,
+        mock_process_once: MagicMock,
+        mock_settings: Settings,
+        sample_failure: Failure,
+    ) -> None:
+        """Test that a 401 is treated as permanent regardless of its flag."""
+        mock_process_once.side_effect = GitHubError(
+            "Bad credentials", status_code=401, retryable=True
+        )
+
+        with (
+            patch("terrafix.orchestrator.time.sleep") as mock_sleep,
+            pytest.raises(GitHubError),
+        ):
+            _ = _process_failure_with_retry(
+                failure=sample_failure,
+                config=mock_settings,
+                generator=MagicMock(spec=TerraformRemediationGenerator),
+                gh=MagicMock(),
+            )
+
+        assert mock_process_once.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_retry_honours_retry_after(
+        self,
+        mock_process_once: MagicMock,
+        mock_settings: Settings,
+        sample_failure: Failure,
+    ) -> None:
+        """Test that a 429 waits as long as Retry-After asks."""
+        mock_process_once.side_effect = [
+            GitHubError("Rate limited", status_code=429, retry_after=30.0),
+            "https://github.com/org/repo/pull/1",
+        ]
+
+        with patch("terrafix.orchestrator.time.sleep") as mock_sleep:
+            _ = _process_failure_with_retry(
+                failure=sample_failure,
+                config=mock_settings,
+                generator=MagicMock(spec=TerraformRemediationGenerator),
+                gh=MagicMock(),
+            )
+
+        mock_sleep.assert_called_once_with(30.0)
+
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_short_retry_after_replaces_backoff(
+        self,
+        mock_process_once: MagicMock,
+        mock_settings: Settings,
+        sample_failure: Failure,
+    ) -> None:
+        """Test that a Retry-After shorter than the backoff is used as is."""
+        mock_process_once.side_effect = [
+            BedrockError("Throttling", status_code=429, retry_after=0.5),
+            BedrockError("Throttling", status_code=429, retry_after=0.5),
+            "https://github.com/org/repo/pull/1",
+        ]
+
+        with patch("terrafix.orchestrator.time.sleep") as mock_sleep:
+            _ = _process_failure_with_retry(
+                failure=sample_failure,
+                config=mock_settings,
+                generator=MagicMock(spec=TerraformRemediationGenerator),
+                gh=MagicMock(),
+            )
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 0.5]
+
+    @patch("terrafix.orchestrator._process_failure_once")
+    def test_retry_on_server_error_even_if_flagged_permanent(
+        self,
+        mock_process_once: MagicMock,
+        mock_settings: Settings,
+        sample_failure: Failure,
+    ) -> None:
+        """Test that a 503 is retried because of its status code."""
+        mock_process_once.side_effect = [
+            BedrockError("Unavailable", status_code=503, retryable=False),
+            "https://github.com/org/repo/pull/1",
+        ]
+
+        with patch("terrafix.orchestrator.time.sleep"):
+            result = _process_failure_with_retry(
+                failure=sample_failure,
+                config=mock_settings,
+                generator=MagicMock(spec=TerraformRemediationGenerator),
+                gh=MagicMock(),
+            )
+
+        assert result == "https://github.com/org/repo/pull/1"
+        assert mock_process_once.call_count == 2
+
     @patch("terrafix.orchestrator._process_failure_once")
     def test_no_retry_on_permanent_error(
         self,
@@ -347,7 +871,10 @@ class TestProcessFailureOnce:
             mock_analyzer_class.return_value = mock_analyzer
 
             # Patch tempfile to use our temp dir
-            with patch("tempfile.TemporaryDirectory") as mock_tempdir:
+            with (
+                patch("tempfile.TemporaryDirectory") as mock_tempdir,
+                patch("terrafix.orchestrator.log_with_context") as mock_log,
+            ):
                 mock_tempdir.return_value.__enter__.return_value = temp_dir  # pyright: ignore[reportAny]
                 mock_tempdir.return_value.__exit__ = MagicMock(return_value=False)  # pyright: ignore[reportAny]
 
@@ -364,6 +891,26 @@ class TestProcessFailureOnce:
         assert pr_url == "https://github.com/org/repo/pull/1"
         mock_generator.generate_fix.assert_called_once()  # pyright: ignore[reportAny]
         mock_gh.create_remediation_pr.assert_called_once()  # pyright: ignore[reportAny]
+        pr_kwargs = mock_gh.create_remediation_pr.call_args.kwargs  # pyright: ignore[reportAny]
+        assert pr_kwargs["file_path"] == str(Path("terraform") / "s3.tf")
+        # Progress is reported as one event carrying every stage's timing
+        (summary,) = [
+            c for c in mock_log.call_args_list if c.args[2] == "Remediation stages complete"
+        ]
+        assert summary.args[1] == "info"
+        assert {
+            "clone_repo_seconds",
+            "parse_terraform_seconds",
+            "bedrock_inference_seconds",
+            "validate_fix_seconds",
+            "create_pr_seconds",
+        } <= summary.kwargs.keys()
+        # Providers are initialized from the file being fixed
+        mock_validator.warm_up.assert_called_once_with(  # pyright: ignore[reportAny]
+            content='resource "aws_s3_bucket" {}',
+            filename="s3.tf",
+            original_repo_path=terraform_path,
+        )
 
     @patch("terrafix.orchestrator.SecureGitClient")
     def test_process_failure_once_no_repo_mapping(
@@ -391,6 +938,61 @@ class TestProcessFailureOnce:
 
         assert "No repository mapping found" in str(exc_info.value)
 
+    @patch("terrafix.orchestrator.SecureGitClient")
+    def test_missing_terraform_path_fails_before_clone(
+        self,
+        mock_git_class: MagicMock,
+        mock_settings: Settings,
+        sample_failure: Failure,
+    ) -> None:
+        """Test a Terraform path missing on GitHub is reported without cloning."""
+        mock_generator = MagicMock(spec=TerraformRemediationGenerator)
+        mock_gh = MagicMock()
+        mock_gh.check_path_exists.return_value = False  # pyright: ignore[reportAny]
+
+        with (
+            patch("terrafix.orchestrator._prefetch_pool") as mock_pool,
+            pytest.raises(ResourceNotFoundError, match="not found in repository"),
+        ):
+            _ = _process_failure_once(
+                failure=sample_failure,
+                config=mock_settings,
+                generator=mock_generator,
+                gh=mock_gh,
+            )
+
+        mock_git_class.assert_not_called()
+        mock_pool.submit.assert_not_called()  # pyright: ignore[reportAny]
+
+    @patch("terrafix.orchestrator._clone_repository")
+    @patch("terrafix.orchestrator.SecureGitClient")
+    def test_failed_clone_cancels_context_prefetch(
+        self,
+        mock_git_class: MagicMock,
+        mock_clone: MagicMock,
+        mock_settings: Settings,
+        sample_failure: Failure,
+    ) -> None:
+        """Test that prompt context prepared for a failed clone is dropped."""
+        _ = mock_git_class
+        mock_clone.side_effect = GitHubError("clone failed")
+        mock_generator = MagicMock(spec=TerraformRemediationGenerator)
+        mock_gh = MagicMock()
+        mock_gh.check_path_exists.return_value = True  # pyright: ignore[reportAny]
+
+        with (
+            patch("terrafix.orchestrator._prefetch_pool") as mock_pool,
+            pytest.raises(GitHubError, match="clone failed"),
+        ):
+            _ = _process_failure_once(
+                failure=sample_failure,
+                config=mock_settings,
+                generator=mock_generator,
+                gh=mock_gh,
+            )
+
+        mock_pool.submit.return_value.cancel.assert_called_once()  # pyright: ignore[reportAny]
+
     @patch("terrafix.orchestrator.SecureGitClient")
     @patch("terrafix.orchestrator.TerraformAnalyzer")
     def test_process_failure_once_resource_not_found(
@@ -435,6 +1037,17 @@ class TestProcessFailureOnce:
 
         assert "not found in Terraform" in str(exc_info.value)
 
+        # A repeat within the TTL fails without another checkout
+        mock_git_class.reset_mock()
+        with pytest.raises(ResourceNotFoundError, match="recently checked"):
+            _ = _process_failure_once(
+                failure=sample_failure,
+                config=mock_settings,
+                generator=mock_generator,
+                gh=mock_gh,
+            )
+        mock_git_class.assert_not_called()
+
     @patch("terrafix.orchestrator.SecureGitClient")
     @patch("terrafix.orchestrator.TerraformAnalyzer")
     @patch("terrafix.orchestrator.TerraformValidator")
@@ -486,7 +1099,10 @@ class TestProcessFailureOnce:
 
                 mock_settings.terraform_path = "terraform"
 
-                with pytest.raises(TerraFixError) as exc_info:
+                with (
+                    patch("terrafix.orchestrator._validator_pool") as mock_pool,
+                    pytest.raises(TerraFixError) as exc_info,
+                ):
                     _ = _process_failure_once(
                         failure=sample_failure,
                         config=mock_settings,
@@ -495,6 +1111,8 @@ class TestProcessFailureOnce:
                     )
 
         assert "empty" in str(exc_info.value).lower()
+        # The provider warm-up is abandoned with the fix
+        mock_pool.submit.return_value.cancel.assert_called_once()  # pyright: ignore[reportAny]
 
     @patch("terrafix.orchestrator.SecureGitClient")
     @patch("terrafix.orchestrator.TerraformAnalyzer")
@@ -561,6 +1179,116 @@ class TestProcessFailureOnce:
         assert "invalid" in str(exc_info.value).lower()
 
 
+class TestCloneRepository:
+    """Tests for the _clone_repository context manager."""
+
+    def test_checks_out_worktree_from_mirror(self) -> None:
+        """Test the repo is checked out from the cached mirror and cleaned up."""
+        mock_git = MagicMock()
+        mirror_path = Path("/cache/org/repo.git")
+        mock_git.ensure_mirror.return_value = mirror_path  # pyright: ignore[reportAny]
+
+        with _clone_repository(mock_git, "org/repo", Path("/cache")) as repo_path:
+            mock_git.ensure_mirror.assert_called_once_with(  # pyright: ignore[reportAny]
+                repo_full_name="org/repo",
+                cache_root=Path("/cache"),
+                branch="main",
+                depth=1,
+                refresh=True,
+            )
+            mock_git.add_worktree.assert_called_once_with(  # pyright: ignore[reportAny]
+                mirror_path, repo_path, branch="main", sparse_paths=None
+            )
+            mock_git.remove_worktree.assert_not_called()  # pyright: ignore[reportAny]
+
+        mock_git.remove_worktree.assert_called_once_with(mirror_path, repo_path)  # pyright: ignore[reportAny]
+
+    def test_sparse_checkout_of_terraform_path(self) -> None:
+        """Test only the Terraform subtree is checked out."""
+        mock_git = MagicMock()
+
+        with _clone_repository(mock_git, "org/repo", Path("/cache"), "./infra/terraform"):
+            pass
+
+        _, kwargs = mock_git.add_worktree.call_args  # pyright: ignore[reportAny]
+        assert kwargs["sparse_paths"] == ["infra/terraform"]
+
+    def test_removes_worktree_on_error(self) -> None:
+        """Test the worktree is removed when processing raises."""
+        mock_git = MagicMock()
+
+        with (
+            pytest.raises(TerraFixError),
+            _clone_repository(mock_git, "org/repo", Path("/cache")),
+        ):
+            raise TerraFixError("boom")
+
+        mock_git.remove_worktree.assert_called_once()  # pyright: ignore[reportAny]
+
+    def test_fails_fast_while_github_circuit_open(self) -> None:
+        """Test that repeated GitHub outages stop further clone attempts."""
+        mock_git = MagicMock()
+        mock_git.ensure_mirror.side_effect = GitHubError("Bad gateway", status_code=502)  # pyright: ignore[reportAny]
+        _github_breaker.reset()
+
+        try:
+            for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+                with (
+                    pytest.raises(GitHubError),
+                    _clone_repository(mock_git, "org/repo", Path("/cache")),
+                ):
+                    pass
+
+            with (
+                pytest.raises(TerraFixError, match="circuit open") as exc_info,
+                _clone_repository(mock_git, "org/repo", Path("/cache")),
+            ):
+                pass
+        finally:
+            _github_breaker.reset()
+
+        assert not exc_info.value.retryable
+        assert mock_git.ensure_mirror.call_count == CIRCUIT_FAILURE_THRESHOLD  # pyright: ignore[reportAny]
+
+    def test_client_errors_do_not_open_circuit(self) -> None:
+        """Test that permanent errors such as 404 leave the circuit closed."""
+        mock_git = MagicMock()
+        mock_git.ensure_mirror.side_effect = GitHubError("Not found", status_code=404)  # pyright: ignore[reportAny]
+        _github_breaker.reset()
+
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD + 1):
+            with (
+                pytest.raises(GitHubError),
+                _clone_repository(mock_git, "org/repo", Path("/cache")),
+            ):
+                pass
+
+        assert _github_breaker.state == "closed"
+
+
+class TestGetAnalyzer:
+    """Tests for the _get_analyzer cache."""
+
+    @patch("terrafix.orchestrator.TerraformAnalyzer")
+    def test_reuses_analyzer_for_same_commit(
+        self,
+        mock_analyzer_class: MagicMock,
+    ) -> None:
+        """Test that a commit is parsed once and rebased for later checkouts."""
+        _analyzer_cache.clear()
+        analyzer = mock_analyzer_class.return_value  # pyright: ignore[reportAny]
+
+        first = _get_analyzer("org/repo", "terraform", "abc123", Path("/tmp/a/terraform"))
+        second = _get_analyzer("org/repo", "terraform", "abc123", Path("/tmp/b/terraform"))
+        _ = _get_analyzer("org/repo", "terraform", "def456", Path("/tmp/c/terraform"))
+
+        assert first is analyzer
+        assert second is analyzer.rebased.return_value  # pyright: ignore[reportAny]
+        analyzer.rebased.assert_called_once_with("/tmp/b/terraform")  # pyright: ignore[reportAny]
+        assert mock_analyzer_class.call_count == 2
+        _analyzer_cache.clear()
+
+
 class TestConfigTests:
     """Tests for configuration validation."""
 
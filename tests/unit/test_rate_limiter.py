@@ -0,0 +1,187 @@
+"""
+Unit tests for the rate limiter module.
+
+Tests cover token bucket draining and refill, blocking acquire with a
+timeout, wait time estimates, and Retry-After header parsing. Refill
+tests drive the limiter from a fake monotonic clock.
+"""
+
+from collections.abc import Generator
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+
+from terrafix.rate_limiter import (
+    NS_PER_SECOND,
+    RateLimitConfig,
+    TokenBucketRateLimiter,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """Monotonic nanosecond clock advanced by hand."""
+
+    def __init__(self) -> None:
+        """Start the clock at an arbitrary non-zero reading."""
+        self.now_ns: int = 1_000 * NS_PER_SECOND
+
+    def __call__(self) -> int:
+        """Return the current reading."""
+        return self.now_ns
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        self.now_ns += int(seconds * NS_PER_SECOND)
+
+
+@pytest.fixture
+def clock() -> Generator[FakeClock]:
+    """
+    Drive the rate limiter's refills from a fake clock.
+
+    Yields:
+        Clock to advance during the test
+    """
+    fake = FakeClock()
+    with patch("terrafix.rate_limiter.time.monotonic_ns", fake):
+        yield fake
+
+
+def _limiter(requests_per_minute: int, burst_size: int) -> TokenBucketRateLimiter:
+    """Create a limiter with a full bucket."""
+    return TokenBucketRateLimiter(
+        RateLimitConfig(requests_per_minute=requests_per_minute, burst_size=burst_size)
+    )
+
+
+class TestTryAcquire:
+    """Tests for TokenBucketRateLimiter.try_acquire."""
+
+    def test_drains_to_burst_size(self, clock: FakeClock) -> None:
+        """Test that a full bucket allows exactly burst_size calls."""
+        limiter = _limiter(requests_per_minute=60, burst_size=5)
+
+        results = [limiter.try_acquire() for _ in range(6)]
+
+        assert results == [True] * 5 + [False]
+
+    def test_refills_at_configured_rate(self, clock: FakeClock) -> None:
+        """Test that one token is added per 1/rate seconds."""
+        limiter = _limiter(requests_per_minute=120, burst_size=2)
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+
+        clock.advance(0.49)
+        assert not limiter.try_acquire()
+
+        clock.advance(0.01)
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+
+    def test_refill_stops_at_capacity(self, clock: FakeClock) -> None:
+        """Test that an idle bucket never holds more than burst_size tokens."""
+        limiter = _limiter(requests_per_minute=60, burst_size=3)
+
+        clock.advance(3600)
+
+        assert limiter.get_available_tokens() == 3.0
+        assert [limiter.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    def test_refill_is_exact_over_many_small_steps(self, clock: FakeClock) -> None:
+        """Test that fixed-point refills do not drift across many updates."""
+        limiter = _limiter(requests_per_minute=60, burst_size=1)
+        assert limiter.try_acquire()
+
+        for _ in range(1000):
+            clock.advance(0.001)
+            _ = limiter.get_available_tokens()
+
+        assert limiter.try_acquire()
+
+
+class TestAcquire:
+    """Tests for TokenBucketRateLimiter.acquire."""
+
+    def test_returns_false_when_token_due_after_deadline(self, clock: FakeClock) -> None:
+        """Test that acquire gives up at once if the next token is too late."""
+        limiter = _limiter(requests_per_minute=60, burst_size=1)
+        assert limiter.try_acquire()
+
+        with patch.object(limiter._token_due, "wait") as mock_wait:  # pyright: ignore[reportPrivateUsage]
+            acquired = limiter.acquire(timeout=0.5)
+
+        assert acquired is False
+        mock_wait.assert_not_called()
+
+    def test_returns_true_when_token_available(self, clock: FakeClock) -> None:
+        """Test that acquire returns immediately while tokens remain."""
+        limiter = _limiter(requests_per_minute=60, burst_size=1)
+        assert limiter.try_acquire()
+
+        clock.advance(1.0)
+
+        assert limiter.acquire(timeout=0) is True
+
+    def test_waits_for_next_token(self) -> None:
+        """Test that acquire blocks until a token is due, then takes it."""
+        limiter = _limiter(requests_per_minute=6000, burst_size=1)
+        assert limiter.try_acquire()
+
+        assert limiter.acquire(timeout=1.0) is True
+        assert not limiter.try_acquire()
+
+
+class TestGetWaitTime:
+    """Tests for TokenBucketRateLimiter.get_wait_time."""
+
+    def test_zero_while_tokens_remain(self, clock: FakeClock) -> None:
+        """Test that no wait is reported while a whole token is available."""
+        limiter = _limiter(requests_per_minute=60, burst_size=2)
+
+        assert limiter.get_wait_time() == 0.0
+
+    @pytest.mark.parametrize("elapsed", [0.0, 0.25, 0.9])
+    def test_matches_missing_fraction_over_rate(self, clock: FakeClock, elapsed: float) -> None:
+        """Test that the wait is (1 - tokens) / rate."""
+        limiter = _limiter(requests_per_minute=30, burst_size=1)
+        assert limiter.try_acquire()
+
+        clock.advance(elapsed)
+
+        tokens = limiter.get_available_tokens()
+        assert tokens == pytest.approx(elapsed * limiter.rate)
+        assert limiter.get_wait_time() == pytest.approx((1 - tokens) / limiter.rate)
+
+
+class TestParseRetryAfter:
+    """Tests for the parse_retry_after function."""
+
+    def test_delay_seconds(self) -> None:
+        """Test that a delay in seconds is returned as is."""
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("1.5") == 1.5
+
+    def test_negative_delay_is_clamped(self) -> None:
+        """Test that a negative delay means no wait."""
+        assert parse_retry_after("-5") == 0.0
+
+    def test_http_date(self) -> None:
+        """Test that an HTTP date is converted to seconds from now."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=90)
+
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert delay is not None
+        assert 85 <= delay <= 90
+
+    def test_past_http_date(self) -> None:
+        """Test that a date in the past means no wait."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "Mon, 99 Foo 2015"])
+    def test_missing_or_garbage(self, value: str | None) -> None:
+        """Test that absent or malformed values are ignored."""
+        assert parse_retry_after(value) is None
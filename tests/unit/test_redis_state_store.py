@@ -5,7 +5,19 @@ Tests cover state operations, deduplication, status tracking,
 and error handling using fakeredis.
 """
 
-from terrafix.redis_state_store import FailureStatus, RedisStateStore
+import json
+import time
+from typing import cast
+from unittest.mock import patch
+
+import redis
+
+from terrafix.redis_state_store import (
+    REDIS_MAX_CONNECTIONS,
+    FailureStatus,
+    RedisStateStore,
+    shared_connection_pool,
+)
 
 
 class TestRedisStateStoreInit:
@@ -40,6 +52,25 @@ class TestRedisStateStoreInit:
         assert store.ttl_seconds == 14 * 24 * 60 * 60
 
 
+class TestSharedConnectionPool:
+    """Tests for the shared_connection_pool function."""
+
+    def test_pool_is_shared_per_url(self) -> None:
+        """Test that clients for the same URL share one pool."""
+        pool = shared_connection_pool("redis://localhost:6379/0")
+
+        assert shared_connection_pool("redis://localhost:6379/0") is pool
+        assert shared_connection_pool("redis://localhost:6379/1") is not pool
+        assert pool.max_connections == REDIS_MAX_CONNECTIONS
+
+    def test_pool_blocks_when_exhausted(self) -> None:
+        """Test that the pool waits for a free connection instead of failing."""
+        pool = shared_connection_pool("redis://localhost:6379/2", max_connections=8)
+
+        assert isinstance(pool, redis.BlockingConnectionPool)
+        assert pool.max_connections == 8
+
+
 class TestCheckAndClaim:
     """Tests for RedisStateStore.check_and_claim method."""
 
@@ -74,6 +105,57 @@ class TestCheckAndClaim:
         assert result2 is False
 
 
+class TestClaimWithMetadata:
+    """Tests for RedisStateStore.claim_with_metadata method."""
+
+    def test_claim_writes_in_progress_record(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that a new failure is claimed with its metadata in one step."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0")
+
+        assert store.claim_with_metadata("hash_new", "test-1", "arn:aws:s3:::bucket") is True
+
+        record = cast(dict[str, str], store.client.hgetall(store._make_key("hash_new")))  # pyright: ignore[reportPrivateUsage]
+        assert record["status"] == FailureStatus.IN_PROGRESS.value
+        assert record["test_id"] == "test-1"
+        assert record["resource_arn"] == "arn:aws:s3:::bucket"
+
+    def test_handled_failures_are_not_claimed(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that in-progress and completed failures cannot be claimed again."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0")
+
+        _ = store.check_and_claim("hash_in_progress")
+        _ = store.check_and_claim("hash_completed")
+        store.mark_processed("hash_completed", "https://github.com/pull/1")
+
+        assert store.claim_with_metadata("hash_in_progress", "test-1", "arn") is False
+        assert store.claim_with_metadata("hash_completed", "test-1", "arn") is False
+
+    def test_failed_failure_is_reclaimed(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that a failed failure can be claimed for a retry."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0")
+
+        _ = store.check_and_claim("hash_failed")
+        store.mark_failed("hash_failed", "boom")
+
+        assert store.claim_with_metadata("hash_failed", "test-1", "arn") is True
+        assert store.get_status("hash_failed") == FailureStatus.IN_PROGRESS
+
+
 class TestIsAlreadyProcessed:
     """Tests for RedisStateStore.is_already_processed method."""
 
@@ -123,6 +205,79 @@ class TestIsAlreadyProcessed:
 
         assert result is True
 
+    def test_completed_answered_from_memory(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that a known completed failure needs no Redis round trip."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0")
+
+        _ = store.check_and_claim("hash_completed")
+        store.mark_processed("hash_completed", "https://github.com/pull/1")
+
+        with (
+            patch.object(store.client, "get") as mock_get,
+            patch.object(store.client, "mget") as mock_mget,
+        ):
+            assert store.is_already_processed("hash_completed") is True
+            assert store.batch_filter_unprocessed(["hash_completed"]) == set()
+
+        mock_get.assert_not_called()
+        mock_mget.assert_not_called()
+
+    def test_failed_after_completion_is_rechecked(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that marking a completed failure failed drops it from memory."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0")
+
+        _ = store.check_and_claim("hash_reopened")
+        store.mark_processed("hash_reopened", "https://github.com/pull/1")
+        store.mark_failed("hash_reopened", "PR closed")
+
+        assert store.is_already_processed("hash_reopened") is False
+
+
+class TestBatchFilterUnprocessed:
+    """Tests for RedisStateStore.batch_filter_unprocessed method."""
+
+    def test_returns_only_unhandled_hashes(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that in-progress and completed failures are filtered out."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0")
+
+        _ = store.check_and_claim("hash_in_progress")
+        _ = store.check_and_claim("hash_completed")
+        store.mark_processed("hash_completed", "https://github.com/pull/1")
+        _ = store.check_and_claim("hash_failed")
+        store.mark_failed("hash_failed", "boom")
+
+        result = store.batch_filter_unprocessed(
+            ["hash_in_progress", "hash_completed", "hash_failed", "hash_new"]
+        )
+
+        assert result == {"hash_failed", "hash_new"}
+
+    def test_empty_batch(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that an empty batch needs no Redis call."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0")
+
+        assert store.batch_filter_unprocessed([]) == set()
+
 
 class TestMarkInProgress:
     """Tests for RedisStateStore.mark_in_progress method."""
@@ -164,6 +319,30 @@ class TestMarkProcessed:
         status = store.get_status("hash_complete")
         assert status == FailureStatus.COMPLETED
 
+    def test_mark_processed_merges_into_stored_record(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that completion keeps fields written to the record meanwhile."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0")
+        key = store._make_key("hash_merged")  # pyright: ignore[reportPrivateUsage]
+
+        assert store.claim_with_metadata("hash_merged", "test-1", "arn:aws:s3:::bucket")
+        record = cast(dict[str, str], store.client.hgetall(key))
+        _ = store.client.hset(key, "last_error", "transient")
+
+        store.mark_processed("hash_merged", "https://github.com/pull/7")
+
+        merged = cast(dict[str, str], store.client.hgetall(key))
+        assert merged["status"] == FailureStatus.COMPLETED.value
+        assert merged["pr_url"] == "https://github.com/pull/7"
+        assert merged["test_id"] == "test-1"
+        assert merged["claimed_at"] == record["claimed_at"]
+        assert "last_error" not in merged
+        assert cast(int, store.client.ttl(key)) > 0
+
 
 class TestMarkFailed:
     """Tests for RedisStateStore.mark_failed method."""
@@ -184,6 +363,45 @@ class TestMarkFailed:
         assert status == FailureStatus.FAILED
 
 
+class TestBackgroundWrites:
+    """Tests for RedisStateStore with background_writes enabled."""
+
+    def test_reads_see_queued_updates(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that a read waits for earlier queued updates."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0", background_writes=True)
+
+        try:
+            store.mark_in_progress("hash_bg", "test-1", "arn:aws:s3:::bucket")
+            store.mark_processed("hash_bg", "https://github.com/pull/1")
+
+            assert store.get_status("hash_bg") == FailureStatus.COMPLETED
+        finally:
+            store.close()
+
+    def test_queued_updates_merge_in_order(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that updates written together keep earlier metadata."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0", background_writes=True)
+
+        store.mark_in_progress("hash_merge", "test-2", "arn:aws:s3:::bucket")
+        store.mark_failed("hash_merge", "boom")
+        store.close()
+
+        record = cast(dict[str, str], store.client.hgetall(store._make_key("hash_merge")))  # pyright: ignore[reportPrivateUsage]
+        assert record["status"] == FailureStatus.FAILED.value
+        assert record["test_id"] == "test-2"
+        assert record["last_error"] == "boom"
+
+
 class TestGetStatus:
     """Tests for RedisStateStore.get_status method."""
 
@@ -254,6 +472,118 @@ class TestGetStatistics:
         assert stats["total"] >= 2
         assert stats["completed"] >= 1
 
+    def test_get_statistics_reads_indexes_without_scanning(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that statistics come from the status indexes, not the records."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0", key_prefix="stats-test:")
+        for i in range(30):
+            _ = store.check_and_claim(f"hash_{i}")
+        for i in range(10):
+            store.mark_processed(f"hash_{i}", "url")
+        store.mark_failed("hash_10", "boom")
+
+        with patch.object(store.client, "scan") as mock_scan:
+            stats = store.get_statistics()
+
+        mock_scan.assert_not_called()
+        assert stats == {
+            "pending": 0,
+            "in_progress": 19,
+            "completed": 10,
+            "failed": 1,
+            "total": 30,
+        }
+
+    def test_get_statistics_drops_expired_records(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that records past their TTL are no longer counted."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0", key_prefix="expiry-test:")
+        _ = store.check_and_claim("hash_old")
+        later = time.time() + store.ttl_seconds + 1
+        store.ttl_seconds = 2 * store.ttl_seconds
+        _ = store.check_and_claim("hash_new")
+
+        with patch("terrafix.redis_state_store.time.time", return_value=later):
+            stats = store.get_statistics()
+
+        assert stats["in_progress"] == 1
+        assert stats["total"] == 1
+
+
+class TestScriptKeys:
+    """Tests for the keys passed to the record scripts."""
+
+    def test_writes_declare_index_keys(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that every key a write touches is passed in KEYS."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0", key_prefix="{tf}:")
+        expected = [
+            "{tf}:failure:hash_keys",
+            "{tf}:stats:pending",
+            "{tf}:stats:in_progress",
+            "{tf}:stats:completed",
+            "{tf}:stats:failed",
+        ]
+
+        with (
+            patch.object(store, "_claim_script", wraps=store._claim_script) as claim,  # pyright: ignore[reportPrivateUsage]
+            patch.object(store, "_write_script", wraps=store._write_script) as write,  # pyright: ignore[reportPrivateUsage]
+        ):
+            assert store.claim_with_metadata("hash_keys", "test-1", "arn")
+            store.mark_processed("hash_keys", "url")
+
+        assert claim.call_args.kwargs["keys"] == expected  # pyright: ignore[reportAny]
+        assert write.call_args.kwargs["keys"] == expected  # pyright: ignore[reportAny]
+        assert store.get_statistics()["completed"] == 1
+
+
+class TestLegacyRecords:
+    """Tests for records stored as JSON strings before the HASH layout."""
+
+    def test_legacy_record_is_read(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that a JSON string record still reports its status."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0")
+        key = store._make_key("hash_legacy")  # pyright: ignore[reportPrivateUsage]
+        _ = store.client.set(key, json.dumps({"status": "completed", "pr_url": "url"}))
+
+        assert store.get_status("hash_legacy") == FailureStatus.COMPLETED
+        assert store.claim_with_metadata("hash_legacy", "test-1", "arn") is False
+
+    def test_legacy_record_is_converted_on_write(
+        self,
+        mock_redis_client: object,
+    ) -> None:
+        """Test that merging into a JSON string record keeps its fields."""
+        # Fixture used for side effects
+        _ = mock_redis_client
+        store = RedisStateStore(redis_url="redis://localhost:6379/0")
+        key = store._make_key("hash_convert")  # pyright: ignore[reportPrivateUsage]
+        _ = store.client.set(key, json.dumps({"status": "in_progress", "test_id": "test-3"}))
+
+        store.mark_failed("hash_convert", "boom")
+
+        record = cast(dict[str, str], store.client.hgetall(key))
+        assert record["status"] == FailureStatus.FAILED.value
+        assert record["test_id"] == "test-3"
+        assert record["last_error"] == "boom"
+
 
 class TestCleanupOldRecords:
     """Tests for RedisStateStore.cleanup_old_records method."""
@@ -6,6 +6,7 @@ and error handling with mocked Bedrock client.
 """
 
 import json
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,6 +14,7 @@ from botocore.exceptions import ClientError  # pyright: ignore[reportMissingType
 
 from terrafix.errors import BedrockError
 from terrafix.remediation_generator import (
+    MAX_MODULE_CONTEXT_CHARS,
     RemediationFix,
     TerraformRemediationGenerator,
 )
@@ -278,6 +280,54 @@ class TestConstructPrompt:
         assert "<output_format>" in prompt
         assert "<critical_constraints>" in prompt
 
+    @patch("boto3.client")
+    def test_prompt_uses_prepared_context(
+        self,
+        mock_boto_client: MagicMock,
+        sample_failure: Failure,
+    ) -> None:
+        """Test that a prepared context yields the same prompt as building it inline."""
+        mock_boto_client.return_value = MagicMock()
+
+        generator = TerraformRemediationGenerator()
+        kwargs: dict[str, Any] = {
+            "failure": sample_failure,
+            "current_config": 'resource "aws_s3_bucket" "test" {}',
+            "resource_block": {"bucket": "test"},
+            "module_context": {},
+        }
+
+        inline = generator._construct_prompt(**kwargs)  # pyright: ignore[reportPrivateUsage]
+        prepared = generator._construct_prompt(  # pyright: ignore[reportPrivateUsage]
+            **kwargs,
+            context=generator.prepare_context(sample_failure),
+        )
+
+        assert prepared == inline
+
+    @patch("boto3.client")
+    def test_prompt_parts_separate_file_context(
+        self,
+        mock_boto_client: MagicMock,
+        sample_failure: Failure,
+    ) -> None:
+        """Test the shareable file context is split from the failure-specific request."""
+        mock_boto_client.return_value = MagicMock()
+
+        generator = TerraformRemediationGenerator()
+
+        file_context, request = generator._construct_prompt_parts(  # pyright: ignore[reportPrivateUsage]
+            failure=sample_failure,
+            current_config='resource "aws_s3_bucket" "test" {}',
+            resource_block={"bucket": "test"},
+            module_context={"variables": "x" * (MAX_MODULE_CONTEXT_CHARS + 100)},
+        )
+
+        assert "<current_terraform_configuration>" in file_context
+        assert "[truncated]" in file_context
+        assert sample_failure.resource_arn not in file_context
+        assert "<compliance_failure>" in request
+
     @patch("boto3.client")
     def test_prompt_contains_failure_details(
         self,
@@ -419,6 +469,27 @@ class TestInvokeClaude:
         assert messages[0]["role"] == "user"
         assert messages[0]["content"] == "test prompt"
 
+    @patch("boto3.client")
+    def test_invoke_claude_marks_prefix_cacheable(
+        self,
+        mock_boto_client: MagicMock,
+    ) -> None:
+        """Test that a cached prefix is sent as its own block with cache_control."""
+        mock_client = MagicMock()
+        mock_response_body = MagicMock()
+        mock_response_body.read.return_value = json.dumps({"content": [{"text": "{}"}]})  # pyright: ignore[reportAny]
+        mock_client.invoke_model.return_value = {"body": mock_response_body}  # pyright: ignore[reportAny]
+        mock_boto_client.return_value = mock_client
+
+        generator = TerraformRemediationGenerator()
+        _ = generator._invoke_claude("request", cached_prefix="file context")  # pyright: ignore[reportPrivateUsage]
+
+        body = json.loads(mock_client.invoke_model.call_args.kwargs["body"])  # pyright: ignore[reportAny]
+        assert body["messages"][0]["content"] == [
+            {"type": "text", "text": "file context", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "request"},
+        ]
+
 
 class TestParseResponse:
     """Tests for TerraformRemediationGenerator._parse_response method."""
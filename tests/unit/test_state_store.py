@@ -0,0 +1,235 @@
+"""
+Unit tests for the SQLite StateStore.
+
+Tests cover batched transactions (nesting, commit on error, immediate
+commits outside a batch) and the background writer: reads after queued
+updates, draining on close, concurrent updates, and surviving failed
+writes.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from terrafix.state_store import StateStore
+
+
+def _committed_status(db_path: Path, failure_hash: str) -> str | None:
+    """
+    Read a failure's status through a separate connection.
+
+    Only committed updates are visible to it.
+
+    Args:
+        db_path: Path to the SQLite database
+        failure_hash: Failure to look up
+
+    Returns:
+        The committed status, or None if no row is committed
+    """
+    conn = sqlite3.connect(str(db_path))
+    try:
+        row: tuple[str] | None = conn.execute(
+            "SELECT status FROM processed_failures WHERE failure_hash = ?",
+            (failure_hash,),
+        ).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def _flushes_within(store: StateStore, seconds: float) -> bool:
+    """
+    Flush the store on a helper thread so a hung flush fails the test.
+
+    Args:
+        store: State store to flush
+        seconds: How long to wait for the flush
+
+    Returns:
+        True if flush() returned in time
+    """
+    flusher = threading.Thread(target=store.flush, daemon=True)
+    flusher.start()
+    flusher.join(timeout=seconds)
+    return not flusher.is_alive()
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """
+    Provide a database path in a temporary directory.
+
+    Returns:
+        Path for the test database
+    """
+    return tmp_path / "state" / "terrafix.db"
+
+
+@pytest.fixture
+def store(db_path: Path) -> Generator[StateStore]:
+    """
+    Provide an initialized state store that writes in the caller.
+
+    Yields:
+        The state store, closed after the test
+    """
+    store = StateStore(str(db_path))
+    store.initialize_schema()
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def background_store(db_path: Path) -> Generator[StateStore]:
+    """
+    Provide an initialized state store with background writes enabled.
+
+    Yields:
+        The state store, closed after the test
+    """
+    store = StateStore(str(db_path), background_writes=True)
+    store.initialize_schema()
+    yield store
+    store.close()
+
+
+class TestBatch:
+    """Tests for grouping status updates into one transaction."""
+
+    def test_updates_outside_batch_commit_immediately(
+        self,
+        store: StateStore,
+        db_path: Path,
+    ) -> None:
+        """Test that each update is committed when no batch is open."""
+        store.mark_in_progress("hash-1", "test-1", "arn:aws:s3:::one")
+        assert _committed_status(db_path, "hash-1") == "in_progress"
+
+        store.mark_processed("hash-1", "https://github.com/org/repo/pull/1")
+        assert _committed_status(db_path, "hash-1") == "completed"
+
+    def test_nested_batch_commits_at_outermost_exit(
+        self,
+        store: StateStore,
+        db_path: Path,
+    ) -> None:
+        """Test that only the outermost batch commits."""
+        with store.batch():
+            store.mark_in_progress("hash-1", "test-1", "arn:aws:s3:::one")
+            with store.batch():
+                store.mark_in_progress("hash-2", "test-2", "arn:aws:s3:::two")
+
+            assert _committed_status(db_path, "hash-1") is None
+            assert _committed_status(db_path, "hash-2") is None
+
+        assert _committed_status(db_path, "hash-1") == "in_progress"
+        assert _committed_status(db_path, "hash-2") == "in_progress"
+
+    def test_batch_commits_when_block_raises(
+        self,
+        store: StateStore,
+        db_path: Path,
+    ) -> None:
+        """Test that updates made before an error in the block are kept."""
+        with pytest.raises(RuntimeError, match="remediation failed"), store.batch():
+            store.mark_in_progress("hash-1", "test-1", "arn:aws:s3:::one")
+            raise RuntimeError("remediation failed")
+
+        assert _committed_status(db_path, "hash-1") == "in_progress"
+
+        # The batch has ended, so later updates commit on their own again
+        store.mark_failed("hash-1", "remediation failed")
+        assert _committed_status(db_path, "hash-1") == "failed"
+
+
+class TestBackgroundWrites:
+    """Tests for status updates committed on the writer thread."""
+
+    def test_reads_see_queued_writes(self, background_store: StateStore) -> None:
+        """Test that reads wait for earlier updates to be written."""
+        background_store.mark_in_progress("hash-1", "test-1", "arn:aws:s3:::one")
+        background_store.mark_in_progress("hash-2", "test-2", "arn:aws:s3:::two")
+        background_store.mark_processed("hash-2", "https://github.com/org/repo/pull/2")
+
+        assert background_store.is_already_processed("hash-1")
+        stats = background_store.get_statistics()
+        assert stats == {"in_progress": 1, "completed": 1, "total": 2}
+
+    def test_close_drains_queue(self, db_path: Path) -> None:
+        """Test that close writes every queued update before returning."""
+        store = StateStore(str(db_path), background_writes=True)
+        store.initialize_schema()
+        for i in range(250):
+            store.mark_in_progress(f"hash-{i}", f"test-{i}", "arn:aws:s3:::bucket")
+        store.mark_failed("hash-249", "Resource not found")
+
+        store.close()
+
+        with StateStore(str(db_path)) as reopened:
+            stats = reopened.get_statistics()
+        assert stats == {"in_progress": 249, "failed": 1, "total": 250}
+        assert _committed_status(db_path, "hash-249") == "failed"
+
+    def test_concurrent_updates_all_land(self, background_store: StateStore) -> None:
+        """Test that updates queued from several threads are all written."""
+        threads, per_thread = 8, 50
+        start = threading.Barrier(threads)
+
+        def work(worker: int) -> None:
+            _ = start.wait()
+            for i in range(per_thread):
+                failure_hash = f"hash-{worker}-{i}"
+                background_store.mark_in_progress(failure_hash, "test", "arn:aws:s3:::bucket")
+                if i % 2 == 0:
+                    background_store.mark_processed(failure_hash, f"https://github.com/pr/{i}")
+
+        workers = [threading.Thread(target=work, args=(n,)) for n in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        stats = background_store.get_statistics()
+        assert stats["total"] == threads * per_thread
+        assert stats["completed"] == threads * per_thread // 2
+        assert stats["in_progress"] == threads * per_thread // 2
+
+    @pytest.mark.parametrize(
+        "error",
+        [sqlite3.OperationalError("disk I/O error"), RuntimeError("unexpected")],
+        ids=["sqlite", "unexpected"],
+    )
+    def test_failed_write_is_logged_and_writer_survives(
+        self,
+        background_store: StateStore,
+        db_path: Path,
+        error: Exception,
+    ) -> None:
+        """Test that a failing update is logged and later updates still land."""
+        commit = background_store._commit  # pyright: ignore[reportPrivateUsage]
+        failures = [error]
+
+        def flaky_commit() -> None:
+            if failures:
+                raise failures.pop()
+            commit()
+
+        with (
+            patch.object(background_store, "_commit", side_effect=flaky_commit),
+            patch("terrafix.state_store.log_with_context") as log,
+        ):
+            background_store.mark_in_progress("hash-1", "test-1", "arn:aws:s3:::one")
+            assert _flushes_within(background_store, seconds=5)
+
+            background_store.mark_in_progress("hash-2", "test-2", "arn:aws:s3:::two")
+            # A dead writer would leave flush() blocked forever
+            assert _flushes_within(background_store, seconds=5)
+
+        messages = [call.args[2] for call in log.call_args_list]
+        assert "Background state update failed" in messages
+        assert _committed_status(db_path, "hash-2") == "in_progress"
@@ -10,7 +10,7 @@ from pathlib import Path
 import pytest
 
 from terrafix.errors import TerraformParseError
-from terrafix.terraform_analyzer import TerraformAnalyzer
+from terrafix.terraform_analyzer import PARALLEL_PARSE_MIN_FILES, TerraformAnalyzer
 
 
 class TestTerraformAnalyzerInit:
@@ -63,6 +63,41 @@ resource "aws_s3_bucket" "test" {
         # Only valid file should be parsed
         assert len(analyzer.parsed_configs) == 1
 
+    def test_init_with_unreadable_file_skips_gracefully(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that a file that cannot be decoded is skipped like a parse error."""
+        for i in range(3):
+            _ = (tmp_path / f"valid{i}.tf").write_text('variable "v" {}\n')
+        _ = (tmp_path / "binary.tf").write_bytes(b"\xff\xfe\x00")
+
+        analyzer = TerraformAnalyzer(str(tmp_path))
+
+        assert len(analyzer.terraform_files) == 4
+        assert str(tmp_path / "binary.tf") not in analyzer.parsed_configs
+        assert len(analyzer.parsed_configs) == 3
+
+    def test_init_parses_large_repository_in_processes(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that process-pool parsing keeps file order and skips bad files."""
+        monkeypatch.setattr("terrafix.terraform_analyzer.PARSE_WORKERS", 2)
+        for i in range(PARALLEL_PARSE_MIN_FILES):
+            _ = (tmp_path / f"vars{i:02d}.tf").write_text(f'variable "v{i}" {{}}\n')
+        _ = (tmp_path / "invalid.tf").write_text('variable "broken" {\n')
+        _ = (tmp_path / "binary.tf").write_bytes(b"\xff\xfe\x00")
+
+        analyzer = TerraformAnalyzer(str(tmp_path))
+
+        assert len(analyzer.parsed_configs) == PARALLEL_PARSE_MIN_FILES
+        for i in range(PARALLEL_PARSE_MIN_FILES):
+            config = analyzer.parsed_configs[str(tmp_path / f"vars{i:02d}.tf")]
+            assert f'"v{i}"' in config["content"]
+            assert config["parsed"]["variable"]
+
     def test_init_empty_directory(
         self,
         tmp_path: Path,
@@ -431,6 +466,49 @@ class TestGetFileContent:
         assert "was not successfully parsed" in str(exc_info.value)
 
 
+class TestRebased:
+    """Tests for TerraformAnalyzer.rebased method."""
+
+    def test_rebased_rewrites_paths_without_reparsing(
+        self,
+        sample_terraform_repo: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test that a rebased analyzer points at the new checkout."""
+        analyzer = TerraformAnalyzer(str(sample_terraform_repo))
+        other = tmp_path / "other"
+
+        rebased = analyzer.rebased(str(other))
+
+        assert rebased.repo_path == other
+        assert all(f.is_relative_to(other) for f in rebased.terraform_files)
+        assert len(rebased.parsed_configs) == len(analyzer.parsed_configs)
+        for path, config in rebased.parsed_configs.items():
+            original = sample_terraform_repo / Path(path).relative_to(other)
+            assert config is analyzer.parsed_configs[str(original)]
+
+        # The original analyzer is unchanged
+        assert analyzer.repo_path == sample_terraform_repo
+
+    def test_rebased_remaps_resource_index(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that indexed resources point into the new checkout."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _ = (repo / "s3.tf").write_text('resource "aws_s3_bucket" "b" {\n  bucket = "b"\n}\n')
+        analyzer = TerraformAnalyzer(str(repo))
+        other = tmp_path / "other"
+
+        rebased = analyzer.rebased(str(other))
+
+        entries = list(rebased._name_index.values())  # pyright: ignore[reportPrivateUsage]
+        assert entries
+        assert all(entry[1] == str(other / "s3.tf") for entry in entries)
+        assert analyzer.rebased(str(repo)) is analyzer
+
+
 class TestLargeRepository:
     """Tests for TerraformAnalyzer with larger repositories."""
 
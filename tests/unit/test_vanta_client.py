@@ -89,6 +89,63 @@ class TestFailureModel:
         assert sample_failure.resource_arn in str_repr
         assert sample_failure.severity in str_repr
 
+    def test_commit_message_conventional_format(self, sample_failure: Failure) -> None:
+        """Test that commit message follows conventional commits."""
+        message = sample_failure.commit_message
+
+        assert message.startswith("fix(compliance):")
+        assert sample_failure.test_name in message
+        assert sample_failure.framework in message
+        assert sample_failure.severity in message
+
+    def test_pr_title_contains_severity_emoji(self) -> None:
+        """Test that PR title includes severity emoji."""
+        titles: dict[str, str] = {}
+        for severity in ("high", "medium", "low", "unknown"):
+            failure = Failure(
+                test_id=f"test-{severity}",
+                test_name=f"Test {severity}",
+                resource_arn="arn:aws:s3:::bucket",
+                resource_type="AWS::S3::Bucket",
+                failure_reason="Test",
+                severity=severity,
+                framework="SOC2",
+                failed_at="2025-01-15T10:00:00Z",
+            )
+            titles[severity] = failure.pr_title
+
+        assert "🔴" in titles["high"]
+        assert "🟡" in titles["medium"]
+        assert "🟢" in titles["low"]
+        assert "⚪" in titles["unknown"]
+        assert "[TerraFix] Test high" in titles["high"]
+
+    def test_message_properties_excluded_from_serialization(
+        self,
+        sample_failure: Failure,
+    ) -> None:
+        """Test that the message properties are not dumped as fields."""
+        _ = sample_failure.commit_message
+        _ = sample_failure.pr_title
+
+        dumped = sample_failure.model_dump()
+
+        assert "commit_message" not in dumped
+        assert "pr_title" not in dumped
+
+    def test_messages_follow_field_updates(self, sample_failure: Failure) -> None:
+        """Test that the messages reflect fields changed after first access."""
+        _ = sample_failure.commit_message
+        _ = sample_failure.pr_title
+
+        copied = sample_failure.model_copy(update={"test_name": "Renamed test", "severity": "low"})
+        sample_failure.test_name = "Assigned test"
+
+        assert copied.commit_message.startswith("fix(compliance): Renamed test")
+        assert copied.pr_title == "🟢 [TerraFix] Renamed test"
+        assert sample_failure.commit_message.startswith("fix(compliance): Assigned test")
+        assert sample_failure.pr_title.endswith("[TerraFix] Assigned test")
+
 
 class TestVantaClientInit:
     """Tests for VantaClient initialization."""